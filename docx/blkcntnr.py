@@ -8,8 +8,15 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tbl
-from docx.shared import Parented
+from docx.oxml.text.paragraph import (
+    compile_substitution,
+    iter_paragraph_text,
+    normalize_paragraph_runs,
+    replace_paragraph_text,
+)
+from docx.shared import Parented, ProxyList
 from docx.text.paragraph import Paragraph
 
 
@@ -21,6 +28,8 @@ class BlockItemContainer(Parented):
     a paragraph or table.
     """
 
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -50,22 +59,170 @@ class BlockItemContainer(Parented):
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def add_table_from_rows(self, rows, width, style=None, header=True):
+        """
+        Return a table of *width* newly appended to the content in this
+        container and populated from *rows*, an iterable of rows each an
+        iterable of cell values, as accepted by :meth:`.Table.fill`. The
+        table has a row for each item in *rows* and as many columns as the
+        longest row, shorter rows being padded with empty cells. *width* is
+        evenly distributed between the columns. When *header* is |True|, the
+        first row is marked as a header row, repeated at the top of each
+        page the table spans. The table XML is built in a single pass, which
+        is much faster than setting the text of each cell in turn.
+        """
+        from .table import Table, _text_rows
+        text_rows, col_count = _text_rows(rows)
+        tbl = CT_Tbl.new_tbl_from_rows(text_rows, col_count, width, header)
+        self._element._insert_tbl(tbl)
+        table = Table(tbl, self)
+        if style is not None:
+            table.style = style
+        return table
+
+    def insert_table_copy(self, table, rows=None):
+        """
+        Return a |Table| object for a copy of *table*, newly appended to the
+        content in this container. *table* is a table in the same document,
+        often a pre-formatted template; see :meth:`.Table.clone`, which
+        copies it and adjusts the copy to *rows* rows when not |None|.
+        """
+        from .table import Table
+        tbl = table._tbl.copy(rows)
+        self._element._insert_tbl(tbl)
+        return Table(tbl, self)
+
+    def iter_inner_content(self, recursive=False):
+        """
+        Generate each |Paragraph| and |Table| in this container, in document
+        order. Items are produced lazily in a single pass over the child
+        elements, so no intermediate list is built. When *recursive* is
+        |True|, each table is followed by the content of its cells, taken
+        left to right and top to bottom, including any tables nested in
+        those cells. A merged cell is visited once.
+        """
+        from .table import Table
+        tbl_tag = qn('w:tbl')
+        for child in self._element.iterchildren(qn('w:p'), tbl_tag):
+            if child.tag != tbl_tag:
+                yield self._get_proxy(child, Paragraph)
+                continue
+            table = self._get_proxy(child, Table)
+            yield table
+            if not recursive:
+                continue
+            for cell in table._iter_unique_cells():
+                for block_item in cell.iter_inner_content(recursive=True):
+                    yield block_item
+
+    def iter_nested_content(self):
+        """
+        Generate a ``(depth, path, block)`` tuple for each |Paragraph| and
+        |Table| in this container and, depth-first, in the cells of each of
+        its tables, to any level of nesting. *depth* is the number of tables
+        enclosing *block* within this container, 0 for its own content.
+        *path* is a tuple of integers locating *block*; the index of
+        a top-level block among the paragraphs and tables of this container,
+        like ``(2,)``, or for a block in a cell, the path of the table
+        extended by the row index and grid column of the cell and the index
+        of the block in it, like ``(2, 0, 1, 0)``. A merged cell is visited
+        once, at its top-left grid position.
+
+        Nested content is walked with an explicit stack holding one
+        generator per enclosing table, rather than by recursion, so memory
+        use is bounded by the depth of nesting and each item is yielded
+        directly rather than through a generator per level. The cell grid of
+        no table is built.
+        """
+        from .table import _Cell, Table
+        p_tag, tbl_tag = qn('w:p'), qn('w:tbl')
+
+        def iter_blocks(container, path):
+            children = container._element.iterchildren(p_tag, tbl_tag)
+            for idx, child in enumerate(children):
+                yield path + (idx,), container, child
+
+        def iter_cell_blocks(table, path):
+            for row_idx, grid_col, tc in table._tbl.iter_cell_tcs():
+                cell = table._get_proxy(tc, _Cell)
+                for item in iter_blocks(cell, path + (row_idx, grid_col)):
+                    yield item
+
+        stack = [iter_blocks(self, ())]
+        while stack:
+            for path, container, child in stack[-1]:
+                depth = len(stack) - 1
+                if child.tag != tbl_tag:
+                    yield depth, path, container._get_proxy(child, Paragraph)
+                    continue
+                table = container._get_proxy(child, Table)
+                yield depth, path, table
+                stack.append(iter_cell_blocks(table, path))
+                break
+            else:
+                stack.pop()
+
+    def iter_text(self, include_tables=True):
+        """
+        Generate the text of each paragraph in this container, in document
+        order, as |Paragraph.text| would produce it. When *include_tables*
+        is |True|, the text of each paragraph in a table cell, including
+        cells of nested tables, is generated in its document position.
+        Paragraphs in block-level content controls are included either way;
+        those in text boxes are not. No |Paragraph| or |Run|
+        objects are created, making this the fastest way to extract the text
+        of a large document.
+        """
+        return iter_paragraph_text(self._element, include_tables)
+
+    def normalize_runs(self, include_tables=True):
+        """
+        Merge the runs of each paragraph in this container where formatting
+        allows, as |Paragraph.normalize_runs| does, and, when
+        *include_tables* is |True|, of each paragraph in a table cell,
+        including cells of nested tables. Paragraphs in block-level content
+        controls are included either way; those in text boxes are not. No
+        |Paragraph| or |Run| objects are created. Returns the total number
+        of elements removed.
+        """
+        return normalize_paragraph_runs(self._element, include_tables)
+
+    def replace(self, pattern, repl=None, regex=False, include_tables=True):
+        """
+        Replace each occurrence of *pattern* with *repl* in each paragraph in
+        this container, as |Paragraph.replace| does, and, when
+        *include_tables* is |True|, in each paragraph in a table cell,
+        including cells of nested tables. A mapping of patterns to
+        replacements can be passed as *pattern* to replace them all in
+        a single pass. Paragraphs in block-level content controls are
+        included either way; those in text boxes are not. No |Paragraph| or
+        |Run| objects are created, and only paragraphs containing a match
+        are changed. Returns the total number of replacements.
+        """
+        regex, repl = compile_substitution(pattern, repl, regex)
+        return replace_paragraph_text(
+            self._element, regex, repl, include_tables
+        )
+
     @property
     def paragraphs(self):
         """
-        A list containing the paragraphs in this container, in document
-        order. Read-only.
+        A sequence containing the paragraphs in this container, in document
+        order. Supports ``len()``, iteration, indexed access and slicing.
+        Proxies are only created for the paragraphs actually accessed, so
+        ``paragraphs[-1]`` is cheap even in a long document. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return ProxyList(self._element, 'w:p', Paragraph, self)
 
     @property
     def tables(self):
         """
-        A list containing the tables in this container, in document order.
+        A sequence containing the tables in this container, in document
+        order. Supports ``len()``, iteration, indexed access and slicing.
         Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return ProxyList(self._element, 'w:tbl', Table, self)
 
     def _add_paragraph(self):
         """
@@ -24,6 +24,7 @@ if sys.version_info >= (3, 0):
         """
         return isinstance(obj, str)
 
+    imap = map
     Unicode = str
 
 # ===========================================================================
@@ -32,6 +33,7 @@ if sys.version_info >= (3, 0):
 
 else:
 
+    from itertools import imap  # noqa
     from StringIO import StringIO as BytesIO  # noqa
 
     def is_string(obj):
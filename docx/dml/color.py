@@ -83,7 +83,7 @@ class ColorFormat(ElementProxy):
     def theme_color(self, value):
         if value is None:
             if self._color is not None:
-                self._element.rPr._remove_color()
+                self._element.get_or_add_rPr()._remove_color()
             return
         self._element.get_or_add_rPr().get_or_add_color().themeColor = value
 
@@ -93,6 +93,21 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=True):
+        """
+        Add a table populated from *rows*, an iterable of rows each an
+        iterable of cell values, having table style of *style*. *rows* can
+        be a list of lists, a generator, or a 2-D array-like object having
+        a ``tolist()`` method. The first row is marked as a header row when
+        *header* is |True|. See
+        :meth:`.BlockItemContainer.add_table_from_rows`.
+        """
+        table = self._body.add_table_from_rows(
+            rows, self._block_width, header=header
+        )
+        table.style = style
+        return table
+
     @property
     def core_properties(self):
         """
@@ -111,10 +126,73 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def insert_table_copy(self, table, rows=None):
+        """
+        Return a copy of *table*, newly appended to the document body and
+        having *rows* rows when not |None|. See
+        :meth:`.BlockItemContainer.insert_table_copy`.
+        """
+        return self._body.insert_table_copy(table, rows)
+
+    def iter_inner_content(self, recursive=False):
+        """
+        Generate each |Paragraph| and |Table| in the document body, in
+        document order. When *recursive* is |True|, the content of each
+        table cell follows its table. See
+        :meth:`.BlockItemContainer.iter_inner_content`.
+        """
+        return self._body.iter_inner_content(recursive)
+
+    def iter_nested_content(self):
+        """
+        Generate a ``(depth, path, block)`` tuple for each |Paragraph| and
+        |Table| in the document body and, depth-first, in the cells of its
+        tables, including tables nested in them. See
+        :meth:`.BlockItemContainer.iter_nested_content`.
+        """
+        return self._body.iter_nested_content()
+
+    def iter_text(self, include_tables=True, include_headers_footers=False):
+        """
+        Generate the text of each paragraph in the document body, in
+        document order, as |Paragraph.text| would produce it. Paragraphs in
+        table cells are included in their document position unless
+        *include_tables* is |False|. When *include_headers_footers* is
+        |True|, the text of each header and footer defined in the document
+        follows that of the body, section by section; a header or footer
+        linked to that of a prior section is not repeated. No proxy objects
+        are created for the paragraphs and runs visited.
+        """
+        for text in self._body.iter_text(include_tables):
+            yield text
+        if not include_headers_footers:
+            return
+        for hdrftr in self._iter_hdrftrs():
+            for text in hdrftr.iter_text(include_tables):
+                yield text
+
+    def normalize_runs(self, include_tables=True,
+                       include_headers_footers=False):
+        """
+        Merge the runs of each paragraph in the document body where
+        formatting allows, as |Paragraph.normalize_runs| does, including
+        paragraphs in table cells unless *include_tables* is |False|. When
+        *include_headers_footers* is |True|, the paragraphs of each header
+        and footer defined in the document are normalized too. No
+        |Paragraph| or |Run| objects are created. Returns the total number
+        of XML elements removed, a measure of how much smaller the document
+        became.
+        """
+        removed = self._body.normalize_runs(include_tables)
+        if include_headers_footers:
+            for hdrftr in self._iter_hdrftrs():
+                removed += hdrftr.normalize_runs(include_tables)
+        return removed
+
     @property
     def paragraphs(self):
         """
-        A list of |Paragraph| instances corresponding to the paragraphs in
+        A sequence of |Paragraph| instances corresponding to the paragraphs in
         the document, in document order. Note that paragraphs within revision
         marks such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
         """
@@ -127,12 +205,41 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, normalize_namespaces=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
+
+        When *normalize_namespaces* is |True|, namespace declarations in each
+        XML part are moved to the part's root element and redundant or unused
+        declarations are removed before the XML is serialized. This is
+        worthwhile for large generated documents and those assembled from
+        content copied between documents, where repeated declarations on
+        inner elements bloat the XML and slow down saving and reloading.
+        """
+        self._part.save(path_or_stream, normalize_namespaces)
+
+    def replace(self, pattern, repl=None, regex=False, include_tables=True,
+                include_headers_footers=False):
         """
-        self._part.save(path_or_stream)
+        Replace each occurrence of *pattern* with *repl* in each paragraph in
+        the document body, as |Paragraph.replace| does, including paragraphs
+        in table cells unless *include_tables* is |False|. Occurrences
+        spanning runs are found and run formatting is kept. Pass a mapping of
+        patterns to replacements as *pattern*, omitting *repl*, to replace
+        them all in a single pass over the document, e.g.
+        ``document.replace({'{{name}}': name, '{{city}}': city})``. When
+        *include_headers_footers* is |True|, each header and footer defined
+        in the document is searched too. Returns the total number of
+        replacements.
+        """
+        replaced = self._body.replace(pattern, repl, regex, include_tables)
+        if include_headers_footers:
+            for hdrftr in self._iter_hdrftrs():
+                replaced += hdrftr.replace(
+                    pattern, repl, regex, include_tables
+                )
+        return replaced
 
     @property
     def sections(self):
@@ -157,7 +264,7 @@ class Document(ElementProxy):
     @property
     def tables(self):
         """
-        A list of |Table| instances corresponding to the tables in the
+        A sequence of |Table| instances corresponding to the tables in the
         document, in document order. Note that only tables appearing at the
         top level of the document appear in this list; a table nested inside
         a table cell does not appear. A table within revision marks such as
@@ -165,6 +272,16 @@ class Document(ElementProxy):
         """
         return self._body.tables
 
+    @property
+    def text(self):
+        """
+        The text of the document body, including the text in tables, as
+        a single string with a ``\\n`` separating each paragraph. This is
+        much faster than joining the text of each paragraph in
+        :attr:`paragraphs`. Read-only.
+        """
+        return '\n'.join(self.iter_text())
+
     @property
     def _block_width(self):
         """
@@ -176,6 +293,13 @@ class Document(ElementProxy):
             section.page_width - section.left_margin - section.right_margin
         )
 
+    @property
+    def _proxy_cache(self):
+        """
+        The |ProxyCache| of the document part, or |None| if not enabled.
+        """
+        return self._part._proxy_cache
+
     @property
     def _body(self):
         """
@@ -185,12 +309,36 @@ class Document(ElementProxy):
             self.__body = _Body(self._element.body, self)
         return self.__body
 
+    def _iter_hdrftrs(self):
+        """
+        Generate each header and footer defined in this document, section by
+        section, skipping those linked to a prior section and any whose part
+        was already generated.
+        """
+        seen_parts = set()
+        for section in self.sections:
+            for hdrftr in (
+                section.header, section.even_page_header,
+                section.first_page_header, section.footer,
+                section.even_page_footer, section.first_page_footer,
+            ):
+                if hdrftr.is_linked_to_previous:
+                    continue
+                part = hdrftr.part
+                if part in seen_parts:
+                    continue
+                seen_parts.add(part)
+                yield hdrftr
+
 
 class _Body(BlockItemContainer):
     """
     Proxy for ``<w:body>`` element in this document, having primarily a
     container role.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(_Body, self).__init__(body_elm, parent)
         self._body = body_elm
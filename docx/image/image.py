@@ -12,6 +12,7 @@ import os
 
 from ..compat import BytesIO, is_string
 from .exceptions import UnrecognizedImageError
+from ..instrument import instrumented
 from ..shared import Emu, Inches, lazyproperty
 
 
@@ -168,6 +169,7 @@ class Image(object):
         return hashlib.sha1(self._blob).hexdigest()
 
     @classmethod
+    @instrumented('Image._from_stream')
     def _from_stream(cls, stream, blob, filename=None):
         """
         Return an instance of the |Image| subclass corresponding to the
@@ -0,0 +1,119 @@
+# encoding: utf-8
+
+"""Opt-in timing instrumentation of python-docx hot paths.
+
+Instrumentation is off by default. Calling :func:`enable` with a callback
+causes each instrumented operation to report its elapsed wall-clock time as
+an event::
+
+    from docx import instrument
+
+    recorder = instrument.Recorder()
+    instrument.enable(recorder)
+    document = Document('big.docx')
+    document.save('big-copy.docx')
+    instrument.disable()
+
+    for event, (count, seconds) in sorted(recorder.stats.items()):
+        print('%-28s %6d %8.3fs' % (event, count, seconds))
+
+The instrumented operations are opening the package zip
+(``PackageReader.from_file``), unmarshalling its parts
+(``Unmarshaller.unmarshal``), parsing and serializing XML parts
+(``XmlPart.load``, ``XmlPart.blob``), writing the package zip
+(``PackageWriter.write``), style lookups (``Styles.get_by_id``,
+``Styles.get_style_id``) and image header parsing
+(``Image._from_stream``). Times are inclusive; the time of an operation
+includes that of any instrumented operation it calls.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import functools
+
+from timeit import default_timer
+
+_callback = None
+
+
+def disable():
+    """Stop reporting instrumentation events."""
+    global _callback
+    _callback = None
+
+
+def enable(callback):
+    """Report instrumentation events to *callback* until :func:`disable` is called.
+
+    *callback* is called as ``callback(event, seconds)`` after each instrumented
+    operation completes, whether or not it raised, where *event* is the name of
+    the operation, like ``'XmlPart.load'``, and *seconds* is the elapsed time as
+    a float. An exception raised by *callback* while the operation itself is
+    raising is ignored, so it cannot hide the original exception. Only one
+    callback is active at a time; a subsequent call replaces it.
+    """
+    global _callback
+    _callback = callback
+
+
+def instrumented(event):
+    """Decorator reporting calls of the decorated function as *event*.
+
+    When instrumentation is disabled the only added cost is a function call and
+    a global lookup. When stacked with `staticmethod`, `classmethod` or
+    `property`, this decorator must be applied first, i.e. appear below them.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            callback = _callback
+            if callback is None:
+                return f(*args, **kwargs)
+            start = default_timer()
+            completed = False
+            try:
+                result = f(*args, **kwargs)
+                completed = True
+            finally:
+                if not completed:
+                    _report_quietly(callback, event, default_timer() - start)
+            callback(event, default_timer() - start)
+            return result
+        return wrapper
+    return decorator
+
+
+def is_enabled():
+    """True if an instrumentation callback is currently enabled."""
+    return _callback is not None
+
+
+def _report_quietly(callback, event, seconds):
+    """Call *callback* for an operation that raised, ignoring any exception."""
+    try:
+        callback(event, seconds)
+    except Exception:
+        pass
+
+
+class Recorder(object):
+    """Instrumentation callback accumulating a call count and total time per event.
+
+    An instance is passed to :func:`enable`. :attr:`stats` maps each event name
+    to a ``[count, seconds]`` pair.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def __call__(self, event, seconds):
+        stat = self.stats.get(event)
+        if stat is None:
+            self.stats[event] = [1, seconds]
+            return
+        stat[0] += 1
+        stat[1] += seconds
+
+    def clear(self):
+        """Discard all recorded events."""
+        self.stats.clear()
@@ -4,6 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.instrument import instrumented
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import PartFactory
@@ -162,12 +163,16 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, normalize_namespaces=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *normalize_namespaces*
+        is |True|, the namespace declarations in each XML part are hoisted to
+        its root element and redundant ones removed before serialization.
         """
         for part in self.parts:
+            if normalize_namespaces:
+                part.normalize_namespaces()
             part.before_marshal()
         PackageWriter.write(pkg_file, self.rels, self.parts)
 
@@ -189,6 +194,7 @@ class Unmarshaller(object):
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
 
     @staticmethod
+    @instrumented('Unmarshaller.unmarshal')
     def unmarshal(pkg_reader, package, part_factory):
         """
         Construct graph of parts and realized relationships based on the
@@ -8,9 +8,10 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from ..instrument import instrumented
 from .compat import cls_method_fn
 from .oxml import serialize_part_xml
-from ..oxml import parse_xml
+from ..oxml import normalize_namespaces, parse_xml
 from .packuri import PackURI
 from .rel import Relationships
 from .shared import lazyproperty
@@ -58,6 +59,16 @@ class Part(object):
         """
         return self._blob
 
+    def normalize_namespaces(self):
+        """
+        Entry point for the optional namespace-declaration cleanup performed
+        before saving. Only meaningful for XML parts; may be overridden by
+        subclasses without forwarding call to super.
+        """
+        # don't place any code here, just catch call if not overridden by
+        # subclass
+        pass
+
     @property
     def content_type(self):
         """
@@ -216,6 +227,7 @@ class XmlPart(Part):
         self._element = element
 
     @property
+    @instrumented('XmlPart.blob')
     def blob(self):
         return serialize_part_xml(self._element)
 
@@ -227,10 +239,21 @@ class XmlPart(Part):
         return self._element
 
     @classmethod
+    @instrumented('XmlPart.load')
     def load(cls, partname, content_type, blob, package):
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
+    def normalize_namespaces(self):
+        """
+        Move the namespace declarations in this part's XML to its root
+        element and drop redundant and unused ones. This shrinks the
+        serialized XML when many elements were created with their own
+        declarations, as happens with ``OxmlElement()`` and content copied
+        from other documents.
+        """
+        normalize_namespaces(self._element)
+
     @property
     def part(self):
         """
@@ -7,6 +7,7 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from ..instrument import instrumented
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -25,6 +26,7 @@ class PackageReader(object):
         self._sparts = sparts
 
     @staticmethod
+    @instrumented('PackageReader.from_file')
     def from_file(pkg_file):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
@@ -7,6 +7,7 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from ..instrument import instrumented
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -23,6 +24,7 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
+    @instrumented('PackageWriter.write')
     def write(pkg_file, pkg_rels, parts):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
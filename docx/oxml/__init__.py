@@ -29,6 +29,34 @@ def parse_xml(xml):
     return root_element
 
 
+def normalize_namespaces(element):
+    """
+    Hoist the namespace declarations used in the tree rooted at *element* to
+    *element* itself and remove those that are redundant or unused.
+
+    Declarations for the well-known prefixes in ``nsmap`` are placed on
+    *element* (unless it already maps that prefix or namespace differently),
+    so subtrees created with ``OxmlElement()`` or grafted from another
+    document no longer carry their own copies. Declarations already present
+    on *element* are always kept because attributes such as
+    ``mc:Ignorable`` refer to them by prefix.
+    """
+    root_nsmap = element.nsmap
+    root_uris = set(root_nsmap.values())
+    top_nsmap = dict(
+        (pfx, uri) for pfx, uri in nsmap.items()
+        if pfx != 'xml' and (
+            root_nsmap.get(pfx) == uri or
+            (pfx not in root_nsmap and uri not in root_uris)
+        )
+    )
+    keep_ns_prefixes = [pfx for pfx in root_nsmap if pfx is not None]
+    etree.cleanup_namespaces(
+        element, top_nsmap=top_nsmap, keep_ns_prefixes=keep_ns_prefixes
+    )
+    return element
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
@@ -5,6 +5,7 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
+from .ns import qn
 from .xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
 
 
@@ -14,6 +15,22 @@ class CT_Document(BaseOxmlElement):
     """
     body = ZeroOrOne('w:body')
 
+    @property
+    def last_sectPr(self):
+        """
+        The last ``<w:sectPr>`` element in the document, or |None| if there
+        is none. This is normally the sentinel ``<w:sectPr>`` that ends the
+        body, which is then found without searching the whole document.
+        """
+        body = self.body
+        if body is not None:
+            for child in body.iterchildren(reversed=True):
+                if child.tag == qn('w:sectPr'):
+                    return child
+                break
+        sectPr_lst = self.sectPr_lst
+        return sectPr_lst[-1] if sectPr_lst else None
+
     @property
     def sectPr_lst(self):
         """
@@ -4,13 +4,42 @@
 Custom element classes related to the styles part
 """
 
+from copy import deepcopy
+
+from lxml import etree
+
+from . import OxmlElement
 from ..enum.style import WD_STYLE_TYPE
+from ..enum.text import WD_TAB_ALIGNMENT
+from .ns import qn
 from .simpletypes import ST_DecimalNumber, ST_OnOff, ST_String
 from .xmlchemy import (
     BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore,
     ZeroOrOne
 )
 
+_FIRST_LINE = qn('w:firstLine')
+_HANGING = qn('w:hanging')
+_IND = qn('w:ind')
+_MERGED_ATTR_TAGS = frozenset(
+    qn(tag) for tag in ('w:ind', 'w:lang', 'w:rFonts', 'w:spacing')
+)
+_P = qn('w:p')
+_TAB = qn('w:tab')
+_TABS = qn('w:tabs')
+_TOGGLE_PR_TAGS = frozenset(
+    qn(tag) for tag in (
+        'w:b', 'w:bCs', 'w:caps', 'w:dstrike', 'w:emboss', 'w:i', 'w:iCs',
+        'w:imprint', 'w:outline', 'w:shadow', 'w:smallCaps', 'w:strike',
+        'w:vanish'
+    )
+)
+_UNRESOLVED_PR_TAGS = frozenset(
+    qn(tag) for tag in (
+        'w:pStyle', 'w:rStyle', 'w:pPrChange', 'w:rPrChange', 'w:sectPr'
+    )
+)
+
 
 def styleId_from_name(name):
     """
@@ -145,6 +174,7 @@ class CT_Style(BaseOxmlElement):
 
     @basedOn_val.setter
     def basedOn_val(self, value):
+        self.bump_styles_version()
         if value is None:
             self._remove_basedOn()
         else:
@@ -165,12 +195,46 @@ class CT_Style(BaseOxmlElement):
             return None
         return base_style
 
+    def bump_styles_version(self):
+        """
+        Call :meth:`CT_Styles.bump_styles_version` on the parent `w:styles`
+        element of this style, if it has one.
+        """
+        styles = self.getparent()
+        if isinstance(styles, CT_Styles):
+            styles.bump_styles_version()
+
     def delete(self):
         """
         Remove this `w:style` element from its parent `w:styles` element.
         """
+        self.bump_styles_version()
         self.getparent().remove(self)
 
+    def get_or_add_pPr(self):
+        """
+        Return the `w:pPr` child of this style, newly added if not present.
+        The properties of this style are about to change, so the properties
+        resolved by the parent `w:styles` element are discarded.
+        """
+        self.bump_styles_version()
+        pPr = self.pPr
+        if pPr is None:
+            pPr = self._add_pPr()
+        return pPr
+
+    def get_or_add_rPr(self):
+        """
+        Return the `w:rPr` child of this style, newly added if not present.
+        The properties of this style are about to change, so the properties
+        resolved by the parent `w:styles` element are discarded.
+        """
+        self.bump_styles_version()
+        rPr = self.rPr
+        if rPr is None:
+            rPr = self._add_rPr()
+        return rPr
+
     @property
     def locked_val(self):
         """
@@ -302,6 +366,7 @@ class CT_Styles(BaseOxmlElement):
         *style_type*. `w:style/@customStyle` is set based on the value of
         *builtin*.
         """
+        self.bump_styles_version()
         style = self.add_style()
         style.type = style_type
         style.customStyle = None if builtin else True
@@ -309,6 +374,16 @@ class CT_Styles(BaseOxmlElement):
         style.name_val = name
         return style
 
+    def bump_styles_version(self):
+        """
+        Mark the style definitions in this element as changed, discarding
+        the properties memoized by :meth:`resolved_pPr` and
+        :meth:`resolved_rPr`. Style changes made through the property
+        methods of `w:style` call this automatically; call it after changing
+        the styles XML by other means.
+        """
+        self._styles_version = self.styles_version + 1
+
     def default_for(self, style_type):
         """
         Return `w:style[@w:type="*{style_type}*][-1]` or |None| if not found.
@@ -344,8 +419,235 @@ class CT_Styles(BaseOxmlElement):
         except IndexError:
             return None
 
+    def new_effective_p(self, p):
+        """
+        Return a new, detached `w:p` element whose `w:pPr` child holds the
+        effective paragraph properties of *p*; its own `w:pPr` applied over
+        the :meth:`resolved_pPr` properties of its paragraph style.
+        """
+        return self._new_effective_owner(
+            'w:p', self.resolved_pPr(p.style), p.pPr
+        )
+
+    def new_effective_r(self, r):
+        """
+        Return a new, detached `w:r` element whose `w:rPr` child holds the
+        effective run properties of *r*; its own `w:rPr` applied over the
+        :meth:`resolved_rPr` properties of its character style and the
+        paragraph style of the paragraph containing it.
+        """
+        p = r.getparent()
+        while p is not None and p.tag != _P:
+            p = p.getparent()
+        pStyle_id = None if p is None else p.style
+        return self._new_effective_owner(
+            'w:r', self.resolved_rPr(pStyle_id, r.style), r.rPr
+        )
+
+    def resolved_pPr(self, pStyle_id):
+        """
+        Return a `w:pPr` element holding the paragraph properties of the
+        paragraph style having *pStyle_id*, as inherited through its
+        `w:basedOn` chain from the `w:docDefaults` properties. The default
+        paragraph style is used when *pStyle_id* is |None| or matches no
+        paragraph style. The element is memoized by style id until
+        :meth:`bump_styles_version` is next called, so it is shared and must
+        not be changed.
+        """
+        cache = self._resolved_pr_cache
+        key = ('w:pPr', pStyle_id)
+        pPr = cache.get(key)
+        if pPr is None:
+            prs = [self._doc_default_pr('w:pPrDefault/w:pPr')]
+            prs.extend(
+                style.pPr for style in
+                self._style_chain(pStyle_id, WD_STYLE_TYPE.PARAGRAPH)
+            )
+            pPr = cache[key] = _merged_pr('w:pPr', prs)
+        return pPr
+
+    def resolved_rPr(self, pStyle_id, rStyle_id):
+        """
+        Return a `w:rPr` element holding the run properties of the character
+        style having *rStyle_id* in a paragraph of the paragraph style having
+        *pStyle_id*. These are the `w:docDefaults` properties overridden by
+        those of the `w:basedOn` chain of the paragraph style and then by
+        those of the `w:basedOn` chain of the character style. Toggle
+        properties like `w:b` and `w:i` set by both styles are combined
+        rather than overridden, as Word does: the property is on when it is
+        on in exactly one of the two styles. The default style of each type
+        is used when its style id is |None| or matches no style of that
+        type. The element is memoized by style ids until
+        :meth:`bump_styles_version` is next called, so it is shared and must
+        not be changed.
+        """
+        cache = self._resolved_pr_cache
+        key = ('w:rPr', pStyle_id, rStyle_id)
+        rPr = cache.get(key)
+        if rPr is None:
+            pStyle_rPr = _merged_pr('w:rPr', (
+                style.rPr for style in
+                self._style_chain(pStyle_id, WD_STYLE_TYPE.PARAGRAPH)
+            ))
+            rStyle_rPr = _merged_pr('w:rPr', (
+                style.rPr for style in
+                self._style_chain(rStyle_id, WD_STYLE_TYPE.CHARACTER)
+            ))
+            rPr = cache[key] = _merged_pr('w:rPr', (
+                self._doc_default_pr('w:rPrDefault/w:rPr'), pStyle_rPr,
+                rStyle_rPr
+            ))
+            _combine_toggles(rPr, pStyle_rPr, rStyle_rPr)
+        return rPr
+
+    @property
+    def styles_version(self):
+        """
+        Number of times :meth:`bump_styles_version` has been called on this
+        element, 0 if never.
+        """
+        return getattr(self, '_styles_version', 0)
+
+    def _doc_default_pr(self, path):
+        """
+        Return the properties element at *path* below `w:docDefaults`, like
+        `w:rPrDefault/w:rPr`, or |None| if not present.
+        """
+        prs = self.xpath('w:docDefaults/%s' % path)
+        return prs[0] if prs else None
+
     def _iter_styles(self):
         """
         Generate each of the `w:style` child elements in document order.
         """
         return (style for style in self.xpath('w:style'))
+
+    def _new_effective_owner(self, tagname, resolved_pr, pr):
+        """
+        Return a new element having *tagname* whose only child is a copy of
+        *resolved_pr* with the properties of *pr* merged into it, if *pr* is
+        not |None|.
+        """
+        effective_pr = deepcopy(resolved_pr)
+        if pr is not None:
+            _merge_pr(effective_pr, pr)
+        owner = OxmlElement(tagname)
+        owner.append(effective_pr)
+        return owner
+
+    @property
+    def _resolved_pr_cache(self):
+        """
+        Dict of the properties elements memoized by :meth:`resolved_pPr` and
+        :meth:`resolved_rPr`, emptied whenever :attr:`styles_version`
+        changes.
+        """
+        version = self.styles_version
+        cache = getattr(self, '_resolved_prs', None)
+        if cache is None or cache[0] != version:
+            cache = self._resolved_prs = (version, {})
+        return cache[1]
+
+    def _style_chain(self, styleId, style_type):
+        """
+        Return the list of `w:style` elements a style of *style_type* having
+        *styleId* inherits its properties from, most basic first and ending
+        with that style. The default style for *style_type* takes its place
+        when *styleId* is |None| or matches no style of *style_type*. Empty
+        when there is no such style. A `w:basedOn` cycle ends the chain.
+        """
+        style = None if styleId is None else self.get_by_id(styleId)
+        if style is None or style.type != style_type:
+            style = self.default_for(style_type)
+        chain = []
+        while style is not None and style not in chain:
+            chain.append(style)
+            style = style.base_style
+        chain.reverse()
+        return chain
+
+
+def _combine_toggles(rPr, pStyle_rPr, rStyle_rPr):
+    """
+    Set each toggle property of `w:rPr` element *rPr*, like `w:b`, that both
+    *pStyle_rPr* and *rStyle_rPr* have to the exclusive or of their values,
+    the way a character style toggles the properties of a paragraph style
+    (ECMA-376 §17.7.3). *rPr* is expected to hold the properties of
+    *rStyle_rPr* merged over those of *pStyle_rPr*.
+    """
+    for rStyle_prop in rStyle_rPr.iterchildren(etree.Element):
+        tag = rStyle_prop.tag
+        if tag not in _TOGGLE_PR_TAGS:
+            continue
+        pStyle_prop = pStyle_rPr.find(tag)
+        if pStyle_prop is None:
+            continue
+        rPr.find(tag).val = pStyle_prop.val != rStyle_prop.val
+
+
+def _merge_pr(pr, override):
+    """
+    Merge the properties in properties element *override*, like `w:rPr`,
+    into *pr*. A property of *override* replaces the property of *pr* having
+    the same tag, except that the attributes of `w:ind`, `w:lang`,
+    `w:rFonts` and `w:spacing` are merged one by one, so
+    a `w:spacing/@w:before` inherited from a base style survives a derived
+    style setting only `w:spacing/@w:after`, and the tab stops of `w:tabs`
+    are merged by position as :func:`_merge_tabs` does. Style references
+    and revision marks are not carried over.
+    """
+    props = dict((prop.tag, prop) for prop in pr.iterchildren(etree.Element))
+    for child in override.iterchildren(etree.Element):
+        tag = child.tag
+        if tag in _UNRESOLVED_PR_TAGS:
+            continue
+        prop = props.get(tag)
+        if tag == _TABS:
+            if prop is None:
+                prop = props[tag] = OxmlElement('w:tabs')
+                pr.append(prop)
+            _merge_tabs(prop, child)
+            continue
+        if prop is None or tag not in _MERGED_ATTR_TAGS:
+            new_prop = props[tag] = deepcopy(child)
+            if prop is None:
+                pr.append(new_prop)
+            else:
+                pr.replace(prop, new_prop)
+            continue
+        attrib = prop.attrib
+        if tag == _IND and (
+            _FIRST_LINE in child.attrib or _HANGING in child.attrib
+        ):
+            attrib.pop(_FIRST_LINE, None)
+            attrib.pop(_HANGING, None)
+        attrib.update(child.attrib)
+
+
+def _merge_tabs(tabs, override):
+    """
+    Merge the tab stops of `w:tabs` element *override* into `w:tabs` element
+    *tabs*. Tab stops add up, a tab stop of *override* replacing only the one
+    of *tabs* at the same position, except that a tab stop of alignment
+    ``clear`` removes the one at its position and is not itself added.
+    """
+    merged = dict((tab.pos, tab) for tab in tabs.iterchildren(_TAB))
+    for tab in override.iterchildren(_TAB):
+        if tab.val == WD_TAB_ALIGNMENT.CLEAR:
+            merged.pop(tab.pos, None)
+        else:
+            merged[tab.pos] = deepcopy(tab)
+    tabs[:] = [merged[pos] for pos in sorted(merged)]
+
+
+def _merged_pr(tagname, prs):
+    """
+    Return a new properties element, like `w:rPr`, having *tagname* and
+    merging the properties elements in *prs*, least specific first, as
+    :func:`_merge_pr` does. |None| items are skipped.
+    """
+    merged = OxmlElement(tagname)
+    for pr in prs:
+        if pr is not None:
+            _merge_pr(merged, pr)
+    return merged
@@ -6,7 +6,9 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from . import parse_xml
+from copy import deepcopy
+
+from . import OxmlElement, parse_xml
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn
@@ -14,12 +16,37 @@ from ..shared import Emu, Twips
 from .simpletypes import (
     ST_Merge, ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure, XsdInt
 )
+from .text.paragraph import iter_paragraph_text, p_xml
 from .xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, OneOrMore, OptionalAttribute,
     RequiredAttribute, ZeroOrOne, ZeroOrMore
 )
 
 
+# ---Clark names used in per-child loops, computed once rather than by a call
+# ---to qn() for each use
+_P = qn('w:p')
+_P_PR = qn('w:pPr')
+_R = qn('w:r')
+_BLOCK_ITEM_TAGS = (_P, qn('w:tbl'), qn('w:sdt'))
+_GRID_COL = qn('w:gridCol')
+_TBL = qn('w:tbl')
+_TBL_GRID = qn('w:tblGrid')
+_TC = qn('w:tc')
+_TC_PR = qn('w:tcPr')
+_TR = qn('w:tr')
+
+# ---range and proofing marks, which have no text of their own, are the only
+# ---content of a cell or paragraph, besides its properties, that
+# ---CT_Tc.replace_text() leaves in place
+_MARK_TAGS = frozenset(qn(tagname) for tagname in (
+    'w:bookmarkStart', 'w:bookmarkEnd', 'w:commentRangeStart',
+    'w:commentRangeEnd', 'w:moveFromRangeStart', 'w:moveFromRangeEnd',
+    'w:moveToRangeStart', 'w:moveToRangeEnd', 'w:permStart', 'w:permEnd',
+    'w:proofErr',
+))
+
+
 class CT_Height(BaseOxmlElement):
     """
     Used for ``<w:trHeight>`` to specify a row height and row height rule.
@@ -36,6 +63,34 @@ class CT_Row(BaseOxmlElement):
     trPr = ZeroOrOne('w:trPr')        # custom inserter below
     tc = ZeroOrMore('w:tc')
 
+    def fill(self, texts):
+        """
+        Replace the content of the ``<w:tc>`` elements of this row, left to
+        right, with a paragraph containing the corresponding string in
+        *texts*. Cell properties are preserved. Cells beyond those in *texts*
+        are left unchanged.
+        """
+        _fill_tcs(self.tc_lst, texts)
+
+    def iter_grid_tcs(self):
+        """
+        Generate the ``<w:tc>`` element at each grid column of this row,
+        left to right. A ``<w:tc>`` spanning several grid columns is
+        generated once for each of them. For a vertically merged
+        continuation cell, the ``<w:tc>`` beginning the merge in a row above
+        is generated in its place, as located by the |TblGeometry| of the
+        table, which carries merge origins down the rows in a single pass.
+        Only this row is examined when it has no continuation cell.
+        """
+        tcs = self.tc_lst
+        tbl = self.getparent()
+        if isinstance(tbl, CT_Tbl) and any(
+            tc.vMerge == ST_Merge.CONTINUE for tc in tcs
+        ):
+            geometry = tbl.geometry
+            return iter(geometry.origin_tcs(geometry.tr_idx(self)))
+        return (tc for tc in tcs for _ in range(tc.grid_span))
+
     def tc_at_grid_col(self, idx):
         """
         The ``<w:tc>`` element appearing at grid column *idx*. Raises
@@ -93,6 +148,11 @@ class CT_Row(BaseOxmlElement):
     def _insert_tblPrEx(self, tblPrEx):
         self.insert(0, tblPrEx)
 
+    def _insert_tc(self, tc):
+        self.append(tc)
+        _bump_grid_version(self.getparent(), self)
+        return tc
+
     def _insert_trPr(self, trPr):
         tblPrEx = self.tblPrEx
         if tblPrEx is not None:
@@ -132,12 +192,163 @@ class CT_Tbl(BaseOxmlElement):
         else:
             tblPr.get_or_add_bidiVisual().val = value
 
+    def bump_grid_version(self, tr=None):
+        """
+        Note a change to the cell layout of this table, such as an added row
+        or column or a changed span, by incrementing :attr:`grid_version`.
+        *tr* is the row changed when the change is confined to the cells of
+        a single row, allowing the cached :attr:`geometry` to be updated for
+        that row rather than discarded. The geometry is only updated when it
+        was current before the change; one made stale by rows added or
+        removed directly with lxml is discarded.
+        """
+        geometry = getattr(self, '_geometry', None)
+        is_current = (
+            geometry is not None and geometry.key == self._geometry_key
+        )
+        self._grid_version = self.grid_version + 1
+        if geometry is None:
+            return
+        if tr is None or not is_current or not geometry.update_row(tr):
+            self._geometry = None
+            return
+        geometry.key = self._geometry_key
+
     @property
     def col_count(self):
         """
         The number of grid columns in this table.
         """
-        return len(self.tblGrid.gridCol_lst)
+        return len(self.grid_cols)
+
+    def copy(self, row_count=None):
+        """
+        Return a deep copy of this ``<w:tbl>`` element, not yet part of any
+        document. When *row_count* is not |None|, the copy has that many
+        rows; rows beyond it are dropped and missing rows are added, each
+        a copy of the last row of this table with its cells emptied. An
+        emptied cell keeps its cell properties and a single paragraph having
+        the paragraph properties of its first paragraph. Raises |ValueError|
+        when *row_count* is less than 1, as a table must have a row.
+        """
+        if row_count is not None and row_count < 1:
+            raise ValueError(
+                'row_count must be at least 1, got %d' % row_count
+            )
+        tbl = deepcopy(self)
+        if row_count is None:
+            return tbl
+        trs = tbl.tr_lst
+        for tr in trs[row_count:]:
+            tbl.remove(tr)
+        if len(trs) >= row_count:
+            return tbl
+        prototype = _blank_tr_copy(trs[-1]) if trs else tbl.new_tr()
+        new_trs = [prototype] + [
+            deepcopy(prototype) for _ in range(row_count - len(trs) - 1)
+        ]
+        if trs:
+            idx = tbl.index(trs[-1]) + 1
+            tbl[idx:idx] = new_trs
+        else:
+            tbl.extend(new_trs)
+        return tbl
+
+    @property
+    def geometry(self):
+        """
+        |TblGeometry| object locating each ``<w:tc>`` element of this table
+        on the layout grid. It is computed on first use and reused until the
+        cell layout of the table changes, being updated incrementally when
+        the change is confined to one row, as when cells are merged.
+        """
+        geometry = getattr(self, '_geometry', None)
+        key = self._geometry_key
+        if geometry is None or geometry.key != key:
+            geometry = self._geometry = TblGeometry(self, key)
+        return geometry
+
+    @property
+    def grid_cols(self):
+        """
+        Tuple of the ``<w:gridCol>`` elements of this table, one for each
+        grid column, left to right. It is computed on first use and reused
+        until the grid version of this table or the number of children of
+        its ``<w:tblGrid>`` element changes, the latter also catching
+        columns added or removed directly with lxml.
+        """
+        return self._grid_col_cache[1]
+
+    def grid_col_idx(self, gridCol):
+        """
+        The index of *gridCol* among the ``<w:gridCol>`` elements of this
+        table, looked up in the cache kept for :attr:`grid_cols`. Raises
+        |ValueError| if *gridCol* is not a grid column of this table.
+        """
+        try:
+            return self._grid_col_cache[2][gridCol]
+        except KeyError:
+            raise ValueError('gridCol is not a grid column of this table')
+
+    @property
+    def grid_version(self):
+        """
+        Integer incremented each time the cell layout of this table or the
+        width of one of its grid columns is changed through this package,
+        allowing values derived from them to be cached. The count is kept on
+        this element object, which lxml retains only while it is referenced,
+        e.g. by a |Table| proxy.
+        """
+        return getattr(self, '_grid_version', 0)
+
+    def iter_cell_tcs(self):
+        """
+        Generate a ``(row_idx, grid_col, tc)`` tuple for each ``<w:tc>``
+        element in this table that begins a cell, left to right and top to
+        bottom, where *grid_col* is the grid column the cell begins on.
+        Vertically merged continuation cells are skipped, so each merged
+        cell is generated once, at its top-left grid position.
+        """
+        for row_idx, tr in enumerate(self.iterchildren(_TR)):
+            grid_col = 0
+            for tc in tr.iterchildren(_TC):
+                tcPr = tc.tcPr
+                if tcPr is None:
+                    yield row_idx, grid_col, tc
+                    grid_col += 1
+                    continue
+                if tcPr.vMerge_val != ST_Merge.CONTINUE:
+                    yield row_idx, grid_col, tc
+                grid_col += tcPr.grid_span
+
+    def iter_row_texts(self):
+        """
+        Generate a list for each row of this table containing the text of
+        the cell at each grid column, in a single pass over the rows. The
+        text of a cell spanning several grid columns is repeated for each of
+        them and a vertically merged continuation cell has the text of the
+        cell above it, following the cell grid of |Table|.
+        """
+        above = []
+        for tr in self.iterchildren(_TR):
+            row = []
+            for tc in tr.iterchildren(_TC):
+                # ---a single pass over the children of the tc, rather than
+                # ---a lookup of tcPr and an XPath query for its paragraphs
+                grid_span, vMerge, p_texts = 1, None, []
+                for child in tc.iterchildren(_TC_PR, _P):
+                    if child.tag == _P:
+                        p_texts.append(child.text)
+                    else:
+                        grid_span, vMerge = child.grid_span, child.vMerge_val
+                if vMerge == ST_Merge.CONTINUE:
+                    start = len(row)
+                    texts = above[start:start+grid_span]
+                    row.extend(texts + [''] * (grid_span - len(texts)))
+                else:
+                    row.extend(['\n'.join(p_texts)] * grid_span)
+            yield row
+            above = row
 
     def iter_tcs(self):
         """
@@ -149,13 +360,93 @@ class CT_Tbl(BaseOxmlElement):
             for tc in tr.tc_lst:
                 yield tc
 
+    def iter_tcs_in(self, rows, cols):
+        """
+        Generate each ``<w:tc>`` element in the rows of this table selected
+        by the slice *rows* that begins on a grid column selected by the
+        slice *cols*, left to right and top to bottom. A cell spanning
+        several grid columns is generated once, when its first grid column
+        is selected.
+        """
+        grid_cols = frozenset(range(self.col_count)[cols])
+        for tr in self.tr_lst[rows]:
+            grid_col = 0
+            for tc in tr.iterchildren(_TC):
+                if grid_col in grid_cols:
+                    yield tc
+                grid_col += tc.grid_span
+
+    def fill(self, text_rows):
+        """
+        Replace the content of the cells of this table with the text in
+        *text_rows*, a sequence of rows, each a sequence of strings. The
+        strings in each row are placed in the ``<w:tc>`` elements of the
+        corresponding ``<w:tr>``, left to right. Cell properties are
+        preserved. Rows and cells beyond those present are ignored, as are
+        cells continuing a vertical merge, which are left unchanged.
+        """
+        continuation_tcs = self.vMerge_continuation_tcs()
+        tcs, texts = [], []
+        for tr, row in zip(self.tr_lst, text_rows):
+            for tc, text in zip(tr.tc_lst, row):
+                if tc in continuation_tcs:
+                    continue
+                tcs.append(tc)
+                texts.append(text)
+        _fill_tcs(tcs, texts)
+
+    def new_tr(self):
+        """
+        Return a new ``<w:tr>`` element, not yet added to this table, having
+        a ``<w:tc>`` for each grid column of this table, each with the width
+        of its column and containing an empty paragraph.
+        """
+        tr = OxmlElement('w:tr')
+        for gridCol in self.grid_cols:
+            tc = tr.add_tc()
+            tc.width = gridCol.w
+        return tr
+
     @classmethod
     def new_tbl(cls, rows, cols, width):
         """
         Return a new `w:tbl` element having *rows* rows and *cols* columns
-        with *width* distributed evenly between the columns.
+        with *width* distributed evenly between the columns. Only the table
+        properties and grid are parsed; the rows are copies of a single
+        `w:tr` element, so the time taken is proportional to the number of
+        cells.
+        """
+        tbl = parse_xml(cls._tbl_xml(cols, width))
+        if rows > 0:
+            tr = tbl.new_tr()
+            tbl.extend([tr] + [deepcopy(tr) for _ in range(rows - 1)])
+        return tbl
+
+    @classmethod
+    def new_tbl_from_rows(cls, text_rows, cols, width, header=False):
         """
-        return parse_xml(cls._tbl_xml(rows, cols, width))
+        Return a new `w:tbl` element having *cols* columns with *width*
+        distributed evenly between them and a row for each sequence of
+        strings in *text_rows*, each string becoming the text of a cell. A row
+        having fewer than *cols* strings is padded with empty cells. The
+        first row is marked as a header row, repeated at the top of each page,
+        when *header* is |True|. The XML is built in one pass and parsed once.
+        """
+        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        tc_tmpl = (
+            '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr>%%s</w:tc>'
+            % col_width.twips
+        )
+        empty_tc = tc_tmpl % '<w:p/>'
+        trs = []
+        for idx, row in enumerate(text_rows):
+            trs.append('<w:tr>')
+            if header and idx == 0:
+                trs.append('<w:trPr><w:tblHeader/></w:trPr>')
+            trs.extend([tc_tmpl % p_xml(text) for text in row])
+            trs.extend([empty_tc] * (cols - len(row)))
+            trs.append('</w:tr>')
+        return parse_xml(cls._tbl_xml(cols, width, ''.join(trs)))
 
     @property
     def tblStyle_val(self):
@@ -180,8 +471,65 @@ class CT_Tbl(BaseOxmlElement):
             return
         tblPr._add_tblStyle().val = styleId
 
+    def vMerge_continuation_tcs(self):
+        """
+        Return a set of the ``<w:tc>`` elements of this table that continue
+        a vertical merge, found with a single XPath query rather than by
+        reading the properties of each cell.
+        """
+        return set(self.xpath(
+            './w:tr/w:tc[w:tcPr/w:vMerge[not(@w:val) or @w:val="continue"]]'
+        ))
+
+    @property
+    def _geometry_key(self):
+        """
+        Value identifying the current cell layout of this table; the grid
+        version and the number of child elements, which also changes when
+        rows are added or removed directly with lxml.
+        """
+        return (self.grid_version, len(self))
+
+    @property
+    def _grid_col_cache(self):
+        """
+        A ``(key, gridCols, idxs)`` 3-tuple caching the ``<w:gridCol>``
+        elements of this table and a mapping of each to its index, rebuilt
+        when *key* no longer matches the grid version of this table and the
+        number of children of its ``<w:tblGrid>`` element.
+        """
+        tblGrid = self._tblGrid
+        key = (self.grid_version, len(tblGrid))
+        cache = getattr(self, '_grid_cols', None)
+        if cache is None or cache[0] != key:
+            gridCols = tuple(tblGrid.iterchildren(_GRID_COL))
+            cache = self._grid_cols = (
+                key, gridCols,
+                dict((gridCol, idx) for idx, gridCol in enumerate(gridCols))
+            )
+        return cache
+
+    @property
+    def _tblGrid(self):
+        """
+        The ``<w:tblGrid>`` child of this table, found among the children
+        preceding the first row. Unlike the `tblGrid` property, this does
+        not visit every row, which lxml does when searching by tag.
+        """
+        for child in self.iterchildren():
+            if child.tag == _TBL_GRID:
+                return child
+            if child.tag == _TR:
+                break
+        return self.tblGrid
+
+    def _insert_tr(self, tr):
+        self.append(tr)
+        self.bump_grid_version()
+        return tr
+
     @classmethod
-    def _tbl_xml(cls, rows, cols, width):
+    def _tbl_xml(cls, cols, width, trs_xml=''):
         col_width = Emu(width/cols) if cols > 0 else Emu(0)
         return (
             '<w:tbl %s>\n'
@@ -197,41 +545,14 @@ class CT_Tbl(BaseOxmlElement):
         ) % (
             nsdecls('w'),
             cls._tblGrid_xml(cols, col_width),
-            cls._trs_xml(rows, cols, col_width)
+            trs_xml
         )
 
     @classmethod
     def _tblGrid_xml(cls, col_count, col_width):
-        xml = '  <w:tblGrid>\n'
-        for i in range(col_count):
-            xml += '    <w:gridCol w:w="%d"/>\n' % col_width.twips
-        xml += '  </w:tblGrid>\n'
-        return xml
-
-    @classmethod
-    def _trs_xml(cls, row_count, col_count, col_width):
-        xml = ''
-        for i in range(row_count):
-            xml += (
-                '  <w:tr>\n'
-                '%s'
-                '  </w:tr>\n'
-            ) % cls._tcs_xml(col_count, col_width)
-        return xml
-
-    @classmethod
-    def _tcs_xml(cls, col_count, col_width):
-        xml = ''
-        for i in range(col_count):
-            xml += (
-                '    <w:tc>\n'
-                '      <w:tcPr>\n'
-                '        <w:tcW w:type="dxa" w:w="%d"/>\n'
-                '      </w:tcPr>\n'
-                '      <w:p/>\n'
-                '    </w:tc>\n'
-            ) % col_width.twips
-        return xml
+        return '  <w:tblGrid>\n%s  </w:tblGrid>\n' % (
+            ('    <w:gridCol w:w="%d"/>\n' % col_width.twips) * col_count
+        )
 
 
 class CT_TblGrid(BaseOxmlElement):
@@ -241,6 +562,11 @@ class CT_TblGrid(BaseOxmlElement):
     """
     gridCol = ZeroOrMore('w:gridCol', successors=('w:tblGridChange',))
 
+    def _insert_gridCol(self, gridCol):
+        self.insert_element_before(gridCol, 'w:tblGridChange')
+        _bump_grid_version(self.getparent())
+        return gridCol
+
 
 class CT_TblGridCol(BaseOxmlElement):
     """
@@ -253,9 +579,26 @@ class CT_TblGridCol(BaseOxmlElement):
     def gridCol_idx(self):
         """
         The index of this ``<w:gridCol>`` element within its parent
-        ``<w:tblGrid>`` element.
+        ``<w:tblGrid>`` element. Looked up in the grid column cache of the
+        table when there is one.
+        """
+        tblGrid = self.getparent()
+        tbl = tblGrid.getparent()
+        if isinstance(tbl, CT_Tbl):
+            return tbl.grid_col_idx(self)
+        return tblGrid.gridCol_lst.index(self)
+
+    def set_width(self, value):
+        """
+        Set the ``w:w`` attribute to *value*, a length in EMU or |None|, and
+        bump the grid version of the table, so values cached for the widths
+        of its columns, like the prototype row new rows are copied from, are
+        rebuilt.
         """
-        return self.getparent().gridCol_lst.index(self)
+        self.w = value
+        tblGrid = self.getparent()
+        if tblGrid is not None:
+            _bump_grid_version(tblGrid.getparent())
 
 
 class CT_TblLayoutType(BaseOxmlElement):
@@ -381,11 +724,14 @@ class CT_Tc(BaseOxmlElement):
         of the span, similar to how a slice of the cell's rows would be
         specified.
         """
-        if self.vMerge is not None:
-            tc_below = self._tc_below
-            if tc_below is not None and tc_below.vMerge == ST_Merge.CONTINUE:
-                return tc_below.bottom
-        return self._tr_idx + 1
+        tc = self
+        if tc.vMerge is not None:
+            tc_below = tc._tc_below
+            while tc_below is not None:
+                if tc_below.vMerge != ST_Merge.CONTINUE:
+                    break
+                tc, tc_below = tc_below, tc_below._tc_below
+        return tc._tr_idx + 1
 
     def clear_content(self):
         """
@@ -416,16 +762,14 @@ class CT_Tc(BaseOxmlElement):
     def grid_span(self, value):
         tcPr = self.get_or_add_tcPr()
         tcPr.grid_span = value
+        self._bump_grid_version()
 
     def iter_block_items(self):
         """
         Generate a reference to each of the block-level content elements in
         this cell, in the order they appear.
         """
-        block_item_tags = (qn('w:p'), qn('w:tbl'), qn('w:sdt'))
-        for child in self:
-            if child.tag in block_item_tags:
-                yield child
+        return self.iterchildren(*_BLOCK_ITEM_TAGS)
 
     @property
     def left(self):
@@ -441,7 +785,7 @@ class CT_Tc(BaseOxmlElement):
         *other_tc* as diagonal corners.
         """
         top, left, height, width = self._span_dimensions(other_tc)
-        top_tc = self._tbl.tr_lst[top].tc_at_grid_col(left)
+        top_tc = self._tbl.geometry.tc_at_grid_col(top, left)
         top_tc._grow_to(width, height)
         return top_tc
 
@@ -457,6 +801,41 @@ class CT_Tc(BaseOxmlElement):
             '</w:tc>' % nsdecls('w')
         )
 
+    def replace_text(self, text):
+        """
+        Replace the text of this cell with *text*, reusing its first
+        paragraph and the first run directly in that paragraph so their
+        properties are kept. All other content of the cell and of that
+        paragraph is removed, including runs in hyperlinks, content controls
+        and other containers, so what Word shows matches *text*; only range
+        marks like bookmarks are left in place. A run is added when the
+        paragraph has none and a paragraph when the cell has none.
+        """
+        p = None
+        for child in list(self):
+            tag = child.tag
+            if tag == _TC_PR or tag in _MARK_TAGS:
+                continue
+            if p is None and tag == _P:
+                p = child
+                continue
+            self.remove(child)
+        if p is None:
+            p = self.add_p()
+
+        r = None
+        for child in list(p):
+            tag = child.tag
+            if tag == _P_PR or tag in _MARK_TAGS:
+                continue
+            if r is None and tag == _R:
+                r = child
+                continue
+            p.remove(child)
+        if r is None:
+            r = p.add_r()
+        r.replace_text(text)
+
     @property
     def right(self):
         """
@@ -467,14 +846,24 @@ class CT_Tc(BaseOxmlElement):
         """
         return self._grid_col + self.grid_span
 
+    @property
+    def text(self):
+        """
+        The text of the paragraphs in this cell, including those in content
+        controls, each as produced by :attr:`CT_P.text`, separated by a line
+        feed. The text of nested tables is not included.
+        """
+        return '\n'.join(iter_paragraph_text(self, include_tables=False))
+
     @property
     def top(self):
         """
         The top-most row index in the vertical span of this cell.
         """
-        if self.vMerge is None or self.vMerge == ST_Merge.RESTART:
-            return self._tr_idx
-        return self._tc_above.top
+        tc = self
+        while tc.vMerge == ST_Merge.CONTINUE:
+            tc = tc._tc_above
+        return tc._tr_idx
 
     @property
     def vMerge(self):
@@ -491,6 +880,7 @@ class CT_Tc(BaseOxmlElement):
     def vMerge(self, value):
         tcPr = self.get_or_add_tcPr()
         tcPr.vMerge_val = value
+        self._bump_grid_version()
 
     @property
     def width(self):
@@ -516,11 +906,23 @@ class CT_Tc(BaseOxmlElement):
         if self.width and other_tc.width:
             self.width += other_tc.width
 
+    def _bump_grid_version(self):
+        """
+        Note a change to the cell layout of the table containing this cell,
+        if any.
+        """
+        tr = self.getparent()
+        if tr is not None:
+            _bump_grid_version(tr.getparent(), tr)
+
     @property
     def _grid_col(self):
         """
         The grid column at which this cell begins.
         """
+        tbl = self._tbl_or_none
+        if tbl is not None:
+            return tbl.geometry.grid_col(self)
         tr = self._tr
         idx = tr.tc_lst.index(self)
         preceding_tcs = tr.tc_lst[:idx]
@@ -532,17 +934,21 @@ class CT_Tc(BaseOxmlElement):
         horizontal spans and creating continuation cells to form vertical
         spans.
         """
-        def vMerge_val(top_tc):
-            if top_tc is not self:
+        def vMerge_val(tc, height):
+            if tc is not top_tc:
                 return ST_Merge.CONTINUE
             if height == 1:
                 return None
             return ST_Merge.RESTART
 
         top_tc = self if top_tc is None else top_tc
-        self._span_to_width(width, top_tc, vMerge_val(top_tc))
-        if height > 1:
-            self._tc_below._grow_to(width, height-1, top_tc)
+        tc = self
+        while True:
+            tc._span_to_width(width, top_tc, vMerge_val(tc, height))
+            height -= 1
+            if height < 1:
+                break
+            tc = tc._tc_below
 
     def _insert_tcPr(self, tcPr):
         """
@@ -598,7 +1004,9 @@ class CT_Tc(BaseOxmlElement):
         """
         Remove this `w:tc` element from the XML tree.
         """
-        self.getparent().remove(self)
+        tr = self.getparent()
+        tr.remove(self)
+        _bump_grid_version(tr.getparent(), tr)
 
     def _remove_trailing_empty_p(self):
         """
@@ -607,7 +1015,7 @@ class CT_Tc(BaseOxmlElement):
         """
         block_items = list(self.iter_block_items())
         last_content_elm = block_items[-1]
-        if last_content_elm.tag != qn('w:p'):
+        if last_content_elm.tag != _P:
             return
         p = last_content_elm
         if len(p.r_lst) > 0:
@@ -689,31 +1097,51 @@ class CT_Tc(BaseOxmlElement):
         """
         The tbl element this tc element appears in.
         """
-        return self.xpath('./ancestor::w:tbl[position()=1]')[0]
+        tbl = self._tbl_or_none
+        if tbl is None:
+            raise ValueError('tc is not in a table')
+        return tbl
+
+    @property
+    def _tbl_or_none(self):
+        """
+        The tbl element this tc element appears in, or |None| if it is not
+        (yet) part of a table.
+        """
+        for tbl in self.iterancestors(_TBL):
+            return tbl
+        return None
 
     @property
     def _tc_above(self):
         """
         The `w:tc` element immediately above this one in its grid column.
         """
-        return self._tr_above.tc_at_grid_col(self._grid_col)
+        geometry = self._tbl.geometry
+        tr_idx = geometry.tr_idx(self._tr)
+        if tr_idx == 0:
+            raise ValueError('no tr above topmost tr')
+        return geometry.tc_at_grid_col(tr_idx-1, geometry.grid_col(self))
 
     @property
     def _tc_below(self):
         """
         The tc element immediately below this one in its grid column.
         """
-        tr_below = self._tr_below
-        if tr_below is None:
+        geometry = self._tbl.geometry
+        tr_idx = geometry.tr_idx(self._tr) + 1
+        if tr_idx == geometry.row_count:
             return None
-        return tr_below.tc_at_grid_col(self._grid_col)
+        return geometry.tc_at_grid_col(tr_idx, geometry.grid_col(self))
 
     @property
     def _tr(self):
         """
         The tr element this tc element appears in.
         """
-        return self.xpath('./ancestor::w:tr[position()=1]')[0]
+        for tr in self.iterancestors(_TR):
+            return tr
+        raise ValueError('tc is not in a row')
 
     @property
     def _tr_above(self):
@@ -721,11 +1149,11 @@ class CT_Tc(BaseOxmlElement):
         The tr element prior in sequence to the tr this cell appears in.
         Raises |ValueError| if called on a cell in the top-most row.
         """
-        tr_lst = self._tbl.tr_lst
-        tr_idx = tr_lst.index(self._tr)
+        geometry = self._tbl.geometry
+        tr_idx = geometry.tr_idx(self._tr)
         if tr_idx == 0:
             raise ValueError('no tr above topmost tr')
-        return tr_lst[tr_idx-1]
+        return geometry.tr(tr_idx-1)
 
     @property
     def _tr_below(self):
@@ -733,19 +1161,18 @@ class CT_Tc(BaseOxmlElement):
         The tr element next in sequence after the tr this cell appears in, or
         |None| if this cell appears in the last row.
         """
-        tr_lst = self._tbl.tr_lst
-        tr_idx = tr_lst.index(self._tr)
-        try:
-            return tr_lst[tr_idx+1]
-        except IndexError:
+        geometry = self._tbl.geometry
+        tr_idx = geometry.tr_idx(self._tr) + 1
+        if tr_idx == geometry.row_count:
             return None
+        return geometry.tr(tr_idx)
 
     @property
     def _tr_idx(self):
         """
         The row index of the tr element this tc element appears in.
         """
-        return self._tbl.tr_lst.index(self._tr)
+        return self._tbl.geometry.tr_idx(self._tr)
 
 
 class CT_TcPr(BaseOxmlElement):
@@ -892,3 +1319,184 @@ class CT_VMerge(BaseOxmlElement):
     ``<w:vMerge>`` element, specifying vertical merging behavior of a cell.
     """
     val = OptionalAttribute('w:val', ST_Merge, default=ST_Merge.CONTINUE)
+
+
+class TblGeometry(object):
+    """
+    Location of each ``<w:tc>`` element of a ``<w:tbl>`` element on its
+    layout grid, by row index and grid column, computed in a single pass over
+    the table. Provides the constant-time lookups used when merging cells,
+    which would otherwise search the rows of the table at each step.
+    Obtained from :attr:`CT_Tbl.geometry`, which keeps it up to date.
+    """
+
+    __slots__ = (
+        'key', '_trs', '_tr_idxs', '_grid_rows', '_grid_cols', '_origin_rows'
+    )
+
+    def __init__(self, tbl, key):
+        self.key = key
+        self._trs = trs = tbl.tr_lst
+        self._tr_idxs = dict((tr, idx) for idx, tr in enumerate(trs))
+        self._grid_cols = {}
+        self._grid_rows = [self._locate_tcs(tr) for tr in trs]
+        self._origin_rows = []
+
+    def grid_col(self, tc):
+        """
+        The grid column at which *tc* begins. Raises |ValueError| if *tc* is
+        not a cell of this table.
+        """
+        try:
+            return self._grid_cols[tc]
+        except KeyError:
+            raise ValueError('tc is not a cell of this table')
+
+    def merge_origin_tc(self, tr_idx, grid_col):
+        """
+        The ``<w:tc>`` element occupying grid column *grid_col* of the row
+        at *tr_idx*, or, when that cell continues a vertical merge, the
+        ``<w:tc>`` element beginning the merge in a row above.
+        """
+        grid_rows = self._grid_rows
+        tc = grid_rows[tr_idx][grid_col]
+        while tc.vMerge == ST_Merge.CONTINUE and tr_idx > 0:
+            tr_idx -= 1
+            if grid_col >= len(grid_rows[tr_idx]):
+                break
+            tc = grid_rows[tr_idx][grid_col]
+        return tc
+
+    def origin_tcs(self, tr_idx):
+        """
+        Return a list of the ``<w:tc>`` element at each grid column of the
+        row at *tr_idx*, with the ``<w:tc>`` element beginning the vertical
+        merge in its place where a cell continues one, as
+        :meth:`merge_origin_tc` would locate it. The rows are resolved top
+        to bottom, each carrying the merge origins of the row above it
+        forward, and kept until a row above *tr_idx* changes, so reading the
+        cells of every row takes a single pass however tall the merges.
+        """
+        origin_rows = self._origin_rows
+        grid_rows = self._grid_rows
+        while len(origin_rows) <= tr_idx:
+            above = origin_rows[-1] if origin_rows else ()
+            origin_rows.append([
+                above[grid_col] if (
+                    tc.vMerge == ST_Merge.CONTINUE and grid_col < len(above)
+                ) else tc
+                for grid_col, tc in enumerate(grid_rows[len(origin_rows)])
+            ])
+        return origin_rows[tr_idx]
+
+    @property
+    def row_count(self):
+        """
+        The number of rows in the table.
+        """
+        return len(self._trs)
+
+    def tc_at_grid_col(self, tr_idx, grid_col):
+        """
+        The ``<w:tc>`` element beginning at grid column *grid_col* of the
+        row at *tr_idx*. Raises |ValueError| if no ``<w:tc>`` element begins
+        at that grid column.
+        """
+        grid_row = self._grid_rows[tr_idx]
+        if 0 <= grid_col < len(grid_row):
+            tc = grid_row[grid_col]
+            if self._grid_cols[tc] == grid_col:
+                return tc
+            raise ValueError('no cell on grid column %d' % grid_col)
+        raise ValueError('index out of bounds')
+
+    def tr(self, tr_idx):
+        """
+        The ``<w:tr>`` element at *tr_idx*.
+        """
+        return self._trs[tr_idx]
+
+    def tr_idx(self, tr):
+        """
+        The index of *tr* among the rows of the table. Raises |ValueError|
+        if *tr* is not a row of this table.
+        """
+        try:
+            return self._tr_idxs[tr]
+        except KeyError:
+            raise ValueError('tr is not a row of this table')
+
+    def update_row(self, tr):
+        """
+        Locate the cells of *tr* again after a change confined to that row,
+        such as a changed span or a removed cell. Returns |False| if *tr* is
+        not a row of the table, in which case this geometry is no longer
+        valid.
+        """
+        tr_idx = self._tr_idxs.get(tr)
+        if tr_idx is None:
+            return False
+        grid_cols = self._grid_cols
+        for tc in self._grid_rows[tr_idx]:
+            grid_cols.pop(tc, None)
+        self._grid_rows[tr_idx] = self._locate_tcs(tr)
+        del self._origin_rows[tr_idx:]
+        return True
+
+    def _locate_tcs(self, tr):
+        """
+        Return a list containing the ``<w:tc>`` element occupying each grid
+        column of *tr*, recording the grid column at which each begins.
+        """
+        grid_row = []
+        grid_cols = self._grid_cols
+        for tc in tr.tc_lst:
+            grid_cols[tc] = len(grid_row)
+            grid_row.extend([tc] * tc.grid_span)
+        return grid_row
+
+
+def _blank_tr_copy(tr):
+    """
+    Return a copy of *tr* in which the content of each ``<w:tc>`` element is
+    replaced by a single empty paragraph having the paragraph properties of
+    its first paragraph, if any. Cell and row properties are preserved.
+    """
+    tr = deepcopy(tr)
+    for tc in tr.iterchildren(_TC):
+        p = tc.find(_P)
+        tc.clear_content()
+        if p is None:
+            tc.add_p()
+            continue
+        pPr = p.pPr
+        p[:] = [] if pPr is None else [pPr]
+        tc.append(p)
+    return tr
+
+
+def _bump_grid_version(tbl, tr=None):
+    """
+    Call :meth:`CT_Tbl.bump_grid_version` on *tbl* if it is a ``<w:tbl>``
+    element, passing *tr* when the change is confined to that row. *tbl*
+    may be |None| or another element when the row or grid making a layout
+    change is not (yet) part of a table.
+    """
+    if isinstance(tbl, CT_Tbl):
+        tbl.bump_grid_version(tr)
+
+
+def _fill_tcs(tcs, texts):
+    """
+    Replace the content of each ``<w:tc>`` element in *tcs* with a paragraph
+    containing the corresponding string in *texts*. The paragraphs are
+    rendered to XML and parsed in a single call.
+    """
+    ps = parse_xml(
+        '<w:tc %s>%s</w:tc>' % (
+            nsdecls('w'), ''.join([p_xml(text) for text in texts])
+        )
+    )
+    for tc, p in zip(tcs, list(ps)):
+        tc.clear_content()
+        tc.append(p)
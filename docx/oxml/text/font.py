@@ -4,6 +4,10 @@
 Custom element classes related to run properties (font).
 """
 
+from copy import deepcopy
+
+from lxml import etree
+
 from .. import parse_xml
 from ...enum.dml import MSO_THEME_COLOR
 from ...enum.text import WD_COLOR, WD_UNDERLINE
@@ -15,6 +19,8 @@ from ..xmlchemy import (
     BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrOne
 )
 
+_RFONTS = qn('w:rFonts')
+
 
 class CT_Color(BaseOxmlElement):
     """
@@ -89,6 +95,7 @@ class CT_RPr(BaseOxmlElement):
     cs = ZeroOrOne('w:cs', successors=_tag_seq[34:])
     specVanish = ZeroOrOne('w:specVanish', successors=_tag_seq[38:])
     oMath = ZeroOrOne('w:oMath', successors=_tag_seq[39:])
+    _tag_idx = dict((qn(tag), idx) for idx, tag in enumerate(_tag_seq))
     del _tag_seq
 
     def _new_color(self):
@@ -264,6 +271,32 @@ class CT_RPr(BaseOxmlElement):
         if value is not None:
             self._add_u().val = value
 
+    def update(self, prototype):
+        """
+        Set each property of *prototype*, a `w:rPr` element, on this element.
+        A copy of each property replaces the one having the same tag or is
+        inserted in schema order, except that the attributes of
+        a `w:rFonts` property are added to those of an existing one.
+        """
+        tag_idx = self._tag_idx
+        end = len(tag_idx)
+        for prop in list(deepcopy(prototype).iterchildren(etree.Element)):
+            tag = prop.tag
+            idx = tag_idx.get(tag, end)
+            for child in self.iterchildren(etree.Element):
+                child_idx = tag_idx.get(child.tag, end)
+                if child_idx < idx:
+                    continue
+                if child.tag != tag:
+                    child.addprevious(prop)
+                elif tag == _RFONTS:
+                    child.attrib.update(prop.attrib)
+                else:
+                    self.replace(child, prop)
+                break
+            else:
+                self.append(prop)
+
     def _get_bool_val(self, name):
         """
         Return the value of the boolean child element having *name*, e.g.
@@ -4,10 +4,71 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from ..ns import qn
+import re
+
+from bisect import bisect_right
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from ..ns import nsmap, qn
+from .run import (
+    _RUN_CONTENT_TAGS, _RUN_CONTENT_TEXT, _XML_SPACE, _run_content_re
+)
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
 
+_HYPERLINK = qn('w:hyperlink')
+_P = qn('w:p')
+_PPR = qn('w:pPr')
+_PROOF_ERR = qn('w:proofErr')
+_R = qn('w:r')
+_R_PR = qn('w:rPr')
+_SDT = qn('w:sdt')
+_T = qn('w:t')
+
+# ---run content that can move to an adjacent run having the same formatting
+_MERGEABLE_RUN_CONTENT = frozenset(
+    qn(tag) for tag in ('w:t', 'w:tab', 'w:br', 'w:cr')
+)
+
+# ---text nodes of run-level <w:t> children and run-level <w:tab/>, <w:br>
+# ---and <w:cr/> elements of a paragraph, in document order. The union is
+# ---only evaluated against one paragraph at a time; libxml2 merges union
+# ---node-sets in quadratic time, so a body-wide union is far slower.
+_p_text_xpath = etree.XPath(
+    'w:r/w:t/text() | w:r/w:tab | w:r/w:br | w:r/w:cr',
+    namespaces=nsmap, smart_strings=False
+)
+
+# ---the elements matching _p_text_xpath, each <w:t> instead of its text
+_p_text_elements_xpath = etree.XPath(
+    'w:r/w:t | w:r/w:tab | w:r/w:br | w:r/w:cr', namespaces=nsmap
+)
+
+_RUN_CONTENT_XML = {'\t': '<w:tab/>', '\r': '<w:br/>', '\n': '<w:br/>'}
+
+# ---paragraphs of a block-item container, with and without those in
+# ---(possibly nested) table cells, both including those in block-level
+# ---content controls. A paragraph having more paragraph or table ancestors
+# ---than the container, passed as $ps and $tbls, is in a text box or a table
+_p_xpaths = {
+    False: etree.XPath(
+        'descendant::w:p[count(ancestor::w:p) = $ps and '
+        'count(ancestor::w:tbl) = $tbls]', namespaces=nsmap
+    ),
+    True: etree.XPath(
+        'descendant::w:p[count(ancestor::w:p) = $ps]', namespaces=nsmap
+    ),
+}
+_ancestor_p_count_xpath = etree.XPath(
+    'count(ancestor::w:p)', namespaces=nsmap
+)
+_ancestor_tbl_count_xpath = etree.XPath(
+    'count(ancestor::w:tbl)', namespaces=nsmap
+)
+
+
 class CT_P(BaseOxmlElement):
     """
     ``<w:p>`` element, containing the properties and text for a paragraph.
@@ -48,10 +109,52 @@ class CT_P(BaseOxmlElement):
         Remove all child elements, except the ``<w:pPr>`` element if present.
         """
         for child in self[:]:
-            if child.tag == qn('w:pPr'):
+            if child.tag == _PPR:
                 continue
             self.remove(child)
 
+    def normalize_runs(self):
+        """
+        Merge each run of this paragraph into the run before it when both
+        have equal run properties and contain only text, tabs and breaks,
+        then drop empty ``<w:t>`` elements and join adjacent ones in each
+        run. Runs in a hyperlink are merged with each other but not with
+        runs outside it. ``<w:proofErr>`` markers, which only record
+        spelling and grammar state, are removed so they no longer keep runs
+        apart. Return the number of elements removed.
+        """
+        removed = _normalize_runs_in(self)
+        for hyperlink in self.iterchildren(_HYPERLINK):
+            removed += _normalize_runs_in(hyperlink)
+        return removed
+
+    def sub(self, regex, repl):
+        """
+        Replace each non-empty match of the compiled *regex* in the
+        :attr:`text` of this paragraph with the string returned by calling
+        *repl* with the match object, as :func:`re.sub` does. The
+        replacement goes in the ``<w:t>`` element where the match begins, so
+        it takes the formatting of that run; the rest of the match is
+        removed from the runs it spans, and a run left with only its
+        ``<w:rPr>`` is removed. Elements the matches do not reach are left
+        untouched. Return the number of replacements.
+        """
+        text = self.text
+        matches = [m for m in regex.finditer(text) if m.end() > m.start()]
+        if not matches:
+            return 0
+        content, starts, offset = [], [], 0
+        for elm in _p_text_elements_xpath(self):
+            content.append(elm)
+            starts.append(offset)
+            offset += len(elm.text or '') if elm.tag == _T else 1
+        # ---right to left, so offsets of content before a match still hold---
+        for match in reversed(matches):
+            _replace_span(
+                content, starts, match.start(), match.end(), repl(match)
+            )
+        return len(matches)
+
     def set_sectPr(self, sectPr):
         """
         Unconditionally replace or add *sectPr* as a grandchild in the
@@ -76,3 +179,383 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+    def iter_text_fragments(self):
+        """
+        Return an iterator over the fragments making up :attr:`text`, in
+        document order; the text of each ``<w:t>`` element of a run in this
+        paragraph and ``'\\t'`` or ``'\\n'`` for each ``<w:tab/>``,
+        ``<w:br>`` or ``<w:cr/>`` element of a run.
+        """
+        return iter(self._text_fragments())
+
+    @property
+    def text(self):
+        """
+        The textual content of the runs in this paragraph, with run content
+        elements like ``<w:tab/>`` translated to their Python equivalent.
+        """
+        return ''.join(self._text_fragments())
+
+    def _text_fragments(self):
+        """
+        Return a list of the text fragments of this paragraph, gathered with
+        a single XPath query and a lookup of the text equivalent of each run
+        content element in a table keyed by tag.
+        """
+        text_of, Element = _RUN_CONTENT_TEXT, etree._Element
+        return [
+            text_of[item.tag] if isinstance(item, Element) else item
+            for item in _p_text_xpath(self)
+        ]
+
+
+def iter_paragraph_text(element, include_tables=True):
+    """
+    Generate the text of each paragraph of container *element*, in document
+    order, as produced by :attr:`CT_P.text`. When *include_tables* is
+    |True|, the text of paragraphs in table cells, including those of
+    nested tables, is generated too, in its document position. Paragraphs
+    in block-level content controls are included; those in text boxes are
+    skipped.
+    """
+    for p in _container_ps(element, include_tables):
+        yield p.text
+
+
+def normalize_paragraph_runs(element, include_tables=True):
+    """
+    Call :meth:`CT_P.normalize_runs` on each paragraph of container
+    *element* and, when *include_tables* is |True|, on each paragraph in
+    its table cells, including those of nested tables. Paragraphs in
+    block-level content controls are included; those in text boxes are
+    skipped. Return the total number of elements removed.
+    """
+    return sum(
+        p.normalize_runs() for p in _container_ps(element, include_tables)
+    )
+
+
+def compile_substitution(pattern, repl=None, regex=False):
+    """
+    Return a `(regex, repl)` pair for :meth:`CT_P.sub` replacing *pattern*
+    with *repl*. When *repl* is |None|, *pattern* is a mapping of patterns
+    to their replacements, all searched for in a single pass; where
+    several patterns match at the same position, the longest literal or
+    the first regular expression wins. Patterns are literal strings unless
+    *regex* is |True|, when each is a regular expression and its
+    replacement is a template expanded with the groups of the match, as for
+    :func:`re.sub`, or a function called with the match. Raises
+    |ValueError| on an empty pattern.
+    """
+    if repl is None:
+        if not hasattr(pattern, 'items'):
+            raise TypeError(
+                'a mapping of patterns to replacements is required when no '
+                'replacement is given'
+            )
+        subs = list(pattern.items())
+    else:
+        subs = [(pattern, repl)]
+    if not all(pattern for pattern, _ in subs):
+        raise ValueError('cannot replace an empty pattern')
+
+    if not regex:
+        replacements = dict(subs)
+        patterns = sorted(replacements, key=len, reverse=True)
+        return (
+            re.compile('|'.join(re.escape(p) for p in patterns)),
+            lambda match: replacements[match.group(0)]
+        )
+
+    if len(subs) == 1:
+        pattern, repl = subs[0]
+        return re.compile(pattern), _expander(repl)
+
+    regexes = [re.compile(pattern) for pattern, _ in subs]
+    expanders = dict(
+        (regex, _expander(repl)) for regex, (_, repl) in zip(regexes, subs)
+    )
+    return (
+        _RegexSet(regexes), lambda match: expanders[match.re](match)
+    )
+
+
+def replace_paragraph_text(element, regex, repl, include_tables=True):
+    """
+    Call :meth:`CT_P.sub` with *regex* and *repl* on each paragraph of
+    container *element* and, when *include_tables* is |True|, on each
+    paragraph in its table cells, including those of nested tables.
+    Paragraphs in block-level content controls are included; those in text
+    boxes are skipped. Return the total number of replacements.
+    """
+    return sum(
+        p.sub(regex, repl) for p in _container_ps(element, include_tables)
+    )
+
+
+def p_xml(text):
+    """
+    Return the XML for a ``<w:p>`` element containing *text* in a single run,
+    translating the text as assigning it to |Run.text| would. The namespace
+    declaration is omitted; the result is meant to be embedded in larger XML
+    having ``w:`` declared. An empty paragraph is returned for empty *text*.
+    """
+    if not text:
+        return '<w:p/>'
+    parts = ['<w:p><w:r>']
+    for segment in _run_content_re.split(text):
+        if not segment:
+            continue
+        content_xml = _RUN_CONTENT_XML.get(segment)
+        if content_xml is not None:
+            parts.append(content_xml)
+        elif segment.strip() != segment:
+            parts.append(
+                '<w:t xml:space="preserve">%s</w:t>' % escape(segment)
+            )
+        else:
+            parts.append('<w:t>%s</w:t>' % escape(segment))
+    parts.append('</w:r></w:p>')
+    return ''.join(parts)
+
+
+def _compact_t_elements(r):
+    """
+    Remove each ``<w:t>`` child of *r* having no text and move the text of
+    each other one into the first of the ``<w:t>`` elements directly before
+    it. Return the number of elements removed.
+    """
+    removed = 0
+    group = []
+    for child in list(r) + [None]:
+        if child is not None and child.tag == _T:
+            if child.text:
+                group.append(child)
+            else:
+                r.remove(child)
+                removed += 1
+            continue
+        if len(group) > 1:
+            t = group[0]
+            text = t.text = ''.join([t.text for t in group])
+            if len(text.strip()) < len(text):
+                t.set(_XML_SPACE, 'preserve')
+            for t in group[1:]:
+                r.remove(t)
+            removed += len(group) - 1
+        group = []
+    return removed
+
+
+def _container_ps(element, include_tables):
+    """
+    Return a list of the ``<w:p>`` elements of block-item container
+    *element*, in document order, including those in block-level content
+    controls and, when *include_tables* is |True|, those in its table cells,
+    including cells of nested tables. Paragraphs in text boxes are excluded.
+    Without tables and content controls, the paragraphs are the
+    ``<w:p>`` children of *element*, found without the ancestor counts.
+    """
+    if not include_tables:
+        ps = list(element.iterchildren(_P, _SDT))
+        if all(p.tag == _P for p in ps):
+            return ps
+    return _p_xpaths[bool(include_tables)](
+        element, ps=_ancestor_p_count_xpath(element),
+        tbls=_ancestor_tbl_count_xpath(element)
+    )
+
+
+def _expander(repl):
+    """
+    Return a function of a match object producing its replacement, *repl*
+    itself when it is callable or else the expansion of template *repl*.
+    """
+    if callable(repl):
+        return repl
+    return lambda match: match.expand(repl)
+
+
+def _normalize_runs_in(parent):
+    """
+    Merge the mergeable ``<w:r>`` children of *parent* into the run before
+    them and compact the ``<w:t>`` elements of each run, removing each
+    ``<w:proofErr>`` child, as described for :meth:`CT_P.normalize_runs`.
+    Return the number of elements removed.
+    """
+    removed = 0
+    prev_r = prev_key = None
+    for child in list(parent):
+        tag = child.tag
+        if tag == _PROOF_ERR:
+            parent.remove(child)
+            removed += 1
+            continue
+        key = _run_merge_key(child) if tag == _R else None
+        if key is not None and key == prev_key:
+            prev_r.extend([c for c in child if c.tag != _R_PR])
+            parent.remove(child)
+            removed += 1
+            continue
+        if prev_r is not None:
+            removed += _compact_t_elements(prev_r)
+            prev_r = prev_key = None
+        if key is not None:
+            prev_r, prev_key = child, key
+        elif tag == _R:
+            removed += _compact_t_elements(child)
+    if prev_r is not None:
+        removed += _compact_t_elements(prev_r)
+    return removed
+
+
+def _replace_span(content, starts, start, end, text):
+    """
+    Replace the paragraph text from offset *start* to *end* with *text*.
+    *content* holds the run content elements making up the paragraph text,
+    each beginning at the offset in the matching item of *starts*. *text*
+    goes into the first ``<w:t>`` element of the span, or a new one inserted
+    before its first tab or break; a ``<w:t>`` element left empty is
+    removed, as is each tab or break in the span, and then each run left
+    with no content but its ``<w:rPr>``.
+    """
+    pending = text
+    rs = []
+    for idx in range(bisect_right(starts, start) - 1, len(content)):
+        offset = starts[idx]
+        if offset >= end:
+            break
+        elm = content[idx]
+        r = elm.getparent()
+        if not rs or rs[-1] is not r:
+            rs.append(r)
+        if elm.tag != _T:
+            if pending:
+                t = elm.makeelement(_T)
+                elm.addprevious(t)
+                _set_t_text(t, '', pending, '')
+            pending = None
+            r.remove(elm)
+            continue
+        old_text = elm.text or ''
+        _set_t_text(
+            elm, old_text[:max(start - offset, 0)], pending or '',
+            old_text[end - offset:]
+        )
+        pending = None
+    for r in rs:
+        if all(child.tag == _R_PR for child in r):
+            r.getparent().remove(r)
+
+
+def _search_nonempty(regex, string, pos):
+    """
+    Return the first non-empty match of *regex* in *string* beginning at or
+    after *pos*, or |None| if there is none.
+    """
+    while pos <= len(string):
+        match = regex.search(string, pos)
+        if match is None or match.end() > match.start():
+            return match
+        pos = match.start() + 1
+    return None
+
+
+def _set_t_text(t, head, text, tail):
+    """
+    Set the text of *t* to *head*, *text* and *tail* joined, removing *t*
+    if that is empty. Each tab or line-break character in *text* becomes
+    a ``<w:tab/>`` or ``<w:br/>`` element after *t*, as assigning
+    |Run.text| would, with any text following it in a new ``<w:t>``.
+    """
+    pieces = _run_content_re.split(text)
+    pieces[0] = head + pieces[0]
+    pieces[-1] += tail
+    anchor = t
+    for idx, piece in enumerate(pieces[1:], 1):
+        if idx % 2:
+            new_elm = t.makeelement(_RUN_CONTENT_TAGS[piece])
+        elif piece:
+            new_elm = t.makeelement(_T)
+            _set_text_preserving_space(new_elm, piece)
+        else:
+            continue
+        anchor.addnext(new_elm)
+        anchor = new_elm
+    if pieces[0]:
+        _set_text_preserving_space(t, pieces[0])
+    else:
+        t.getparent().remove(t)
+
+
+def _set_text_preserving_space(t, text):
+    """
+    Set the text of ``<w:t>`` element *t* to *text*, marking it to preserve
+    edge whitespace when *text* has any.
+    """
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(_XML_SPACE, 'preserve')
+
+
+def _run_merge_key(r):
+    """
+    Return a key equal for runs having the same run properties, or |None|
+    when *r* has content that must stay in its own run, like a drawing or
+    field character. The key holds the tag and sorted attributes of each
+    property, and the serialized XML of any property having children.
+    """
+    rPr = None
+    for child in r:
+        tag = child.tag
+        if tag == _R_PR:
+            rPr = child
+        elif tag not in _MERGEABLE_RUN_CONTENT:
+            return None
+    if rPr is None:
+        return ()
+    return tuple(
+        (prop.tag, sorted(prop.attrib.items()),
+         etree.tostring(prop) if len(prop) else None)
+        for prop in rPr
+    )
+
+
+class _RegexSet(object):
+    """
+    Compiled regular expressions searched for together, each on its own so
+    its groups, backreferences, lookaround and inline flags behave as they
+    do when it is used alone. Provides the :meth:`finditer` method
+    :meth:`CT_P.sub` calls on a compiled regular expression.
+    """
+
+    def __init__(self, regexes):
+        self._regexes = regexes
+
+    def finditer(self, string):
+        """
+        Generate the non-empty matches of the regular expressions of this set
+        in *string*, left to right and not overlapping. Where matches begin
+        at the same position, the one of the first regular expression is
+        taken. Each regular expression is searched again only when its next
+        match overlaps one already generated.
+        """
+        regexes = self._regexes
+        matches = [_search_nonempty(regex, string, 0) for regex in regexes]
+        pos = 0
+        while True:
+            first = None
+            for idx, match in enumerate(matches):
+                if match is not None and match.start() < pos:
+                    match = matches[idx] = _search_nonempty(
+                        regexes[idx], string, pos
+                    )
+                if match is None:
+                    continue
+                if first is None or match.start() < first.start():
+                    first = match
+            if first is None:
+                return
+            yield first
+            pos = first.end()
@@ -4,6 +4,12 @@
 Custom element classes related to text runs (CT_R).
 """
 
+import re
+
+from copy import deepcopy
+
+from lxml import etree
+
 from ..ns import qn
 from ..simpletypes import ST_BrClear, ST_BrType
 from ..xmlchemy import (
@@ -11,6 +17,27 @@ from ..xmlchemy import (
 )
 
 
+# ---Clark names used in per-child loops, computed once rather than by a call
+# ---to qn() for each child visited
+_T = qn('w:t')
+_TAB = qn('w:tab')
+_BR = qn('w:br')
+_CR = qn('w:cr')
+_XML_SPACE = qn('xml:space')
+_R_PR = qn('w:rPr')
+
+# ---text equivalent of each run content element other than <w:t>
+_RUN_CONTENT_TEXT = {_TAB: '\t', _BR: '\n', _CR: '\n'}
+
+# ---run content element each tab, carriage return and line feed character
+# ---is translated to
+_RUN_CONTENT_TAGS = {'\t': _TAB, '\r': _BR, '\n': _BR}
+
+# ---splits text into runs of regular characters and single tab, carriage
+# ---return and line feed characters
+_run_content_re = re.compile('([\t\r\n])')
+
+
 class CT_Br(BaseOxmlElement):
     """
     ``<w:br>`` element, indicating a line, page, or column break in a run.
@@ -40,7 +67,7 @@ class CT_R(BaseOxmlElement):
         """
         t = self._add_t(text=text)
         if len(text.strip()) < len(text):
-            t.set(qn('xml:space'), 'preserve')
+            t.set(_XML_SPACE, 'preserve')
         return t
 
     def add_drawing(self, inline_or_anchor):
@@ -60,6 +87,39 @@ class CT_R(BaseOxmlElement):
         for child in content_child_elms:
             self.remove(child)
 
+    def replace_text(self, text):
+        """
+        Replace the content of this run with *text*, as assigning
+        :attr:`text` does, keeping the ``<w:rPr>`` element. When the run
+        contains a single ``<w:t>`` element and *text* has no tab or line
+        break characters, only the text of that element is rewritten.
+        """
+        content = [child for child in self if child.tag != _R_PR]
+        if (
+            len(content) != 1 or content[0].tag != _T or not text or
+            '\t' in text or '\n' in text or '\r' in text
+        ):
+            self.text = text
+            return
+        t = content[0]
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(_XML_SPACE, 'preserve')
+        elif _XML_SPACE in t.attrib:
+            del t.attrib[_XML_SPACE]
+
+    def update_rPr(self, prototype):
+        """
+        Set the run properties in *prototype*, a ``<w:rPr>`` element, on this
+        run as :meth:`CT_RPr.update` does. A run having no ``<w:rPr>`` child
+        gets a copy of *prototype*.
+        """
+        rPr = self.rPr
+        if rPr is None:
+            self._insert_rPr(deepcopy(prototype))
+            return
+        rPr.update(prototype)
+
     @property
     def style(self):
         """
@@ -87,16 +147,17 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
+        text_of = _RUN_CONTENT_TEXT.get
+        parts = []
+        for child in self.iterchildren(_T, _TAB, _BR, _CR):
+            tag = child.tag
+            if tag == _T:
                 t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-        return text
+                if t_text:
+                    parts.append(t_text)
+            else:
+                parts.append(text_of(tag))
+        return ''.join(parts)
 
     @text.setter
     def text(self, text):
@@ -117,11 +178,10 @@ class _RunContentAppender(object):
     sequences of regular characters are appended in a single ``<w:t>``
     element. Each tab character ('\t') causes a ``<w:tab/>`` element to be
     appended. Likewise a newline or carriage return character ('\n', '\r')
-    causes a ``<w:cr>`` element to be appended.
+    causes a ``<w:br/>`` element to be appended.
     """
     def __init__(self, r):
         self._r = r
-        self._bfr = []
 
     @classmethod
     def append_to_run_from_text(cls, r, text):
@@ -136,31 +196,20 @@ class _RunContentAppender(object):
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
-        ``<w:r>`` element of this instance.
-        """
-        for char in text:
-            self.add_char(char)
-        self.flush()
-
-    def add_char(self, char):
-        """
-        Process the next character of input through the translation finite
-        state maching (FSM). There are two possible states, buffer pending
-        and not pending, but those are hidden behind the ``.flush()`` method
-        which must be called at the end of text to ensure any pending
-        ``<w:t>`` element is written.
-        """
-        if char == '\t':
-            self.flush()
-            self._r.add_tab()
-        elif char in '\r\n':
-            self.flush()
-            self._r.add_br()
-        else:
-            self._bfr.append(char)
-
-    def flush(self):
-        text = ''.join(self._bfr)
-        if text:
-            self._r.add_t(text)
-        del self._bfr[:]
+        ``<w:r>`` element of this instance. The text is split on tab and
+        line break characters with a regular expression and each element is
+        created directly as a child of the run, rather than the text being
+        processed one character at a time.
+        """
+        r, SubElement = self._r, etree.SubElement
+        for segment in _run_content_re.split(text):
+            if not segment:
+                continue
+            tag = _RUN_CONTENT_TAGS.get(segment)
+            if tag is not None:
+                SubElement(r, tag)
+                continue
+            t = SubElement(r, _T)
+            t.text = segment
+            if len(segment.strip()) < len(segment):
+                t.set(_XML_SPACE, 'preserve')
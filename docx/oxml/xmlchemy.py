@@ -17,6 +17,10 @@ from docx.oxml.exceptions import InvalidXmlError
 from docx.oxml.ns import NamespacePrefixedTag, nsmap, qn
 from docx.shared import lazyproperty
 
+# ---most successor tags BaseOxmlElement.insert_element_before_tags() searches
+# ---for one by one; a longer list is matched in one pass over the children
+_FIND_TAG_LIMIT = 3
+
 
 def serialize_for_reading(element):
     """
@@ -157,8 +161,10 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 return self._default
             return self._simple_type.from_xml(attr_str_value)
@@ -184,13 +190,15 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def set_attr_value(obj, value):
             if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
             str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -209,8 +217,10 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
@@ -237,9 +247,11 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def set_attr_value(obj, value):
             str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -307,9 +319,10 @@ class _BaseChildElement(object):
         Add an ``_insert_x()`` method to the element class for this child
         element.
         """
+        successor_tags = tuple(qn(tagname) for tagname in self._successors)
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
-            return child
+            return obj.insert_element_before_tags(child, successor_tags)
 
         _insert_child.__doc__ = (
             'Return the passed ``<%s>`` element after inserting it as a chil'
@@ -371,8 +384,14 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        tagname = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            # ---same search as obj.find(tagname), without the overhead of
+            # ---lxml's ElementPath machinery on this frequently used path
+            for child in obj.iterchildren(tagname):
+                return child
+            return None
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -389,8 +408,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        tagname = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(tagname)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -507,8 +528,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        tagname = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(tagname)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -714,11 +737,39 @@ class _OxmlElementBase(etree.ElementBase):
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
-        if successor is not None:
-            successor.addprevious(elm)
-        else:
+        """
+        Insert *elm* as a child of this element, before the first child
+        having a tag in *tagnames*, or last when there is no such child.
+        """
+        return self.insert_element_before_tags(
+            elm, tuple(qn(tagname) for tagname in tagnames)
+        )
+
+    def insert_element_before_tags(self, elm, clark_names):
+        """
+        Insert *elm* before the first child having a tag in *clark_names*,
+        a sequence of Clark-notation tags, or last when there is no such
+        child. A long list of tags, as for a child of a properties element,
+        which has few children, is matched in a single pass over the
+        children. Otherwise each tag is searched for in turn with a `find()`
+        call, which scans the children in C, so inserting before the
+        ``<w:sectPr>`` of a ``<w:body>`` holding many paragraphs does not
+        visit each of them in Python. Callers inserting many elements
+        compute *clark_names* once.
+        """
+        if len(clark_names) > _FIND_TAG_LIMIT:
+            for child in self.iterchildren():
+                if child.tag in clark_names:
+                    child.addprevious(elm)
+                    return elm
             self.append(elm)
+            return elm
+        for clark_name in clark_names:
+            successor = self.find(clark_name)
+            if successor is not None:
+                successor.addprevious(elm)
+                return elm
+        self.append(elm)
         return elm
 
     def remove_all(self, *tagnames):
@@ -103,12 +103,29 @@ class DocumentPart(BaseStoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, normalize_namespaces=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. See
+        :meth:`.Document.save` for *normalize_namespaces*.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, normalize_namespaces)
+
+    def new_effective_p(self, p):
+        """
+        Return a new, detached `w:p` element whose `w:pPr` child holds the
+        effective paragraph properties of *p*, resolved against the styles
+        of this document.
+        """
+        return self._styles_part.element.new_effective_p(p)
+
+    def new_effective_r(self, r):
+        """
+        Return a new, detached `w:r` element whose `w:rPr` child holds the
+        effective run properties of *r*, resolved against the styles of this
+        document.
+        """
+        return self._styles_part.element.new_effective_r(r)
 
     @property
     def settings(self):
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
-from docx.shared import lazyproperty
+from docx.shared import lazyproperty, ProxyCache
 
 
 class BaseStoryPart(XmlPart):
@@ -18,6 +18,27 @@ class BaseStoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    _proxy_cache = None
+
+    def disable_proxy_cache(self):
+        """Stop caching proxy objects for the content of this part.
+
+        Any proxies already cached are released.
+        """
+        self._proxy_cache = None
+
+    def enable_proxy_cache(self):
+        """Cache the proxy objects created for the content of this part.
+
+        While enabled, proxy objects such as |Paragraph|, |Run|, |Table| and |_Cell|
+        are created once per XML element and then reused, so repeated traversals of
+        the same content return the same objects instead of allocating new ones. The
+        cached proxies (and their elements) stay alive until the cache is disabled.
+        Has no effect if the cache is already enabled.
+        """
+        if self._proxy_cache is None:
+            self._proxy_cache = ProxyCache()
+
     def get_or_add_image(self, image_descriptor):
         """Return (rId, image) pair for image identified by *image_descriptor*.
 
@@ -58,6 +79,22 @@ class BaseStoryPart(XmlPart):
         shape_id, filename = self.next_id, image.filename
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
+    def new_effective_p(self, p):
+        """Return a new, detached `w:p` element holding the effective properties of *p*.
+
+        Its `w:pPr` child is the paragraph properties of *p* resolved against the styles
+        of this document.
+        """
+        return self._document_part.new_effective_p(p)
+
+    def new_effective_r(self, r):
+        """Return a new, detached `w:r` element holding the effective properties of *r*.
+
+        Its `w:rPr` child is the run properties of *r* resolved against the styles of
+        this document.
+        """
+        return self._document_part.new_effective_r(r)
+
     @property
     def next_id(self):
         """Next available positive integer id value in this story XML document.
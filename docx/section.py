@@ -17,6 +17,8 @@ class Sections(Sequence):
     Supports ``len()``, iteration, and indexed access.
     """
 
+    __slots__ = ('_document_elm', '_document_part')
+
     def __init__(self, document_elm, document_part):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -28,6 +30,13 @@ class Sections(Sequence):
                 Section(sectPr, self._document_part)
                 for sectPr in self._document_elm.sectPr_lst[key]
             ]
+        if key == -1:
+            # ---the last section, as used to find the width available for
+            # ---new content, is found without searching the whole document
+            sectPr = self._document_elm.last_sectPr
+            if sectPr is None:
+                raise IndexError('list index out of range')
+            return Section(sectPr, self._document_part)
         return Section(self._document_elm.sectPr_lst[key], self._document_part)
 
     def __iter__(self):
@@ -44,6 +53,8 @@ class Section(object):
     Also provides access to headers and footers.
     """
 
+    __slots__ = ('_sectPr', '_document_part', '_footer', '_header')
+
     def __init__(self, sectPr, document_part):
         super(Section, self).__init__()
         self._sectPr = sectPr
@@ -263,6 +274,8 @@ class Section(object):
 class _BaseHeaderFooter(BlockItemContainer):
     """Base class for header and footer classes"""
 
+    __slots__ = ('_sectPr', '_document_part', '_hdrftr_index')
+
     def __init__(self, sectPr, document_part, header_footer_index):
         self._sectPr = sectPr
         self._document_part = document_part
@@ -322,6 +335,11 @@ class _BaseHeaderFooter(BlockItemContainer):
         """`w:hdr` or `w:ftr` element, root of header/footer part."""
         return self._get_or_add_definition().element
 
+    @property
+    def _proxy_cache(self):
+        """|ProxyCache| of the header/footer part, or None if not enabled."""
+        return self._get_or_add_definition()._proxy_cache
+
     def _get_or_add_definition(self):
         """Return HeaderPart or FooterPart object for this section.
 
@@ -366,6 +384,8 @@ class _Footer(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added footer part."""
         footer_part, rId = self._document_part.add_footer_part()
@@ -409,6 +429,8 @@ class _Header(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added header part."""
         header_part, rId = self._document_part.add_header_part()
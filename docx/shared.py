@@ -6,6 +6,15 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import operator
+
+from collections import Sequence
+from itertools import islice, repeat
+
+from lxml import etree
+
+from .compat import imap
+
 
 class Length(int):
     """
@@ -253,6 +262,9 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent',)
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
@@ -263,3 +275,140 @@ class Parented(object):
         The package part containing this object
         """
         return self._parent.part
+
+    def _get_proxy(self, element, proxy_cls):
+        """
+        Return a *proxy_cls* instance wrapping *element* and having this
+        object as its parent. The proxy is reused from the proxy cache of the
+        containing part when that part has one enabled.
+        """
+        cache = self._proxy_cache
+        if cache is None:
+            return proxy_cls(element, self)
+        return cache.get(element, proxy_cls, self)
+
+    def _proxies_for(self, elements, proxy_cls):
+        """
+        Return a list containing a *proxy_cls* instance for each element in
+        *elements*, each having this object as its parent. The proxy cache
+        of the containing part is looked up once rather than per element.
+        """
+        cache = self._proxy_cache
+        if cache is None:
+            return [proxy_cls(element, self) for element in elements]
+        return [cache.get(element, proxy_cls, self) for element in elements]
+
+    @property
+    def _proxy_cache(self):
+        """
+        The |ProxyCache| of the part containing this object, or |None| if
+        that part has no proxy cache enabled.
+        """
+        return getattr(self._parent, '_proxy_cache', None)
+
+
+class ProxyList(Sequence):
+    """
+    Lazy sequence of proxy objects for the child elements of *element*
+    having the tag *nsptag*, e.g. ``'w:p'``.
+
+    Supports ``len()``, iteration, indexed access and slicing. Each proxy is
+    created when it is accessed, with *parent* as its parent, so ``len()``
+    and access to a single item such as ``[-1]`` do not construct a proxy
+    for every child. The view is live; items added to or removed from
+    *element* are reflected immediately, except by an iteration already
+    under way, which visits the items present when it started.
+    """
+
+    __slots__ = ('_element', '_nsptag', '_proxy_cls', '_parent')
+
+    _counters = {}
+
+    def __init__(self, element, nsptag, proxy_cls, parent):
+        super(ProxyList, self).__init__()
+        self._element = element
+        self._nsptag = nsptag
+        self._proxy_cls = proxy_cls
+        self._parent = parent
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._parent._proxies_for(
+                list(self._iter_elements())[key], self._proxy_cls
+            )
+        key = operator.index(key)
+        if key < 0:
+            elements = self._iter_elements(reverse=True)
+            key = -key - 1
+        else:
+            elements = self._iter_elements()
+        element = next(islice(elements, key, None), None)
+        if element is None:
+            raise IndexError('index out of range')
+        return self._parent._get_proxy(element, self._proxy_cls)
+
+    def __iter__(self):
+        proxy_cls, parent = self._proxy_cls, self._parent
+        # ---snapshot the children so adding one while iterating terminates---
+        elements = list(self._iter_elements())
+        cache = parent._proxy_cache
+        if cache is None:
+            return imap(proxy_cls, elements, repeat(parent))
+        return imap(cache.get, elements, repeat(proxy_cls), repeat(parent))
+
+    def __len__(self):
+        count = self._counters.get(self._nsptag)
+        if count is None:
+            from docx.oxml.ns import nsmap
+            count = self._counters[self._nsptag] = etree.XPath(
+                'count(%s)' % self._nsptag, namespaces=nsmap
+            )
+        return int(count(self._element))
+
+    def _iter_elements(self, reverse=False):
+        """
+        Generate each child element of the wrapped element having the tag of
+        this sequence, last to first when *reverse* is |True|.
+        """
+        from docx.oxml.ns import qn
+        return self._element.iterchildren(qn(self._nsptag), reversed=reverse)
+
+
+class ProxyCache(object):
+    """
+    Mapping from oxml element to the proxy object wrapping it.
+
+    Enabled on a part with :meth:`.BaseStoryPart.enable_proxy_cache`, it allows
+    repeated traversals of the same content (``paragraphs``, ``runs``,
+    ``rows``, ``cells``, etc.) to return the proxy objects created on the
+    first traversal rather than allocating new ones each time. A proxy keeps
+    the parent it was first created with. The cache holds each element and
+    its proxy strongly, including elements since removed from the document,
+    so entries live as long as the cache itself; disable or clear the cache
+    to release them.
+    """
+
+    __slots__ = ('_proxies',)
+
+    def __init__(self):
+        super(ProxyCache, self).__init__()
+        self._proxies = {}
+
+    def __len__(self):
+        return len(self._proxies)
+
+    def clear(self):
+        """
+        Remove all cached proxies.
+        """
+        self._proxies.clear()
+
+    def get(self, element, proxy_cls, parent):
+        """
+        Return the cached *proxy_cls* instance for *element*, first creating
+        it with *parent* when no proxy of that type is cached for *element*.
+        """
+        proxy = self._proxies.get(element)
+        if proxy is None or type(proxy) is not proxy_cls:
+            proxy = self._proxies[element] = proxy_cls(element, parent)
+        return proxy
@@ -140,6 +140,7 @@ class BaseStyle(ElementProxy):
 
     @style_id.setter
     def style_id(self, value):
+        self._element.bump_styles_version()
         self._element.styleId = value
 
     @property
@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from warnings import warn
 
+from docx.instrument import instrumented
 from docx.shared import ElementProxy
 from docx.styles import BabelFish
 from docx.styles.latent import LatentStyles
@@ -82,6 +83,7 @@ class Styles(ElementProxy):
             return None
         return StyleFactory(style)
 
+    @instrumented('Styles.get_by_id')
     def get_by_id(self, style_id, style_type):
         """Return the style of *style_type* matching *style_id*.
 
@@ -92,6 +94,7 @@ class Styles(ElementProxy):
             return self.default(style_type)
         return self._get_by_id(style_id, style_type)
 
+    @instrumented('Styles.get_style_id')
     def get_style_id(self, style_or_name, style_type):
         """
         Return the id of the style corresponding to *style_or_name*, or
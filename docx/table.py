@@ -6,19 +6,34 @@ The |Table| object and related proxy classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from copy import deepcopy
+
 from .blkcntnr import BlockItemContainer
+from .compat import is_string, Unicode
 from .enum.style import WD_STYLE_TYPE
 from .oxml.simpletypes import ST_Merge
+from .oxml.table import CT_Tc
 from .shared import Inches, lazyproperty, Parented
 
+# ---cell properties accepted by Table.set_cell_props(), each mapped to the
+# ---corresponding property of the ``<w:tcPr>`` element
+_TC_PR_PROPS = {'vertical_alignment': 'vAlign_val', 'width': 'width'}
+
 
 class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+
+    __slots__ = (
+        '_element', '_tbl', '_columns', '_rows', '_cell_grid', '_tr_idxs',
+        '_tr_prototype'
+    )
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
+        self._cell_grid = self._tr_idxs = self._tr_prototype = None
 
     def add_column(self, width):
         """
@@ -31,18 +46,24 @@ class Table(Parented):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
-        return _Column(gridCol, self)
+        return self._get_proxy(gridCol, _Column)
 
     def add_row(self):
         """
         Return a |_Row| instance, newly added bottom-most to the table.
         """
-        tbl = self._tbl
-        tr = tbl.add_tr()
-        for gridCol in tbl.tblGrid.gridCol_lst:
-            tc = tr.add_tc()
-            tc.width = gridCol.w
-        return _Row(tr, self)
+        return self._get_proxy(self._append_tr(), _Row)
+
+    def add_rows(self, count):
+        """
+        Return a list of *count* |_Row| instances, newly added bottom-most to
+        the table. Each row has a cell for each grid column, having the width
+        of that column. Rows are copied from a prototype row built once and
+        reused while the columns of the table are unchanged, so the time
+        taken is proportional to *count*.
+        """
+        trs = [self._append_tr() for _ in range(count)]
+        return self._proxies_for(trs, _Row)
 
     @property
     def alignment(self):
@@ -58,6 +79,27 @@ class Table(Parented):
     def alignment(self, value):
         self._tblPr.alignment = value
 
+    def append_row(self, values):
+        """
+        Return a |_Row| instance, newly added bottom-most to the table, its
+        cells containing the text of *values*, taken left to right. Values
+        are converted to text as by :meth:`fill`; cells beyond those in
+        *values* are left empty. Like :meth:`add_rows`, the row is copied
+        from a cached prototype, making this suitable for streaming a large
+        number of rows into a table. Raises |ValueError| if there are more
+        values than the table has columns.
+        """
+        texts = [_cell_text(value) for value in values]
+        col_count = len(self._tr_prototype_for_grid())
+        if len(texts) > col_count:
+            raise ValueError(
+                'row of %d values exceeds table of %d columns'
+                % (len(texts), col_count)
+            )
+        tr = self._append_tr()
+        tr.fill(texts)
+        return self._get_proxy(tr, _Row)
+
     @property
     def autofit(self):
         """
@@ -78,7 +120,36 @@ class Table(Parented):
         *col_idx* intersection, where (0, 0) is the top, left-most cell.
         """
         cell_idx = col_idx + (row_idx * self._column_count)
-        return self._cells[cell_idx]
+        return self._grid_cells(row_idx)[cell_idx]
+
+    def clone(self, after=None, rows=None):
+        """
+        Return a |Table| object for a copy of this table, newly added after
+        the paragraph or table *after*, or at the end of the container of
+        this table when *after* is |None|. The copy has the style, table,
+        row and cell properties and content of this table. When *rows* is
+        not |None|, the copy has that many rows; rows beyond it are dropped
+        and missing rows are added, each a copy of the last row with its
+        cells emptied, keeping their cell and paragraph properties. Raises
+        |ValueError| when *rows* is less than 1. The ``<w:tbl>`` element is
+        copied as a single tree, making this much faster than building and
+        formatting a similar table cell by cell. The copy must stay in the
+        same document, so the styles it uses are defined. When the copy
+        would be the last element in a table cell, an empty paragraph is
+        added after it, as Word requires a paragraph element as the last
+        element in every cell.
+        """
+        tbl = self._tbl.copy(rows)
+        if after is None:
+            self._tbl.getparent()._insert_tbl(tbl)
+            parent = self._parent
+        else:
+            after._element.addnext(tbl)
+            parent = after._parent
+        tc = tbl.getparent()
+        if isinstance(tc, CT_Tc) and tbl.getnext() is None:
+            tc.add_p()
+        return Table(tbl, parent)
 
     def column_cells(self, column_idx):
         """
@@ -96,6 +167,87 @@ class Table(Parented):
         """
         return _Columns(self._tbl, self)
 
+    def fill(self, rows):
+        """
+        Replace the text of the cells of this table with the values in
+        *rows*, an iterable of rows each an iterable of cell values. *rows*
+        can be a list of lists, a generator, or a 2-D array-like object
+        having a ``tolist()`` method, such as a NumPy array. Values that are
+        not strings are converted with ``str()``, except |None|, which
+        produces an empty cell. Rows are added to the table as required;
+        cells and rows beyond those in *rows* are left unchanged. Values are
+        assigned to the cells of a row left to right, a horizontally merged
+        cell taking a single value. A cell continuing a vertical merge,
+        which Word does not display, takes a value too but is left
+        unchanged, so that value must be empty or |None|. Each filled cell
+        is left with a single paragraph containing its text, its cell
+        properties are preserved. Raises |ValueError|, before changing any
+        cell, if a row has more values than the corresponding row of the
+        table has cells, or than the table has columns for a row to be
+        added, or if a value for a vertically merged continuation cell is
+        not empty.
+        """
+        text_rows = _text_rows(rows)[0]
+        tr_lst = self._tbl.tr_lst
+        continuation_tcs = self._tbl.vMerge_continuation_tcs()
+        for row_idx, (texts, tr) in enumerate(zip(text_rows, tr_lst)):
+            tcs = tr.tc_lst
+            if len(texts) > len(tcs):
+                raise ValueError(
+                    'row %d of %d values exceeds table row of %d cells'
+                    % (row_idx, len(texts), len(tcs))
+                )
+            if not continuation_tcs:
+                continue
+            for cell_idx, (tc, text) in enumerate(zip(tcs, texts)):
+                if text and tc in continuation_tcs:
+                    raise ValueError(
+                        'row %d value %d is for a vertically merged cell'
+                        % (row_idx, cell_idx)
+                    )
+        if len(text_rows) > len(tr_lst):
+            col_count = self._column_count
+            for row_idx in range(len(tr_lst), len(text_rows)):
+                if len(text_rows[row_idx]) > col_count:
+                    raise ValueError(
+                        'row %d of %d values exceeds table row of %d cells'
+                        % (row_idx, len(text_rows[row_idx]), col_count)
+                    )
+        for _ in range(len(text_rows) - len(tr_lst)):
+            self.add_row()
+        self._tbl.fill(text_rows)
+
+    def iter_values(self):
+        """
+        Generate a list for each row of this table, top to bottom, containing
+        the text of the cell at each column, as `cell.text` would produce it.
+        A merged cell provides its text for each grid position it covers,
+        consistent with `row_cells()`. The rows are read in a single pass
+        without creating a |_Cell| object for each cell, making this much
+        faster than reading the text of each cell in turn.
+        """
+        return self._tbl.iter_row_texts()
+
+    def merge_regions(self, regions):
+        """
+        Merge each of the rectangular *regions* of this table and return
+        a list containing the merged |_Cell| object for each. Each region is
+        a pair of ``(row_idx, col_idx)`` grid positions naming diagonally
+        opposite corner cells, as for ``table.cell(*a).merge(table.cell(*b))``.
+        Regions are merged in order, so positions refer to the grid as
+        changed by the merges before them. Faster than merging cells one by
+        one, because the cell grid is not rebuilt after each merge. Raises
+        |InvalidSpanError| if a region is not rectangular.
+        """
+        tbl = self._tbl
+        merged_tcs = []
+        for (row_idx, col_idx), (row_idx_2, col_idx_2) in regions:
+            geometry = tbl.geometry
+            tc = geometry.merge_origin_tc(row_idx, col_idx)
+            tc_2 = geometry.merge_origin_tc(row_idx_2, col_idx_2)
+            merged_tcs.append(tc.merge(tc_2))
+        return [self._get_proxy(tc, _Cell) for tc in merged_tcs]
+
     def row_cells(self, row_idx):
         """
         Sequence of cells in the row at *row_idx* in this table.
@@ -103,7 +255,7 @@ class Table(Parented):
         column_count = self._column_count
         start = row_idx * column_count
         end = start + column_count
-        return self._cells[start:end]
+        return self._grid_cells(row_idx)[start:end]
 
     @lazyproperty
     def rows(self):
@@ -112,6 +264,35 @@ class Table(Parented):
         """
         return _Rows(self._tbl, self)
 
+    def set_cell_props(self, rows=None, cols=None, **props):
+        """
+        Assign cell properties to the cells of this table in the rows
+        selected by the slice *rows* and beginning in a column selected by
+        the slice *cols*; all rows or columns are selected when |None|.
+        *props* are keyword arguments naming any of the `vertical_alignment`
+        and `width` properties of |_Cell|, e.g.
+        ``table.set_cell_props(cols=slice(0, 1), width=Inches(1))``. Each
+        value is assigned as it would be to the property of each cell, but
+        in a single pass over the rows without a |_Cell| object for each
+        cell. The continuation cells of a vertically merged cell are
+        included when their row is selected. Raises |TypeError| on a keyword
+        argument naming another property.
+        """
+        tcPr_props = []
+        for name, value in props.items():
+            if name not in _TC_PR_PROPS:
+                raise TypeError(
+                    "set_cell_props() got an unexpected keyword argument "
+                    "'%s'" % name
+                )
+            tcPr_props.append((_TC_PR_PROPS[name], value))
+        rows = slice(None) if rows is None else rows
+        cols = slice(None) if cols is None else cols
+        for tc in self._tbl.iter_tcs_in(rows, cols):
+            tcPr = tc.get_or_add_tcPr()
+            for name, value in tcPr_props:
+                setattr(tcPr, name, value)
+
     @property
     def style(self):
         """
@@ -158,14 +339,55 @@ class Table(Parented):
     def table_direction(self, value):
         self._element.bidiVisual_val = value
 
+    def to_rows(self, by_column=False):
+        """
+        Return the text of the cells of this table as a list of rows, each
+        a list of the text of the cell at each column, as generated by
+        :meth:`iter_values`. When *by_column* is |True|, a list of columns,
+        each a list of the text of the cell in each row, is returned instead;
+        a row having fewer cells than the widest row is padded with empty
+        strings.
+        """
+        rows = list(self.iter_values())
+        if not by_column:
+            return rows
+        col_count = max([len(row) for row in rows]) if rows else 0
+        return [
+            [row[col_idx] if col_idx < len(row) else '' for row in rows]
+            for col_idx in range(col_count)
+        ]
+
     @property
     def _cells(self):
         """
         A sequence of |_Cell| objects, one for each cell of the layout grid.
         If the table contains a span, one or more |_Cell| object references
         are repeated.
+
+        The grid is computed once and reused until the layout of the table
+        changes, as described for :meth:`_grid_cells`. This makes `cell()` a
+        constant-time lookup.
+        """
+        return self._grid_cells()
+
+    def _append_tr(self):
+        """
+        Return a ``<w:tr>`` element newly appended to this table, a copy of
+        the prototype row for the current table columns.
+        """
+        tbl = self._tbl
+        prototype = self._tr_prototype_for_grid()
+        tr = tbl._insert_tr(deepcopy(prototype))
+        self._tr_prototype = (tbl.grid_version, prototype)
+        return tr
+
+    def _build_cells(self):
+        """
+        Return a newly-built list of |_Cell| objects, one for each cell of
+        the layout grid, as described for :attr:`_cells`.
         """
         col_count = self._column_count
+        cache = self._proxy_cache
         cells = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -173,10 +395,55 @@ class Table(Parented):
                     cells.append(cells[-col_count])
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
-                else:
+                elif cache is None:
                     cells.append(_Cell(tc, self))
+                else:
+                    cells.append(cache.get(tc, _Cell, self))
         return cells
 
+    @property
+    def _grid_key(self):
+        """
+        Value identifying the current layout of this table, changing when
+        rows, cells or grid columns are added or removed or cells are
+        merged through this package or rows are added or removed directly
+        with lxml. Used to validate the cached cell grid and row indexes.
+        """
+        tbl = self._tbl
+        return (tbl.grid_version, len(tbl))
+
+    def _grid_cells(self, row_idx=None):
+        """
+        Return the cached list of |_Cell| objects for the layout grid, as
+        described for :attr:`_cells`, rebuilding it first when it is stale.
+        The cache is reused while `_grid_key` and the number of grid columns
+        are unchanged and the number of children of each row is what it was
+        when the grid was built, which catches cells added or removed
+        directly with lxml. When *row_idx* is not |None|, only the row at
+        *row_idx* is checked, so looking up a cell does not visit every row.
+        """
+        key = (self._grid_key, self._column_count)
+        cell_grid = self._cell_grid
+        if cell_grid is not None and cell_grid[0] == key:
+            row_sizes = cell_grid[2]
+            if row_idx is not None:
+                row_sizes = row_sizes[row_idx:row_idx + 1]
+            if all(len(tr) == size for tr, size in row_sizes):
+                return cell_grid[1]
+        cells = self._build_cells()
+        row_sizes = [(tr, len(tr)) for tr in self._tbl.tr_lst]
+        self._cell_grid = (key, cells, row_sizes)
+        return cells
+
+    def _iter_unique_cells(self):
+        """
+        Generate a |_Cell| object for each ``<w:tc>`` element in this table,
+        left to right and top to bottom, skipping the continuation cells of
+        vertically merged spans so each merged cell is generated once.
+        """
+        for _, _, tc in self._tbl.iter_cell_tcs():
+            yield self._get_proxy(tc, _Cell)
+
     @property
     def _column_count(self):
         """
@@ -188,10 +455,94 @@ class Table(Parented):
     def _tblPr(self):
         return self._tbl.tblPr
 
+    def _tr_cells(self, tr):
+        """
+        Return a list of |_Cell| objects, one for each grid column of *tr*,
+        as `row_cells()` would for the row of *tr*. When the cell grid is not
+        already cached, the cells are computed from *tr* and, for vertically
+        merged cells, the merge origins cached by the table geometry, without
+        building the whole grid.
+        """
+        cell_grid = self._cell_grid
+        if cell_grid is not None and cell_grid[0][0] == self._grid_key:
+            return self.row_cells(self._tr_idx(tr))
+        cells = []
+        for tc in tr.iter_grid_tcs():
+            if cells and cells[-1]._tc is tc:
+                cells.append(cells[-1])
+            else:
+                cells.append(self._get_proxy(tc, _Cell))
+        return cells
+
+    def _tr_idx(self, tr):
+        """
+        Return the index of *tr* among the rows of this table. The index of
+        each row is computed in a single pass and reused until the layout of
+        the table changes. Raises |ValueError| if *tr* is not a row of this
+        table.
+        """
+        tr_idxs = self._tr_idxs
+        if tr_idxs is None or tr_idxs[0] != self._grid_key:
+            tr_idxs = self._tr_idxs = (
+                self._grid_key,
+                dict((row, idx) for idx, row in enumerate(self._tbl.tr_lst))
+            )
+        try:
+            return tr_idxs[1][tr]
+        except KeyError:
+            raise ValueError('tr is not a row of this table')
+
+    def _tr_prototype_for_grid(self):
+        """
+        Return the cached ``<w:tr>`` element, not part of the table, that
+        rows added to this table are copied from. The prototype cells have
+        the widths of their grid columns, so it is rebuilt when the layout
+        of the table has been changed other than by appending rows or when
+        a column width has been set through this package, either of which
+        bumps the grid version. Only the grid version is checked; unlike
+        `_grid_key`, neither the rows nor the grid columns are counted,
+        because lxml visits every row to do that and appending rows one at
+        a time would be quadratic.
+        """
+        tbl = self._tbl
+        tr_prototype = self._tr_prototype
+        if tr_prototype is None or tr_prototype[0] != tbl.grid_version:
+            tr_prototype = self._tr_prototype = (
+                tbl.grid_version, tbl.new_tr()
+            )
+        return tr_prototype[1]
+
+
+def _cell_text(value):
+    """
+    Return the text of a cell having *value*; an empty string for |None|,
+    *value* itself if it is a string, and ``str(value)`` otherwise.
+    """
+    if value is None:
+        return ''
+    if is_string(value):
+        return value
+    return Unicode(value)
+
+
+def _text_rows(rows):
+    """
+    Return a (text_rows, col_count) 2-tuple for the table data in *rows*.
+    *text_rows* is a list of lists of text, one for each row, and
+    *col_count* is the length of the longest row.
+    """
+    if hasattr(rows, 'tolist'):
+        rows = rows.tolist()
+    text_rows = [[_cell_text(value) for value in row] for row in rows]
+    col_count = max([len(row) for row in text_rows]) if text_rows else 0
+    return text_rows, col_count
+
 
 class _Cell(BlockItemContainer):
     """Table cell"""
 
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = self._element = tc
@@ -222,6 +573,32 @@ class _Cell(BlockItemContainer):
         self.add_paragraph()
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=True):
+        """
+        Return a table newly added to this cell after any existing cell
+        content and populated from *rows*, as for
+        :meth:`.BlockItemContainer.add_table_from_rows`. The table has the
+        width of this cell, or 1 inch when that is not set. As for
+        :meth:`add_table`, an empty paragraph is added after the table.
+        """
+        width = self.width if self.width is not None else Inches(1)
+        table = super(_Cell, self).add_table_from_rows(
+            rows, width, style, header
+        )
+        self.add_paragraph()
+        return table
+
+    def insert_table_copy(self, table, rows=None):
+        """
+        Return a |Table| object for a copy of *table*, newly added to this
+        cell after any existing cell content, as for
+        :meth:`.BlockItemContainer.insert_table_copy`. As for
+        :meth:`add_table`, an empty paragraph is added after the table.
+        """
+        table = super(_Cell, self).insert_table_copy(table, rows)
+        self.add_paragraph()
+        return table
+
     def merge(self, other_cell):
         """
         Return a merged cell created by spanning the rectangular region
@@ -235,16 +612,34 @@ class _Cell(BlockItemContainer):
     @property
     def paragraphs(self):
         """
-        List of paragraphs in the cell. A table cell is required to contain
-        at least one block-level element and end with a paragraph. By
-        default, a new cell contains a single paragraph. Read-only
+        Sequence of paragraphs in the cell. A table cell is required to
+        contain at least one block-level element and end with a paragraph.
+        By default, a new cell contains a single paragraph. Read-only
         """
         return super(_Cell, self).paragraphs
 
+    def set_text(self, text, keep_formatting=True):
+        """
+        Replace the content of this cell with the string *text*. When
+        *keep_formatting* is |True|, the first paragraph of the cell and the
+        first run in it are reused, keeping their paragraph and character
+        formatting. All other content is removed, including hyperlinks and
+        content controls, while range marks like bookmarks are kept. Where
+        that run holds only text, just its ``<w:t>`` element is rewritten,
+        making this suited to filling the cells of a pre-formatted template
+        table. When *keep_formatting* is |False|, this is the same as
+        assigning :attr:`text`. Tab, newline and carriage return characters
+        in *text* are converted as they are for :attr:`text`.
+        """
+        if not keep_formatting:
+            self.text = text
+            return
+        self._tc.replace_text(text)
+
     @property
     def tables(self):
         """
-        List of tables in the cell, in the order they appear. Read-only.
+        Sequence of tables in the cell, in the order they appear. Read-only.
         """
         return super(_Cell, self).tables
 
@@ -255,7 +650,7 @@ class _Cell(BlockItemContainer):
         a string to this property replaces all existing content with a single
         paragraph containing the assigned text in a single run.
         """
-        return '\n'.join(p.text for p in self.paragraphs)
+        return self._tc.text
 
     @text.setter
     def text(self, text):
@@ -303,6 +698,9 @@ class _Column(Parented):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -331,7 +729,7 @@ class _Column(Parented):
 
     @width.setter
     def width(self, value):
-        self._gridCol.w = value
+        self._gridCol.set_width(value)
 
     @property
     def _index(self):
@@ -346,6 +744,9 @@ class _Columns(Parented):
     Sequence of |_Column| instances corresponding to the columns in a table.
     Supports ``len()``, iteration and indexed access.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
@@ -359,15 +760,32 @@ class _Columns(Parented):
         except IndexError:
             msg = "column index [%d] is out of range" % idx
             raise IndexError(msg)
-        return _Column(gridCol, self)
+        return self._get_proxy(gridCol, _Column)
 
     def __iter__(self):
-        for gridCol in self._gridCol_lst:
-            yield _Column(gridCol, self)
+        return iter(self._proxies_for(self._gridCol_lst, _Column))
 
     def __len__(self):
         return len(self._gridCol_lst)
 
+    def set_widths(self, widths):
+        """
+        Assign each width in *widths*, a length in EMU or |None|, to the
+        column at the same position, as assigning `width` of each column
+        would. Columns beyond those in *widths* are left unchanged. Cell
+        widths are not affected; use :meth:`Table.set_cell_props` to set
+        those. Raises |ValueError| if there are more widths than columns.
+        """
+        gridCol_lst = self._gridCol_lst
+        widths = list(widths)
+        if len(widths) > len(gridCol_lst):
+            raise ValueError(
+                '%d widths exceed table of %d columns'
+                % (len(widths), len(gridCol_lst))
+            )
+        for gridCol, width in zip(gridCol_lst, widths):
+            gridCol.set_width(width)
+
     @property
     def table(self):
         """
@@ -375,20 +793,32 @@ class _Columns(Parented):
         """
         return self._parent.table
 
+    @property
+    def widths(self):
+        """
+        List containing the width of each column in this table, left to
+        right, as `width` of each column would produce it.
+        """
+        return [gridCol.w for gridCol in self._gridCol_lst]
+
     @property
     def _gridCol_lst(self):
         """
         Sequence containing ``<w:gridCol>`` elements for this table, each
-        representing a table column.
+        representing a table column. The sequence is cached by the
+        ``<w:tbl>`` element until its grid columns change, so repeated
+        column access does not search the XML again.
         """
-        tblGrid = self._tbl.tblGrid
-        return tblGrid.gridCol_lst
+        return self._tbl.grid_cols
 
 
 class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr', '_element')
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = self._element = tr
@@ -397,8 +827,10 @@ class _Row(Parented):
     def cells(self):
         """
         Sequence of |_Cell| instances corresponding to cells in this row.
+        Computed from this row alone (and the rows above it for vertically
+        merged cells), so the cell grid of the whole table is not built.
         """
-        return tuple(self.table.row_cells(self._index))
+        return tuple(self.table._tr_cells(self._tr))
 
     @property
     def height(self):
@@ -437,7 +869,7 @@ class _Row(Parented):
         """
         Index of this row in its table, starting from zero.
         """
-        return self._tr.tr_idx
+        return self.table._tr_idx(self._tr)
 
 
 class _Rows(Parented):
@@ -445,6 +877,9 @@ class _Rows(Parented):
     Sequence of |_Row| objects corresponding to the rows in a table.
     Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
@@ -453,14 +888,38 @@ class _Rows(Parented):
         """
         Provide indexed access, (e.g. 'rows[0]')
         """
-        return list(self)[idx]
+        tr_lst = self._tbl.tr_lst
+        if isinstance(idx, slice):
+            return self._proxies_for(tr_lst[idx], _Row)
+        return self._get_proxy(tr_lst[idx], _Row)
 
     def __iter__(self):
-        return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        return iter(self._proxies_for(self._tbl.tr_lst, _Row))
 
     def __len__(self):
         return len(self._tbl.tr_lst)
 
+    def set_heights(self, heights, height_rule=None):
+        """
+        Assign each height in *heights*, a length in EMU or |None|, to the
+        row at the same position, as assigning `height` of each row would.
+        When *height_rule* is not |None|, that member of
+        :ref:`WdRowHeightRule` is assigned to the `height_rule` of each of
+        those rows as well. Rows beyond those in *heights* are left
+        unchanged. Raises |ValueError| if there are more heights than rows.
+        """
+        tr_lst = self._tbl.tr_lst
+        heights = list(heights)
+        if len(heights) > len(tr_lst):
+            raise ValueError(
+                '%d heights exceed table of %d rows'
+                % (len(heights), len(tr_lst))
+            )
+        for tr, height in zip(tr_lst, heights):
+            tr.trHeight_val = height
+            if height_rule is not None:
+                tr.trHeight_hRule = height_rule
+
     @property
     def table(self):
         """
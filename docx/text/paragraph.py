@@ -9,15 +9,19 @@ from __future__ import (
 )
 
 from ..enum.style import WD_STYLE_TYPE
+from ..oxml.text.paragraph import compile_substitution
 from .parfmt import ParagraphFormat
-from .run import Run
-from ..shared import Parented
+from .run import Run, format_runs
+from ..shared import Parented, ProxyList
 
 
 class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -62,6 +66,20 @@ class Paragraph(Parented):
         self._p.clear_content()
         return self
 
+    @property
+    def effective_format(self):
+        """
+        A |ParagraphFormat| object reporting the paragraph formatting this
+        paragraph is displayed with. Unlike :attr:`paragraph_format`, which
+        reports only formatting applied directly to the paragraph, each
+        property takes the value set most specifically by the paragraph, its
+        style, or the document defaults, the style including those it is
+        based on. The style part of this hierarchy is resolved once per style
+        and reused until a style is changed. The object is a snapshot;
+        changing its properties does not change the document.
+        """
+        return ParagraphFormat(self.part.new_effective_p(self._p))
+
     def insert_paragraph_before(self, text=None, style=None):
         """
         Return a newly created paragraph, inserted directly before this
@@ -76,6 +94,30 @@ class Paragraph(Parented):
             paragraph.style = style
         return paragraph
 
+    def iter_text_fragments(self):
+        """
+        Generate the pieces of text that make up :attr:`text`, in order; the
+        text of each run's ``<w:t>`` elements and a ``\\t`` or ``\\n``
+        character for each tab or line break, gathered in a single pass
+        without creating a |Run| object for each run. :attr:`text` is these
+        fragments joined together.
+        """
+        return self._p.iter_text_fragments()
+
+    def normalize_runs(self):
+        """
+        Merge each run of this paragraph into the run before it when both
+        have the same character formatting and contain only text, tabs and
+        breaks, and join the text elements of each run, dropping empty ones.
+        Spelling and grammar markers, which Word recreates, are removed.
+        Documents edited in Word often split text into many runs formatted
+        the same; normalizing them once makes later traversals and text
+        operations faster without changing how the paragraph is displayed.
+        Returns the number of XML elements removed. |Run| objects obtained
+        before the call may refer to runs no longer in the paragraph.
+        """
+        return self._p.normalize_runs()
+
     @property
     def paragraph_format(self):
         """
@@ -84,13 +126,43 @@ class Paragraph(Parented):
         """
         return ParagraphFormat(self._element)
 
+    def replace(self, pattern, repl=None, regex=False):
+        """
+        Replace each occurrence of *pattern* in the text of this paragraph
+        with *repl*, returning the number of replacements. An occurrence may
+        span runs; the replacement takes the character formatting of the run
+        where the occurrence begins and the rest of it is removed from the
+        runs it spans, a run left with no content being removed too, while
+        runs it does not reach are untouched. Tab and line-break characters
+        in the replacement become tabs and breaks, as when assigning
+        |Run.text|.
+
+        To replace many patterns in a single pass, as in a mail merge, pass
+        a mapping of patterns to replacements as *pattern* and omit *repl*.
+        Patterns are literal text unless *regex* is |True|, when each is
+        a regular expression and its replacement is a template or function,
+        as for :func:`re.sub`. Only the text reported by :attr:`text` is
+        searched, so runs in a hyperlink are not included.
+        """
+        regex, repl = compile_substitution(pattern, repl, regex)
+        return self._p.sub(regex, repl)
+
     @property
     def runs(self):
         """
         Sequence of |Run| instances corresponding to the <w:r> elements in
-        this paragraph.
+        this paragraph. Supports ``len()``, iteration, indexed access and
+        slicing; a |Run| proxy is only created for each run accessed.
+        """
+        return ProxyList(self._p, 'w:r', Run, self)
+
+    def set_run_formatting(self, **props):
+        """
+        Assign the character formatting in *props* to the font of each run in
+        this paragraph, e.g. ``paragraph.set_run_formatting(bold=True)``.
+        Keyword arguments are those of :func:`docx.text.run.format_runs`.
         """
-        return [Run(r, self) for r in self._p.r_lst]
+        format_runs(self.runs, **props)
 
     @property
     def style(self):
@@ -126,10 +198,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @text.setter
     def text(self, text):
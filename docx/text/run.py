@@ -9,8 +9,9 @@ from __future__ import absolute_import, print_function, unicode_literals
 from ..enum.style import WD_STYLE_TYPE
 from ..enum.text import WD_BREAK
 from .font import Font
+from ..oxml import OxmlElement
 from ..shape import InlineShape
-from ..shared import Parented
+from ..shared import Parented, RGBColor
 
 
 class Run(Parented):
@@ -21,6 +22,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -99,6 +103,24 @@ class Run(Parented):
         self._r.clear_content()
         return self
 
+    @property
+    def effective_font(self):
+        """
+        A |Font| object reporting the character formatting this run is
+        displayed with. Unlike :attr:`font`, which reports only formatting
+        applied directly to the run, each property takes the value set most
+        specifically by the run, its character style, the style of its
+        paragraph, or the document defaults, each style including those it
+        is based on. Toggle properties like bold and italic are combined as
+        Word does, so bold set by both the character style and the paragraph
+        style turns bold off. A property is |None| only when none of these
+        sets it. The style part of this hierarchy is resolved once per
+        combination of styles and reused until a style is changed. The
+        object is a snapshot; changing its properties does not change the
+        document.
+        """
+        return Font(self.part.new_effective_r(self._r))
+
     @property
     def font(self):
         """
@@ -182,10 +204,81 @@ class Run(Parented):
         self.font.underline = value
 
 
+_FONT_PROPS = frozenset(
+    name for name, value in vars(Font).items()
+    if isinstance(value, property) and value.fset is not None
+) | frozenset(['color'])
+
+
+def format_runs(runs, **props):
+    """
+    Assign the character formatting in *props* to the font of each |Run| in
+    *runs*, e.g. ``format_runs(runs, bold=True, size=Pt(9))``. Each keyword
+    names a writable |Font| property, or is `color`, taking an |RGBColor|
+    assigned to ``font.color.rgb`` or a theme color assigned to
+    ``font.color.theme_color``. The result is the same as assigning each
+    value to the font of each run, in keyword order, but the formatting is
+    built once in a prototype ``<w:rPr>`` element that is then merged into
+    each run in a single pass. Values that only remove formatting, like
+    |None|, and theme colors are assigned to the font of each run in turn,
+    between the prototypes holding the values before and after them, so
+    a value overrides those before it even where both change the same
+    element. Keyword order is the order of the call from Python 3.6; on
+    earlier versions it is arbitrary. Raises |TypeError| on a keyword
+    argument naming another property.
+    """
+    steps, prototype = [], None
+    for name, value in props.items():
+        if name not in _FONT_PROPS:
+            raise TypeError(
+                "format_runs() got an unexpected keyword argument '%s'" % name
+            )
+        probe = OxmlElement('w:r')
+        _set_font_prop(Font(probe), name, value)
+        if (
+            probe.rPr is None or len(probe.rPr) == 0 or
+            name == 'color' and not isinstance(value, RGBColor)
+        ):
+            steps.append((name, value))
+            prototype = None
+            continue
+        if prototype is None:
+            prototype = OxmlElement('w:r')
+            steps.append(prototype)
+        _set_font_prop(Font(prototype), name, value)
+    # ---each step is a (name, value) pair or the rPr of a prototype run---
+    steps = [
+        step if isinstance(step, tuple) else step.rPr for step in steps
+    ]
+    for run in runs:
+        r = run._r
+        for step in steps:
+            if isinstance(step, tuple):
+                _set_font_prop(Font(r), *step)
+            else:
+                r.update_rPr(step)
+
+
+def _set_font_prop(font, name, value):
+    """
+    Assign *value* to the property of *font* named by *name*, which is
+    `color` or a writable |Font| property, as for :func:`format_runs`.
+    """
+    if name != 'color':
+        setattr(font, name, value)
+    elif isinstance(value, RGBColor):
+        font.color.rgb = value
+    else:
+        font.color.theme_color = value
+
+
 class _Text(object):
     """
     Proxy object wrapping ``<w:t>`` element.
     """
+
+    __slots__ = ('_t',)
+
     def __init__(self, t_elm):
         super(_Text, self).__init__()
         self._t = t_elm
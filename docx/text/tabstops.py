@@ -8,6 +8,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from ..oxml.ns import qn
 from ..shared import ElementProxy
 from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
 
@@ -31,6 +32,7 @@ class TabStops(ElementProxy):
         """
         Remove the tab at offset *idx* in this sequence.
         """
+        _bump_styles_version(self._pPr)
         tabs = self._pPr.tabs
         try:
             tabs.remove(tabs[idx])
@@ -77,6 +79,7 @@ class TabStops(ElementProxy):
         leader character can be specified by passing a member of the
         :ref:`WdTabLeader` enumeration as *leader*.
         """
+        _bump_styles_version(self._pPr)
         tabs = self._pPr.get_or_add_tabs()
         tab = tabs.insert_tab_in_order(position, alignment, leader)
         return TabStop(tab)
@@ -85,6 +88,7 @@ class TabStops(ElementProxy):
         """
         Remove all custom tab stops.
         """
+        _bump_styles_version(self._pPr)
         self._pPr._remove_tabs()
 
 
@@ -110,6 +114,7 @@ class TabStop(ElementProxy):
 
     @alignment.setter
     def alignment(self, value):
+        _bump_styles_version(self._tab)
         self._tab.val = value
 
     @property
@@ -124,6 +129,7 @@ class TabStop(ElementProxy):
 
     @leader.setter
     def leader(self, value):
+        _bump_styles_version(self._tab)
         self._tab.leader = value
 
     @property
@@ -138,6 +144,17 @@ class TabStop(ElementProxy):
     @position.setter
     def position(self, value):
         tab = self._tab
+        _bump_styles_version(tab)
         tabs = tab.getparent()
         self._tab = tabs.insert_tab_in_order(value, tab.val, tab.leader)
         tabs.remove(tab)
+
+
+def _bump_styles_version(element):
+    """
+    Note that the tab stops containing *element* are about to change. When
+    they belong to a style, the paragraph properties resolved from the style
+    definitions are discarded; see :meth:`.CT_Styles.bump_styles_version`.
+    """
+    for style in element.iterancestors(qn('w:style')):
+        style.bump_styles_version()
@@ -6,6 +6,8 @@ Step implementations for document-related features
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections import Sequence
+
 from behave import given, then, when
 
 from docx import Document
@@ -179,11 +181,11 @@ def then_document_inline_shapes_is_an_InlineShapes_object(context):
     assert isinstance(inline_shapes, InlineShapes)
 
 
-@then('document.paragraphs is a list containing three paragraphs')
-def then_document_paragraphs_is_a_list_containing_three_paragraphs(context):
+@then('document.paragraphs is a sequence containing three paragraphs')
+def then_document_paragraphs_is_a_sequence_containing_three_paragraphs(context):
     document = context.document
     paragraphs = document.paragraphs
-    assert isinstance(paragraphs, list)
+    assert isinstance(paragraphs, Sequence)
     assert len(paragraphs) == 3
     for paragraph in paragraphs:
         assert isinstance(paragraph, Paragraph)
@@ -202,11 +204,11 @@ def then_document_styles_is_a_Styles_object(context):
     assert isinstance(styles, Styles)
 
 
-@then('document.tables is a list containing three tables')
-def then_document_tables_is_a_list_containing_three_tables(context):
+@then('document.tables is a sequence containing three tables')
+def then_document_tables_is_a_sequence_containing_three_tables(context):
     document = context.document
     tables = document.tables
-    assert isinstance(tables, list)
+    assert isinstance(tables, Sequence)
     assert len(tables) == 3
     for table in tables:
         assert isinstance(table, Table)
@@ -126,11 +126,20 @@ class DescribeOpcPackage(object):
         pkg = OpcPackage()
         pkg.save(pkg_file_)
         for part in parts_:
+            assert part.normalize_namespaces.call_count == 0
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
             pkg_file_, pkg._rels, parts_
         )
 
+    def it_can_normalize_namespaces_before_saving(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+        pkg.save(pkg_file_, normalize_namespaces=True)
+        for part in parts_:
+            part.normalize_namespaces.assert_called_once_with()
+            part.before_marshal.assert_called_once_with()
+
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
         core_properties = opc_package.core_properties
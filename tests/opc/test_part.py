@@ -454,6 +454,12 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_can_normalize_its_namespace_declarations(
+            self, element_, normalize_namespaces_):
+        xml_part = XmlPart(None, None, element_, None)
+        xml_part.normalize_namespaces()
+        normalize_namespaces_.assert_called_once_with(element_)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -483,6 +489,10 @@ class DescribeXmlPart(object):
     def __init_(self, request):
         return initializer_mock(request, XmlPart)
 
+    @pytest.fixture
+    def normalize_namespaces_(self, request):
+        return function_mock(request, 'docx.opc.part.normalize_namespaces')
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, OpcPackage)
@@ -11,9 +11,10 @@ import pytest
 from lxml import etree
 
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, normalize_namespaces, oxml_parser, parse_xml,
+    register_element_cls
 )
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsdecls, qn
 from docx.oxml.shared import BaseOxmlElement
 
 
@@ -42,6 +43,28 @@ class DescribeOxmlElement(object):
         assert element.nsmap['x'] == ns2
 
 
+class DescribeNormalizeNamespaces(object):
+
+    def it_hoists_namespace_declarations_to_the_root(self):
+        root = parse_xml(
+            '<w:body %s><w:p %s><w:r %s><a:blip %s/></w:r></w:p></w:body>' %
+            (nsdecls('w'), nsdecls('w', 'pic'), nsdecls('w'), nsdecls('a'))
+        )
+        normalize_namespaces(root)
+        assert etree.tostring(root, encoding='unicode') == (
+            '<w:body %s><w:p><w:r><a:blip/></w:r></w:p></w:body>' %
+            nsdecls('w', 'a')
+        )
+
+    def but_it_keeps_declarations_already_on_the_root(self):
+        root = parse_xml(
+            '<w:document %s xmlns:w14="http://w14" xmlns:mc="http://mc" mc:Ig'
+            'norable="w14"><w:body/></w:document>' % nsdecls('w')
+        )
+        normalize_namespaces(root)
+        assert set(root.nsmap) == set(('w', 'w14', 'mc'))
+
+
 class DescribeOxmlParser(object):
 
     def it_strips_whitespace_between_elements(self, whitespace_fixture):
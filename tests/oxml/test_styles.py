@@ -23,8 +23,141 @@ class DescribeCT_Styles(object):
         assert styles.xml == expected_xml
         assert style is styles[-1]
 
+    def it_resolves_the_run_properties_of_a_pair_of_styles(self, styles):
+        rPr = styles.resolved_rPr('Heading', 'Emphasis')
+        assert rPr.xml == xml(
+            'w:rPr/(w:rFonts{w:ascii=Foo,w:hAnsi=Bar},w:sz{w:val=32},w:i{w:va'
+            'l=0},w:b,w:color{w:val=FF0000})'
+        )
+
+    def it_combines_toggle_properties_of_a_pair_of_styles(self):
+        styles = element(
+            'w:styles/('
+            'w:docDefaults/w:rPrDefault/w:rPr/w:caps,'
+            'w:style{w:type=paragraph,w:styleId=Base}/w:rPr/(w:b,w:strike),'
+            'w:style{w:type=paragraph,w:styleId=Heading}/(w:basedOn{w:val=Bas'
+            'e},w:rPr/(w:i{w:val=0},w:sz{w:val=32})),'
+            'w:style{w:type=character,w:styleId=Strong}/w:rPr/(w:b,w:i,w:caps'
+            ',w:strike{w:val=0},w:sz{w:val=24})'
+            ')'
+        )
+        rPr = styles.resolved_rPr('Heading', 'Strong')
+        assert rPr.xml == xml(
+            'w:rPr/(w:caps,w:b{w:val=0},w:strike,w:i,w:sz{w:val=24})'
+        )
+
+    def it_resolves_the_paragraph_properties_of_a_style(self, styles):
+        pPr = styles.resolved_pPr('Heading')
+        assert pPr.xml == xml(
+            'w:pPr/(w:spacing{w:after=80,w:before=240},w:ind{w:left=720,w:han'
+            'ging=360})'
+        )
+
+    @pytest.mark.parametrize('pStyle_id, rStyle_id, expected_cxml', [
+        (None, None, 'w:rPr/(w:rFonts{w:ascii=Foo},w:sz{w:val=20},w:i)'),
+        ('Missing', 'Missing',
+         'w:rPr/(w:rFonts{w:ascii=Foo},w:sz{w:val=20},w:i)'),
+        ('Emphasis', 'Heading',
+         'w:rPr/(w:rFonts{w:ascii=Foo},w:sz{w:val=20},w:i)'),
+    ])
+    def it_uses_the_default_style_for_an_unmatched_style_id(
+        self, styles, pStyle_id, rStyle_id, expected_cxml
+    ):
+        rPr = styles.resolved_rPr(pStyle_id, rStyle_id)
+        assert rPr.xml == xml(expected_cxml)
+
+    def it_stops_resolving_at_a_basedOn_cycle(self):
+        styles = element(
+            'w:styles/(w:style{w:type=paragraph,w:styleId=A}/(w:basedOn{w:val'
+            '=B},w:pPr/w:keepNext),w:style{w:type=paragraph,w:styleId=B}/(w:b'
+            'asedOn{w:val=A},w:pPr/(w:keepNext{w:val=0},w:keepLines)))'
+        )
+        pPr = styles.resolved_pPr('A')
+        assert pPr.xml == xml('w:pPr/(w:keepNext,w:keepLines)')
+
+    def it_merges_tab_stops_along_the_basedOn_chain(self):
+        styles = element(
+            'w:styles/(w:style{w:type=paragraph,w:styleId=A}/w:pPr/w:tabs/(w:'
+            'tab{w:val=left,w:pos=720},w:tab{w:val=left,w:pos=1440}),w:style{'
+            'w:type=paragraph,w:styleId=B}/(w:basedOn{w:val=A},w:pPr/w:tabs/('
+            'w:tab{w:val=right,w:pos=2160},w:tab{w:val=clear,w:pos=720},w:tab'
+            '{w:val=center,w:pos=1440})))'
+        )
+        pPr = styles.resolved_pPr('B')
+        assert pPr.xml == xml(
+            'w:pPr/w:tabs/(w:tab{w:val=center,w:pos=1440},w:tab{w:val=right,'
+            'w:pos=2160})'
+        )
+
+    def it_memoizes_resolved_properties_until_a_style_changes(
+        self, styles
+    ):
+        rPr = styles.resolved_rPr('Heading', None)
+        assert styles.resolved_rPr('Heading', None) is rPr
+
+        styles.get_by_id('Heading').get_or_add_rPr()
+
+        assert styles.resolved_rPr('Heading', None) is not rPr
+
+    @pytest.mark.parametrize('change', [
+        lambda styles: styles.get_by_id('Normal').get_or_add_pPr(),
+        lambda styles: styles.get_by_id('Normal').get_or_add_rPr(),
+        lambda styles: setattr(styles.get_by_id('Heading'), 'basedOn_val',
+                               None),
+        lambda styles: styles.get_by_id('Emphasis').delete(),
+        lambda styles: styles.add_style_of_type(
+            'Foo', WD_STYLE_TYPE.CHARACTER, False
+        ),
+    ])
+    def it_bumps_its_version_when_a_style_changes(self, styles, change):
+        version = styles.styles_version
+        change(styles)
+        assert styles.styles_version == version + 1
+
+    def it_resolves_the_effective_properties_of_a_run(self, styles):
+        p = element(
+            'w:p/(w:pPr/w:pStyle{w:val=Heading},w:hyperlink/w:r/w:rPr/(w:rSt'
+            'yle{w:val=Emphasis},w:b{w:val=0},w:sz{w:val=24}))'
+        )
+        r = p.xpath('.//w:r')[0]
+
+        new_r = styles.new_effective_r(r)
+
+        assert new_r.getparent() is None
+        assert new_r.xml == xml(
+            'w:r/w:rPr/(w:rFonts{w:ascii=Foo,w:hAnsi=Bar},w:sz{w:val=24},w:i{'
+            'w:val=0},w:b{w:val=0},w:color{w:val=FF0000})'
+        )
+
+    def it_resolves_the_effective_properties_of_a_paragraph(self, styles):
+        p = element(
+            'w:p/w:pPr/(w:pStyle{w:val=Heading},w:ind{w:firstLine=180},w:spac'
+            'ing{w:after=0})'
+        )
+        new_p = styles.new_effective_p(p)
+        assert new_p.xml == xml(
+            'w:p/w:pPr/(w:spacing{w:after=0,w:before=240},w:ind{w:left=720,w:'
+            'firstLine=180})'
+        )
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture
+    def styles(self):
+        return element(
+            'w:styles/('
+            'w:docDefaults/(w:rPrDefault/w:rPr/(w:rFonts{w:ascii=Foo},w:sz{w:'
+            'val=20}),w:pPrDefault/w:pPr/w:spacing{w:after=160}),'
+            'w:style{w:type=paragraph,w:default=1,w:styleId=Normal}/(w:pPr/w:'
+            'ind{w:left=720,w:firstLine=360},w:rPr/w:i),'
+            'w:style{w:type=paragraph,w:styleId=Heading}/(w:basedOn{w:val=Nor'
+            'mal},w:pPr/(w:spacing{w:before=240,w:after=80},w:ind{w:hanging=3'
+            '60}),w:rPr/(w:rFonts{w:hAnsi=Bar},w:sz{w:val=32},w:i{w:val=0})),'
+            'w:style{w:type=character,w:styleId=Emphasis}/w:rPr/(w:rStyle{w:v'
+            'al=Foo},w:b,w:color{w:val=FF0000})'
+            ')'
+        )
+
     @pytest.fixture(params=[
         ('w:styles', 'Foo Bar',   WD_STYLE_TYPE.LIST,      False,
          'w:styles/w:style{w:type=numbering,w:customStyle=1,w:styleId=FooBar'
@@ -8,7 +8,7 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.table import CT_Tbl, CT_Tc, TblGeometry
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -22,6 +22,13 @@ class DescribeCT_Row(object):
         tr._add_trPr()
         assert tr.xml == expected_xml
 
+    def it_can_fill_its_cells_with_text(self):
+        tr = element('w:tr/(w:tc/(w:tcPr,w:p/w:r/w:t"x"),w:tc/w:p,w:tc/w:p)')
+        tr.fill(['a', ''])
+        assert tr.xml == xml(
+            'w:tr/(w:tc/(w:tcPr,w:p/w:r/w:t"a"),w:tc/w:p,w:tc/w:p)'
+        )
+
     def it_raises_on_tc_at_grid_col(self, tc_raise_fixture):
         tr, idx = tc_raise_fixture
         with pytest.raises(ValueError):
@@ -49,22 +56,226 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_counts_changes_to_its_cell_layout(self, layout_change_fixture):
+        tbl, change = layout_change_fixture
+        assert tbl.grid_version == 0
+        change(tbl)
+        assert tbl.grid_version == 1
+
+    def it_ignores_changes_to_cell_content(self):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+        tc = tbl.tr_lst[0].tc_lst[0]
+        tc.add_p()
+        tc.width = 914400
+        assert tbl.grid_version == 0
+
+    def it_can_fill_its_cells_with_text(self, fill_fixture):
+        tbl, text_rows, expected_xml = fill_fixture
+        tbl.fill(text_rows)
+        assert tbl.xml == expected_xml
+
+    def it_can_generate_the_text_of_each_row(self, row_texts_fixture):
+        tbl, expected_rows = row_texts_fixture
+        assert list(tbl.iter_row_texts()) == expected_rows
+
+    def it_can_generate_the_tc_beginning_each_cell(self):
+        tbl = element(
+            'w:tbl/(w:tr/(w:tc/w:tcPr/(w:gridSpan{w:val=2},'
+            'w:vMerge{w:val=restart}),w:tc),w:tr/(w:tc/w:tcPr/('
+            'w:gridSpan{w:val=2},w:vMerge),w:tc))'
+        )
+        tcs = tbl.xpath('./w:tr/w:tc')
+        assert list(tbl.iter_cell_tcs()) == [
+            (0, 0, tcs[0]), (0, 2, tcs[1]), (1, 2, tcs[3])
+        ]
+
+    def it_can_select_the_tcs_in_a_range_of_rows_and_columns(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc,w:tc/'
+            'w:tcPr/w:gridSpan{w:val=2}),w:tr/(w:tc,w:tc,w:tc),w:tr/(w:tc,'
+            'w:tc,w:tc))'
+        )
+        tcs = tbl.xpath('./w:tr/w:tc')
+        selected = tbl.iter_tcs_in(slice(0, 2), slice(1, None))
+        assert list(selected) == [tcs[1], tcs[3], tcs[4]]
+        selected = tbl.iter_tcs_in(slice(None), slice(2, 3))
+        assert list(selected) == [tcs[4], tcs[7]]
+
+    def it_caches_its_grid_columns_until_they_change(self):
+        tbl = element(
+            'w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol),w:tr/w:tc/w:p)'
+        )
+        tblGrid = tbl.tblGrid
+        gridCols = tbl.grid_cols
+        assert gridCols == tuple(tblGrid.gridCol_lst)
+        assert tbl.grid_cols is gridCols
+        assert tbl.col_count == 2
+        assert tbl.grid_col_idx(gridCols[1]) == 1
+        assert gridCols[1].gridCol_idx == 1
+
+        tblGrid.add_gridCol()
+        assert tbl.col_count == 3
+        tblGrid.remove(gridCols[0])
+        assert tbl.grid_cols == tuple(tblGrid.gridCol_lst)
+        assert gridCols[1].gridCol_idx == 0
+        with pytest.raises(ValueError):
+            tbl.grid_col_idx(gridCols[0])
+
+    @pytest.mark.parametrize(('row_count', 'expected_cxml'), [
+        (None, 'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a",w:tr/w:tc/'
+               '(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/w:t"b")),w:bookmarkEnd)'),
+        (1, 'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a",'
+            'w:bookmarkEnd)'),
+        (4, 'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a",w:tr/w:tc/'
+            '(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/w:t"b")),w:tr/w:tc/(w:tcPr/'
+            'w:shd,w:p/w:pPr/w:jc),w:tr/w:tc/(w:tcPr/w:shd,w:p/w:pPr/w:jc),'
+            'w:bookmarkEnd)'),
+    ])
+    def it_can_copy_itself_with_a_number_of_rows(
+            self, row_count, expected_cxml):
+        tbl = element(
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a",w:tr/w:tc/'
+            '(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/w:t"b")),w:bookmarkEnd)'
+        )
+        original_xml = tbl.xml
+        copy = tbl.copy(row_count)
+        assert copy is not tbl
+        assert copy.getparent() is None
+        assert copy.xml == xml(expected_cxml)
+        assert tbl.xml == original_xml
+
+    @pytest.mark.parametrize('row_count', [0, -1])
+    def it_raises_on_copy_with_fewer_than_one_row(self, row_count):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+        with pytest.raises(ValueError):
+            tbl.copy(row_count)
+
+    def it_can_copy_itself_when_it_has_no_rows(self):
+        tbl = element('w:tbl/w:tblGrid/w:gridCol{w:w=1440}')
+        assert tbl.copy(1).xml == xml(
+            'w:tbl/(w:tblGrid/w:gridCol{w:w=1440},w:tr/w:tc/(w:tcPr/'
+            'w:tcW{w:type=dxa,w:w=1440},w:p))'
+        )
+
+    def it_can_construct_a_new_tr_for_its_grid(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=720}),w:tr/'
+            'w:tc/w:p)'
+        )
+        tr = tbl.new_tr()
+        assert tr.getparent() is None
+        assert tr.xml == xml(
+            'w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p),w:tc/(w:tcPr/'
+            'w:tcW{w:type=dxa,w:w=720},w:p))'
+        )
+
+    def it_can_construct_a_new_tbl_from_text_rows(self):
+        text_rows = [['a', 'b\tc'], [' d']]
+        tbl = CT_Tbl.new_tbl_from_rows(text_rows, 2, 914400 * 2, header=True)
+        trs = tbl.tr_lst
+        assert [len(tr.tc_lst) for tr in trs] == [2, 2]
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == [
+            914400, 914400
+        ]
+        assert trs[0].trPr.xml == xml('w:trPr/w:tblHeader')
+        assert trs[1].trPr is None
+        assert trs[0].tc_lst[1].xml == xml(
+            'w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},'
+            'w:p/w:r/(w:t"b",w:tab,w:t"c"))'
+        )
+        assert trs[1].tc_lst[0].p_lst[0].xml == xml(
+            'w:p/w:r/w:t{xml:space=preserve}" d"'
+        )
+        assert trs[1].tc_lst[1].p_lst[0].xml == xml('w:p')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:tbl', []),
+        ('w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/(w:p/w:r/w:t"b",w:p/w:r/'
+         'w:t"c")),w:tr/(w:tc/w:p,w:tc/w:p/w:r/w:t"d"))',
+         [['a', 'b\nc'], ['', 'd']]),
+        ('w:tbl/(w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p/w:r/w:t"a"),'
+         'w:tc/w:p/w:r/w:t"b"))',
+         [['a', 'a', 'b']]),
+        ('w:tbl/(w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge{w:val='
+         'restart}),w:p/w:r/w:t"a"),w:tc/w:p/w:r/w:t"b"),w:tr/(w:tc/(w:tcPr/'
+         '(w:gridSpan{w:val=2},w:vMerge),w:p),w:tc/w:p/w:r/w:t"c"))',
+         [['a', 'a', 'b'], ['a', 'a', 'c']]),
+        ('w:tbl/w:tr/w:tc/(w:p/w:r/w:t"a",w:tbl/w:tr/w:tc/w:p/w:r/w:t"b")',
+         [['a']]),
+    ])
+    def row_texts_fixture(self, request):
+        tbl_cxml, expected_rows = request.param
+        return element(tbl_cxml), expected_rows
+
+    @pytest.fixture(params=[
+        ('w:tbl/w:tr/(w:tc/w:p,w:tc/w:p)', [['a', 'b']],
+         'w:tbl/w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b")'),
+        ('w:tbl/w:tr/(w:tc/(w:tcPr,w:p/w:r/w:t"x",w:p),w:tc/w:p)', [['']],
+         'w:tbl/w:tr/(w:tc/(w:tcPr,w:p),w:tc/w:p)'),
+        ('w:tbl/(w:tr/w:tc/w:p,w:tr/w:tc/w:p)', [['a\nb<']],
+         'w:tbl/(w:tr/w:tc/w:p/w:r/(w:t"a",w:br,w:t"b&lt;"),w:tr/w:tc/w:p)'),
+    ])
+    def fill_fixture(self, request):
+        tbl_cxml, text_rows, expected_cxml = request.param
+        tbl = element(tbl_cxml)
+        expected_xml = xml(expected_cxml)
+        return tbl, text_rows, expected_xml
+
+    @pytest.fixture(params=[
+        lambda tbl: tbl.add_tr(),
+        lambda tbl: tbl.tr_lst[0].add_tc(),
+        lambda tbl: tbl.tblGrid.add_gridCol(),
+        lambda tbl: setattr(tbl.tr_lst[0].tc_lst[0], 'grid_span', 2),
+        lambda tbl: setattr(tbl.tr_lst[0].tc_lst[0], 'vMerge', 'restart'),
+        lambda tbl: tbl.tr_lst[0].tc_lst[0]._remove(),
+    ])
+    def layout_change_fixture(self, request):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+        return tbl, request.param
+
+
 class DescribeCT_Tc(object):
 
+    @pytest.mark.parametrize(('tc_cxml', 'expected_cxml'), [
+        ('w:tc/(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/(w:rPr/w:b,w:t"a"),w:r/'
+         'w:t"b"),w:tbl,w:p/w:r/w:t"c")',
+         'w:tc/(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/(w:rPr/w:b,w:t"foo")))'),
+        ('w:tc/w:p/(w:bookmarkStart,w:r/w:t"a",w:bookmarkEnd)',
+         'w:tc/w:p/(w:bookmarkStart,w:r/w:t"foo",w:bookmarkEnd)'),
+        ('w:tc/(w:tcPr,w:tbl,w:sdt,w:p/(w:customXml,w:r/w:t"a",w:r),w:p)',
+         'w:tc/(w:tcPr,w:p/w:r/w:t"foo")'),
+        ('w:tc/(w:tcPr,w:sdt/w:sdtContent/w:p/w:r/w:t"a")',
+         'w:tc/(w:tcPr,w:p/w:r/w:t"foo")'),
+        ('w:tc/w:p/(w:r/w:t"a",w:hyperlink/w:r/w:t"LINK",w:ins/w:r/w:t"b",'
+         'w:smartTag/w:r/w:t"c",w:fldSimple/w:r/w:t"d",w:proofErr)',
+         'w:tc/w:p/(w:r/w:t"foo",w:proofErr)'),
+        ('w:tc/(w:bookmarkStart,w:p/w:hyperlink/w:r/w:t"a",w:bookmarkEnd)',
+         'w:tc/(w:bookmarkStart,w:p/w:r/w:t"foo",w:bookmarkEnd)'),
+        ('w:tc/w:p/w:pPr/w:jc', 'w:tc/w:p/(w:pPr/w:jc,w:r/w:t"foo")'),
+        ('w:tc/w:tcPr', 'w:tc/(w:tcPr,w:p/w:r/w:t"foo")'),
+    ])
+    def it_can_replace_its_text_in_place(self, tc_cxml, expected_cxml):
+        tc = element(tc_cxml)
+        tc.replace_text('foo')
+        assert tc.xml == xml(expected_cxml)
+
     def it_can_merge_to_another_tc(
-        self, tr_, _span_dimensions_, _tbl_, _grow_to_, top_tc_
+        self, _span_dimensions_, _tbl_, _grow_to_, top_tc_
     ):
-        top_tr_ = tr_
         tc, other_tc = element('w:tc'), element('w:tc')
         top, left, height, width = 0, 1, 2, 3
         _span_dimensions_.return_value = top, left, height, width
-        _tbl_.return_value.tr_lst = [tr_]
-        tr_.tc_at_grid_col.return_value = top_tc_
+        geometry = _tbl_.return_value.geometry
+        geometry.tc_at_grid_col.return_value = top_tc_
 
         merged_tc = tc.merge(other_tc)
 
         _span_dimensions_.assert_called_once_with(tc, other_tc)
-        top_tr_.tc_at_grid_col.assert_called_once_with(left)
+        geometry.tc_at_grid_col.assert_called_once_with(top, left)
         top_tc_._grow_to.assert_called_once_with(width, height)
         assert merged_tc is top_tc_
 
@@ -329,6 +540,87 @@ class DescribeCT_Tc(object):
     def top_tc_(self, request):
         return instance_mock(request, CT_Tc)
 
-    @pytest.fixture
-    def tr_(self, request):
-        return instance_mock(request, CT_Row)
+
+class DescribeTblGeometry(object):
+
+    def it_locates_each_tc_on_the_grid(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/'
+            '(w:tcPr/w:gridSpan{w:val=2},w:p),w:tc/w:p),w:tr/(w:tc/w:p,w:tc/'
+            'w:p,w:tc/w:p))'
+        )
+        tr, tr_2 = tbl.tr_lst
+        geometry = tbl.geometry
+        assert geometry.row_count == 2
+        assert [geometry.grid_col(tc) for tc in tbl.iter_tcs()] == [
+            0, 2, 0, 1, 2
+        ]
+        assert geometry.tr(1) is tr_2
+        assert geometry.tr_idx(tr_2) == 1
+        assert geometry.tc_at_grid_col(0, 2) is tr.tc_lst[1]
+        with pytest.raises(ValueError):
+            geometry.tc_at_grid_col(0, 1)
+        with pytest.raises(ValueError):
+            geometry.tr_idx(element('w:tr'))
+
+    def it_resolves_the_origin_of_a_vertical_merge(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val='
+            'restart},w:p),w:tr/w:tc/(w:tcPr/w:vMerge,w:p),w:tr/w:tc/w:p)'
+        )
+        tcs = list(tbl.iter_tcs())
+        geometry = TblGeometry(tbl, None)
+        assert [geometry.merge_origin_tc(idx, 0) for idx in range(3)] == [
+            tcs[0], tcs[0], tcs[2]
+        ]
+
+    def it_carries_merge_origins_down_the_rows(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/w:vMe'
+            'rge{w:val=restart},w:p),w:tc/w:p),w:tr/(w:tc/(w:tcPr/w:vMerge,w:'
+            'p),w:tc/w:p),w:tr/(w:tc/(w:tcPr/w:vMerge,w:p),w:tc/w:p))'
+        )
+        tcs = list(tbl.iter_tcs())
+        geometry = tbl.geometry
+        assert geometry.origin_tcs(2) == [tcs[0], tcs[5]]
+        assert geometry.origin_tcs(1) == [tcs[0], tcs[3]]
+        assert [list(tr.iter_grid_tcs()) for tr in tbl.tr_lst] == [
+            [tcs[0], tcs[1]], [tcs[0], tcs[3]], [tcs[0], tcs[5]]
+        ]
+
+        tcs[2].vMerge = None
+        assert tbl.geometry is geometry
+        assert geometry.origin_tcs(2) == [tcs[2], tcs[5]]
+
+    def it_is_updated_row_by_row_as_cells_are_merged(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p,'
+            'w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p))'
+        )
+        geometry = tbl.geometry
+        tc = tbl.tr_lst[1].tc_lst[1]
+        tc.merge(tbl.tr_lst[1].tc_lst[2])
+        assert tbl.geometry is geometry
+        assert geometry.grid_col(tc) == 1
+        assert geometry.tc_at_grid_col(1, 1) is tc
+
+    def it_is_rebuilt_when_rows_change(self):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+        geometry = tbl.geometry
+        tbl.add_tr()
+        assert tbl.geometry is not geometry
+        assert tbl.geometry.row_count == 2
+        tbl.remove(tbl.tr_lst[0])
+        assert tbl.geometry.row_count == 1
+
+    def it_is_rebuilt_when_a_span_changes_after_rows_were_removed(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p,w:tr/w:tc/w:p,'
+            'w:tr/w:tc/w:p)'
+        )
+        tbl.geometry
+        tbl.remove(tbl.tr_lst[0])
+        tr = tbl.tr_lst[1]
+        tr.tc_lst[0].grid_span = 1
+        assert tbl.geometry.row_count == 2
+        assert tbl.geometry.tr_idx(tr) == 1
@@ -20,6 +20,7 @@ from docx.oxml.xmlchemy import (
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element, xml
 from .unitdata.text import a_b, a_u, an_i, an_rPr
 
 
@@ -36,6 +37,19 @@ class DescribeBaseOxmlElement(object):
         element.insert_element_before(child, *tagnames)
         assert element.xml == expected_xml
 
+    @pytest.mark.parametrize(('cxml', 'tagnames', 'expected_cxml'), [
+        ('w:rPr/(w:b,w:u)', ('w:caps', 'w:smallCaps', 'w:strike', 'w:u'),
+         'w:rPr/(w:b,w:i,w:u)'),
+        ('w:rPr/w:b', ('w:caps', 'w:smallCaps', 'w:strike', 'w:u'),
+         'w:rPr/(w:b,w:i)'),
+        ('w:rPr/(w:b,w:u)', ('w:strike', 'w:u'), 'w:rPr/(w:b,w:i,w:u)'),
+    ])
+    def it_inserts_before_the_first_of_a_long_list_of_successors(
+            self, cxml, tagnames, expected_cxml):
+        rPr = element(cxml)
+        rPr.insert_element_before(element('w:i'), *tagnames)
+        assert rPr.xml == xml(expected_cxml)
+
     def it_can_remove_all_children_with_name_in_sequence(
             self, remove_fixture):
         element, tagnames, expected_xml = remove_fixture
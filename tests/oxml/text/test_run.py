@@ -10,6 +10,8 @@ from __future__ import (
 
 import pytest
 
+from docx.oxml.ns import qn
+
 from ...unitutil.cxml import element, xml
 
 
@@ -20,6 +22,49 @@ class DescribeCT_R(object):
         r.add_t(text)
         assert r.xml == expected_xml
 
+    def it_can_replace_its_text(self, replace_text_fixture):
+        r, text, expected_xml = replace_text_fixture
+        r.replace_text(text)
+        assert r.xml == expected_xml
+
+    @pytest.mark.parametrize(('r_cxml', 'expected_cxml'), [
+        ('w:r/w:t"foo"',
+         'w:r/(w:rPr/(w:rFonts{w:ascii=Foo},w:b,w:sz{w:val=18}),w:t"foo")'),
+        ('w:r/w:rPr/(w:rStyle{w:val=Bar},w:i,w:u{w:val=single},w:rPrChange)',
+         'w:r/w:rPr/(w:rStyle{w:val=Bar},w:rFonts{w:ascii=Foo},w:b,w:i,w:sz{'
+         'w:val=18},w:u{w:val=single},w:rPrChange)'),
+        ('w:r/w:rPr/(w:rFonts{w:ascii=Bar,w:cs=Baz},w:b{w:val=0},w:sz{w:val=4'
+         '0})',
+         'w:r/w:rPr/(w:rFonts{w:ascii=Foo,w:cs=Baz},w:b,w:sz{w:val=18})'),
+    ])
+    def it_can_update_its_run_properties(self, r_cxml, expected_cxml):
+        r = element(r_cxml)
+        prototype = element('w:rPr/(w:rFonts{w:ascii=Foo},w:b,w:sz{w:val=18})')
+
+        r.update_rPr(prototype)
+
+        assert r.xml == xml(expected_cxml)
+        assert prototype.xml == xml(
+            'w:rPr/(w:rFonts{w:ascii=Foo},w:b,w:sz{w:val=18})'
+        )
+
+    @pytest.mark.parametrize(('text', 'expected_cxml'), [
+        ('', 'w:r/w:rPr'),
+        ('foo', 'w:r/(w:rPr,w:t"foo")'),
+        ('\tfoo \r\nbar\t', 'w:r/(w:rPr,w:tab,w:t{xml:space=preserve}"foo '
+         '",w:br,w:br,w:t"bar",w:tab)'),
+    ])
+    def it_translates_text_into_run_content(self, text, expected_cxml):
+        r = element('w:r/(w:rPr,w:t"old",w:tab)')
+        r.text = text
+        assert r.xml == xml(expected_cxml)
+
+    def it_rewrites_a_single_t_in_place(self):
+        r = element('w:r/(w:rPr/w:b,w:t"foo")')
+        t = r.find(qn('w:t'))
+        r.replace_text('bar')
+        assert r.find(qn('w:t')) is t
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -33,3 +78,19 @@ class DescribeCT_R(object):
         r = element(initial_cxml)
         expected_xml = xml(expected_cxml)
         return r, text, expected_xml
+
+    @pytest.fixture(params=[
+        ('w:r/(w:rPr/w:b,w:t"foo")', 'bar', 'w:r/(w:rPr/w:b,w:t"bar")'),
+        ('w:r/w:t{xml:space=preserve}" foo"', 'bar', 'w:r/w:t"bar"'),
+        ('w:r/w:t"foo"', 'bar ', 'w:r/w:t{xml:space=preserve}"bar "'),
+        ('w:r/(w:rPr/w:b,w:t"foo")', 'a\tb',
+         'w:r/(w:rPr/w:b,w:t"a",w:tab,w:t"b")'),
+        ('w:r/(w:t"foo",w:br,w:t"bar")', 'baz', 'w:r/w:t"baz"'),
+        ('w:r/(w:rPr/w:b,w:t"foo")', '', 'w:r/w:rPr/w:b'),
+        ('w:r/w:rPr/w:b', 'bar', 'w:r/(w:rPr/w:b,w:t"bar")'),
+    ])
+    def replace_text_fixture(self, request):
+        initial_cxml, text, expected_cxml = request.param
+        r = element(initial_cxml)
+        expected_xml = xml(expected_cxml)
+        return r, text, expected_xml
@@ -20,6 +20,7 @@ from docx.styles.style import BaseStyle
 from docx.styles.styles import Styles
 
 from ..oxml.parts.unitdata.document import a_body, a_document
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -83,7 +84,7 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, False)
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
@@ -151,6 +152,22 @@ class DescribeDocumentPart(object):
         styles_.get_style_id.assert_called_once_with(style_, WD_STYLE_TYPE.CHARACTER)
         assert style_id == "BodyCharacter"
 
+    def it_resolves_effective_properties_against_its_styles(
+        self, _styles_part_prop_, styles_part_
+    ):
+        _styles_part_prop_.return_value = styles_part_
+        styles_part_.element = element(
+            "w:styles/w:style{w:type=paragraph,w:default=1}/(w:pPr/w:keepNext"
+            ",w:rPr/w:b)"
+        )
+        document_part = DocumentPart(None, None, None, None)
+
+        new_p = document_part.new_effective_p(element("w:p"))
+        new_r = document_part.new_effective_r(element("w:r/w:rPr/w:i"))
+
+        assert new_p.xml == xml("w:p/w:pPr/w:keepNext")
+        assert new_r.xml == xml("w:r/w:rPr/(w:b,w:i)")
+
     def it_provides_access_to_its_settings_part_to_help(
         self, part_related_by_, settings_part_
     ):
@@ -13,6 +13,7 @@ from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.image import ImagePart
 from docx.parts.story import BaseStoryPart
+from docx.shared import ProxyCache
 from docx.styles.style import BaseStyle
 
 from ..unitutil.cxml import element
@@ -62,6 +63,22 @@ class DescribeBaseStoryPart(object):
         document_part_.get_style_id.assert_called_once_with(style_, style_type)
         assert style_id == "BodyText"
 
+    def it_can_resolve_effective_properties(
+        self, _document_part_prop_, document_part_
+    ):
+        p, r, new_p, new_r = (
+            element("w:p"), element("w:r"), element("w:p"), element("w:r")
+        )
+        _document_part_prop_.return_value = document_part_
+        document_part_.new_effective_p.return_value = new_p
+        document_part_.new_effective_r.return_value = new_r
+        story_part = BaseStoryPart(None, None, None, None)
+
+        assert story_part.new_effective_p(p) is new_p
+        assert story_part.new_effective_r(r) is new_r
+        document_part_.new_effective_p.assert_called_once_with(p)
+        document_part_.new_effective_r.assert_called_once_with(r)
+
     def it_can_create_a_new_pic_inline(self, get_or_add_image_, image_, next_id_prop_):
         get_or_add_image_.return_value = "rId42", image_
         image_.scaled_dimensions.return_value = 444, 888
@@ -84,6 +101,19 @@ class DescribeBaseStoryPart(object):
 
         assert next_id == expected_value
 
+    def it_can_enable_and_disable_its_proxy_cache(self):
+        story_part = BaseStoryPart(None, None, None, None)
+        assert story_part._proxy_cache is None
+
+        story_part.enable_proxy_cache()
+        proxy_cache = story_part._proxy_cache
+        assert isinstance(proxy_cache, ProxyCache)
+        story_part.enable_proxy_cache()
+        assert story_part._proxy_cache is proxy_cache
+
+        story_part.disable_proxy_cache()
+        assert story_part._proxy_cache is None
+
     def it_knows_the_main_document_part_to_help(self, package_, document_part_):
         package_.main_document_part = document_part_
         story_part = BaseStoryPart(None, None, None, package_)
@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.oxml.ns import qn
 from docx.shared import Inches
 from docx.table import Table
 from docx.text.paragraph import Paragraph
@@ -37,6 +38,37 @@ class DescribeBlockItemContainer(object):
         assert table._element.xml == expected_xml
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_rows(self):
+        blkcntnr = BlockItemContainer(element('w:body/w:sectPr'), None)
+        table = blkcntnr.add_table_from_rows(
+            [['a', 'b', 'c'], ['d', None]], Inches(3)
+        )
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[0] is table._element
+        assert len(table.columns) == 3
+        assert [cell.text for cell in table._cells] == [
+            'a', 'b', 'c', 'd', '', ''
+        ]
+        assert table.rows[0]._tr.trPr.xml == xml('w:trPr/w:tblHeader')
+
+    def it_can_insert_a_copy_of_a_table(self):
+        blkcntnr = BlockItemContainer(element('w:body/w:sectPr'), None)
+        template = Table(element(
+            'w:tbl/(w:tblPr/w:tblStyle{w:val=Grid},w:tblGrid/w:gridCol,'
+            'w:tr/w:tc/w:p/w:r/w:t"a")'
+        ), None)
+
+        table = blkcntnr.insert_table_copy(template, rows=2)
+
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[0] is table._element
+        assert table._element.xml == xml(
+            'w:tbl/(w:tblPr/w:tblStyle{w:val=Grid},w:tblGrid/w:gridCol,'
+            'w:tr/w:tc/w:p/w:r/w:t"a",w:tr/w:tc/w:p)'
+        )
+
     def it_provides_access_to_the_paragraphs_it_contains(
             self, paragraphs_fixture):
         # test len(), iterable, and indexed access
@@ -46,7 +78,7 @@ class DescribeBlockItemContainer(object):
         count = 0
         for idx, paragraph in enumerate(paragraphs):
             assert isinstance(paragraph, Paragraph)
-            assert paragraphs[idx] is paragraph
+            assert paragraphs[idx]._element is paragraph._element
             count += 1
         assert count == expected_count
 
@@ -58,10 +90,84 @@ class DescribeBlockItemContainer(object):
         count = 0
         for idx, table in enumerate(tables):
             assert isinstance(table, Table)
-            assert tables[idx] is table
+            assert tables[idx]._element is table._element
             count += 1
         assert count == expected_count
 
+    def it_can_iterate_its_inner_content(self, iter_fixture):
+        blkcntnr, recursive, expected_tags = iter_fixture
+        items = list(blkcntnr.iter_inner_content(recursive))
+        assert [item._element.tag for item in items] == expected_tags
+        for item in items:
+            assert isinstance(item, (Paragraph, Table))
+
+    def it_can_walk_its_nested_content_depth_first(self):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p,w:tbl/(w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},'
+            'w:vMerge{w:val=restart}),w:p,w:tbl/w:tr/w:tc/w:p),w:tc/w:p),'
+            'w:tr/(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),w:tc/w:p'
+            ')),w:p)'
+        ), None)
+        items = list(blkcntnr.iter_nested_content())
+        assert [(depth, path) for depth, path, _ in items] == [
+            (0, (0,)), (0, (1,)),
+            (1, (1, 0, 0, 0)), (1, (1, 0, 0, 1)),
+            (2, (1, 0, 0, 1, 0, 0, 0)),
+            (1, (1, 0, 2, 0)), (1, (1, 1, 2, 0)),
+            (0, (2,)),
+        ]
+        assert [type(block) for _, _, block in items] == [
+            Paragraph, Table, Paragraph, Table, Paragraph, Paragraph,
+            Paragraph, Paragraph,
+        ]
+        blocks = [block for _, _, block in items]
+        assert blocks[0]._parent is blkcntnr
+        assert blocks[2]._parent._element is blocks[1]._element[0][0]
+        assert blocks[4]._parent._parent is blocks[3]
+
+    def it_can_iterate_the_text_it_contains(self, iter_text_fixture):
+        blkcntnr, include_tables, expected_text = iter_text_fixture
+        text = list(blkcntnr.iter_text(include_tables))
+        assert text == expected_text
+
+    @pytest.mark.parametrize(('include_tables', 'expected_cxml', 'removed'), [
+        (True,
+         'w:body/(w:p/w:r/w:t"ab",w:tbl/w:tr/w:tc/w:p/w:r/w:t"cd")', 4),
+        (False,
+         'w:body/(w:p/w:r/w:t"ab",w:tbl/w:tr/w:tc/w:p/(w:r/w:t"c",w:r/w:t"d"'
+         '))', 2),
+    ])
+    def it_can_normalize_the_runs_it_contains(
+        self, include_tables, expected_cxml, removed
+    ):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p/(w:r/w:t"a",w:r/w:t"b"),w:tbl/w:tr/w:tc/w:p/(w:r/w:t'
+            '"c",w:r/w:t"d"))'
+        ), None)
+
+        assert blkcntnr.normalize_runs(include_tables) == removed
+        assert blkcntnr._element.xml == xml(expected_cxml)
+
+    @pytest.mark.parametrize(('include_tables', 'expected_cxml', 'count'), [
+        (True,
+         'w:body/(w:p/w:r/w:t"xy",w:tbl/w:tr/w:tc/w:p/w:r/w:t"cy")', 2),
+        (False,
+         'w:body/(w:p/w:r/w:t"xy",w:tbl/w:tr/w:tc/w:p/w:r/w:t"cab")',
+         1),
+    ])
+    def it_can_replace_the_text_it_contains(
+        self, include_tables, expected_cxml, count
+    ):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p/(w:r/w:t"xa",w:r/w:t"b"),w:tbl/w:tr/w:tc/w:p/w:r/w:t'
+            '"cab")'
+        ), None)
+
+        assert blkcntnr.replace('ab', 'y', include_tables=include_tables) == (
+            count
+        )
+        assert blkcntnr._element.xml == xml(expected_cxml)
+
     def it_adds_a_paragraph_to_help(self, _add_paragraph_fixture):
         blkcntnr, expected_xml = _add_paragraph_fixture
         new_paragraph = blkcntnr._add_paragraph()
@@ -97,6 +203,52 @@ class DescribeBlockItemContainer(object):
         expected_xml = snippet_seq('new-tbl')[0]
         return blkcntnr, rows, cols, width, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body',                            False, ''),
+        ('w:body/(w:p,w:tbl,w:p)',            False, 'p tbl p'),
+        ('w:body/(w:p,w:sectPr)',             False, 'p'),
+        ('w:body/(w:tbl/w:tr/w:tc/w:p,w:p)',  False, 'tbl p'),
+        ('w:body/(w:tbl/w:tr/w:tc/w:p,w:p)',  True,  'tbl p p'),
+        ('w:body/(w:p,w:tbl/w:tr/w:tc/(w:p,w:tbl/w:tr/w:tc/w:p),w:p)',
+         True, 'p tbl p tbl p p'),
+        ('w:body/w:tbl/(w:tr/(w:tc/w:p,w:tc/w:p),w:tr/w:tc/w:p)',
+         True, 'tbl p p p'),
+        ('w:body/w:tbl/(w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p),'
+         'w:tr/w:tc/(w:tcPr/w:vMerge,w:p))', True, 'tbl p'),
+    ])
+    def iter_fixture(self, request):
+        blkcntnr_cxml, recursive, tags_str = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        expected_tags = [qn('w:%s' % tag) for tag in tags_str.split()]
+        return blkcntnr, recursive, expected_tags
+
+    @pytest.fixture(params=[
+        ('w:body', True, []),
+        ('w:body/w:p', True, ['']),
+        ('w:body/(w:p/w:r/w:t"foo",w:p,w:p/w:r/w:t"bar")', True,
+         ['foo', '', 'bar']),
+        ('w:body/w:p/(w:r/(w:t"a",w:tab,w:t"b"),w:r/(w:br,w:cr,w:t"c"))', True,
+         ['a\tb\n\nc']),
+        ('w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"bar",w:tc/w:p'
+         '/w:r/w:t"baz"),w:p/w:r/w:t"zoo")', True,
+         ['foo', 'bar', 'baz', 'zoo']),
+        ('w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"bar",w:tc/w:p'
+         '/w:r/w:t"baz"),w:p/w:r/w:t"zoo")', False,
+         ['foo', 'zoo']),
+        ('w:body/w:tbl/w:tr/w:tc/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p/w:r/w:t'
+         '"bar")', True, ['foo', 'bar']),
+        ('w:body/(w:sdt/w:sdtContent/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p/w:'
+         'r/w:t"bar"),w:p/w:r/(w:t"zoo",w:pict/w:txbxContent/w:p/w:r/w:t"box"'
+         '))', True, ['foo', 'bar', 'zoo']),
+        ('w:body/(w:sdt/w:sdtContent/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p/w:'
+         'r/w:t"bar"),w:p/w:r/(w:t"zoo",w:pict/w:txbxContent/w:p/w:r/w:t"box"'
+         '))', False, ['foo', 'zoo']),
+    ])
+    def iter_text_fixture(self, request):
+        blkcntnr_cxml, include_tables, expected_text = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        return blkcntnr, include_tables, expected_text
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
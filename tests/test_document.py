@@ -11,7 +11,7 @@ from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.opc.coreprops import CoreProperties
 from docx.parts.document import DocumentPart
-from docx.section import Section, Sections
+from docx.section import _Header, Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
 from docx.shared import Length
@@ -88,10 +88,22 @@ class DescribeDocument(object):
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_rows(self, add_table_fixture):
+        document, _, _, style, width, table_ = add_table_fixture
+        add_table_from_rows = document._body.add_table_from_rows
+        add_table_from_rows.return_value = table_
+        rows = [['a', 'b']]
+
+        table = document.add_table_from_rows(rows, style, header=False)
+
+        add_table_from_rows.assert_called_once_with(rows, width, header=False)
+        assert table == table_
+        assert table.style == style
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, False)
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -102,6 +114,130 @@ class DescribeDocument(object):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    def it_can_insert_a_copy_of_a_table(self, body_prop_, table_):
+        document = Document(None, None)
+        body_prop_.return_value.insert_table_copy.return_value = table_
+        template = object()
+
+        table = document.insert_table_copy(template, 3)
+
+        body_prop_.return_value.insert_table_copy.assert_called_once_with(
+            template, 3
+        )
+        assert table is table_
+
+    def it_can_iterate_its_inner_content(self, body_prop_):
+        document = Document(None, None)
+        body_prop_.return_value.iter_inner_content.return_value = iter(())
+
+        document.iter_inner_content(True)
+
+        body_prop_.return_value.iter_inner_content.assert_called_once_with(
+            True
+        )
+
+    def it_can_walk_its_nested_content(self, body_prop_):
+        document = Document(None, None)
+        walk = iter(())
+        body_prop_.return_value.iter_nested_content.return_value = walk
+
+        assert document.iter_nested_content() is walk
+
+    def it_can_iterate_the_text_it_contains(self, iter_text_fixture):
+        document, kwargs, expected_text = iter_text_fixture
+        assert list(document.iter_text(**kwargs)) == expected_text
+
+    def it_can_include_header_and_footer_text(
+        self, request, sections_prop_, section_
+    ):
+        document = Document(element('w:document/w:body/w:p/w:r/w:t"foo"'), None)
+        part_, other_part_ = object(), object()
+        hdrftrs = [
+            instance_mock(
+                request, _Header, is_linked_to_previous=linked, part=part,
+                name='hdrftr_%d' % idx
+            )
+            for idx, (linked, part) in enumerate((
+                (False, part_), (True, part_), (False, other_part_),
+                (False, part_), (True, None), (True, None),
+            ))
+        ]
+        hdrftrs[0].iter_text.return_value = iter(['hdr'])
+        hdrftrs[2].iter_text.return_value = iter(['ftr'])
+        (section_.header, section_.even_page_header,
+         section_.first_page_header, section_.footer,
+         section_.even_page_footer, section_.first_page_footer) = hdrftrs
+        sections_prop_.return_value = [section_]
+
+        text = list(document.iter_text(include_headers_footers=True))
+
+        assert text == ['foo', 'hdr', 'ftr']
+        hdrftrs[0].iter_text.assert_called_once_with(True)
+        assert hdrftrs[3].iter_text.call_count == 0
+
+    def it_can_normalize_the_runs_it_contains(
+        self, request, sections_prop_, section_
+    ):
+        document = Document(
+            element('w:document/w:body/w:p/(w:r/w:t"a",w:r/w:t"b")'), None
+        )
+        hdrftrs = [
+            instance_mock(
+                request, _Header, is_linked_to_previous=linked,
+                part=object(), name='hdrftr_%d' % idx
+            )
+            for idx, linked in enumerate(
+                (False, True, True, False, True, True)
+            )
+        ]
+        hdrftrs[0].normalize_runs.return_value = 3
+        hdrftrs[3].normalize_runs.return_value = 4
+        (section_.header, section_.even_page_header,
+         section_.first_page_header, section_.footer,
+         section_.even_page_footer, section_.first_page_footer) = hdrftrs
+        sections_prop_.return_value = [section_]
+
+        assert document.normalize_runs() == 2
+        assert document.normalize_runs(False, True) == 7
+        hdrftrs[0].normalize_runs.assert_called_once_with(False)
+        hdrftrs[3].normalize_runs.assert_called_once_with(False)
+
+    def it_can_replace_the_text_it_contains(
+        self, request, sections_prop_, section_
+    ):
+        document = Document(
+            element('w:document/w:body/w:p/(w:r/w:t"a",w:r/w:t"b")'), None
+        )
+        hdrftrs = [
+            instance_mock(
+                request, _Header, is_linked_to_previous=linked,
+                part=object(), name='hdrftr_%d' % idx
+            )
+            for idx, linked in enumerate(
+                (False, True, True, False, True, True)
+            )
+        ]
+        hdrftrs[0].replace.return_value = 3
+        hdrftrs[3].replace.return_value = 4
+        (section_.header, section_.even_page_header,
+         section_.first_page_header, section_.footer,
+         section_.even_page_footer, section_.first_page_footer) = hdrftrs
+        sections_prop_.return_value = [section_]
+        mapping = {'b': 'c'}
+
+        assert document.replace('ab', 'x') == 1
+        assert document.text == 'x'
+        assert document.replace(mapping, None, False, False, True) == 7
+        hdrftrs[0].replace.assert_called_once_with(mapping, None, False, False)
+        hdrftrs[3].replace.assert_called_once_with(mapping, None, False, False)
+
+    def it_knows_the_text_it_contains(self):
+        document = Document(element(
+            'w:document/w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p/w:r/w:t'
+            '"bar",w:p/w:r/(w:t"b",w:tab,w:t"z"))'
+        ), None)
+        assert document.text == 'foo\nbar\nb\tz'
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
@@ -231,6 +367,18 @@ class DescribeDocument(object):
         document_part_.inline_shapes = inline_shapes_
         return document, inline_shapes_
 
+    @pytest.fixture(params=[
+        ({}, ['foo', 'bar', 'baz']),
+        ({'include_tables': False}, ['foo', 'baz']),
+    ])
+    def iter_text_fixture(self, request):
+        kwargs, expected_text = request.param
+        document = Document(element(
+            'w:document/w:body/(w:p/w:r/w:t"foo",w:tbl/w:tr/w:tc/w:p/w:r/w:t'
+            '"bar",w:p/w:r/w:t"baz",w:sectPr)'
+        ), None)
+        return document, kwargs, expected_text
+
     @pytest.fixture
     def paragraphs_fixture(self, body_prop_, paragraphs_):
         document = Document(None, None)
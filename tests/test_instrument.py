@@ -0,0 +1,96 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.instrument module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx import Document, instrument
+from docx.instrument import Recorder, instrumented
+
+from .unitutil.file import test_file
+
+
+class DescribeInstrumented(object):
+
+    def it_does_not_report_when_disabled(self, events):
+        instrument.disable()
+        assert instrumented('foo')(lambda x: x * 2)(21) == 42
+        assert events == []
+        assert instrument.is_enabled() is False
+
+    def it_reports_each_call_when_enabled(self, events):
+        instrument.enable(lambda *args: events.append(args))
+        assert instrumented('foo')(lambda x: x * 2)(21) == 42
+        assert instrument.is_enabled() is True
+        assert len(events) == 1
+        event, seconds = events[0]
+        assert event == 'foo'
+        assert seconds >= 0.0
+
+    def it_reports_calls_that_raise(self, events):
+        def fail():
+            raise ValueError('bar')
+
+        instrument.enable(lambda *args: events.append(args))
+        with pytest.raises(ValueError):
+            instrumented('fail')(fail)()
+        assert [event for event, _ in events] == ['fail']
+
+    def it_does_not_let_a_failing_callback_hide_an_exception(self, events):
+        def fail():
+            raise ValueError('bar')
+
+        def callback(event, seconds):
+            events.append(event)
+            raise KeyError(event)
+
+        instrument.enable(callback)
+        with pytest.raises(ValueError):
+            instrumented('fail')(fail)()
+        with pytest.raises(KeyError):
+            instrumented('foo')(lambda: None)()
+        assert events == ['fail', 'foo']
+
+    def it_reports_the_hot_paths_of_open_and_save(self, request, tmpdir):
+        request.addfinalizer(instrument.disable)
+        recorder = Recorder()
+        instrument.enable(recorder)
+        document = Document()
+        document.add_paragraph('foo', 'Heading 1')
+        document.add_picture(test_file('monty-truth.png'))
+        document.save(str(tmpdir.join('instrumented.docx')))
+
+        stats = recorder.stats
+        for event in (
+            'PackageReader.from_file', 'Unmarshaller.unmarshal',
+            'XmlPart.load', 'XmlPart.blob', 'PackageWriter.write',
+            'Styles.get_style_id', 'Image._from_stream',
+        ):
+            count, seconds = stats[event]
+            assert count >= 1
+            assert seconds >= 0.0
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def events(self, request):
+        request.addfinalizer(instrument.disable)
+        return []
+
+
+class DescribeRecorder(object):
+
+    def it_accumulates_a_count_and_total_time_per_event(self):
+        recorder = Recorder()
+        recorder('foo', 1.0)
+        recorder('bar', 0.25)
+        recorder('foo', 0.5)
+        assert recorder.stats == {'foo': [2, 1.5], 'bar': [1, 0.25]}
+
+    def it_can_be_cleared(self):
+        recorder = Recorder()
+        recorder('foo', 1.0)
+        recorder.clear()
+        assert recorder.stats == {}
@@ -58,6 +58,31 @@ class DescribeSections(object):
         ]
         assert section_lst == [section_, section_, section_]
 
+    @pytest.mark.parametrize(
+        "document_cxml, expected_idx",
+        (
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:sectPr)", 1),
+            ("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p)", 0),
+        ),
+    )
+    def it_can_access_its_last_Section_instance(
+        self, document_cxml, expected_idx, Section_, section_, document_part_
+    ):
+        document_elm = element(document_cxml)
+        sectPrs = document_elm.xpath("//w:sectPr")
+        Section_.return_value = section_
+        sections = Sections(document_elm, document_part_)
+
+        section = sections[-1]
+
+        Section_.assert_called_once_with(sectPrs[expected_idx], document_part_)
+        assert section is section_
+
+    def it_raises_on_last_section_when_there_are_none(self):
+        sections = Sections(element("w:document/w:body/w:p"), None)
+        with pytest.raises(IndexError):
+            sections[-1]
+
     def it_can_access_its_Section_instances_by_slice(
         self, Section_, section_, document_part_
     ):
@@ -12,8 +12,10 @@ import pytest
 
 from docx.opc.part import XmlPart
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, Length, Cm, Emu, Inches, Mm, Parented, ProxyCache,
+    ProxyList, Pt, RGBColor, Twips
 )
+from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -74,6 +76,130 @@ class DescribeElementProxy(object):
         return instance_mock(request, XmlPart)
 
 
+class DescribeParented(object):
+
+    def it_creates_proxies_for_its_child_elements(self):
+        parent = Parented(None)
+        p = element('w:p')
+        paragraph = parent._get_proxy(p, Paragraph)
+        assert isinstance(paragraph, Paragraph)
+        assert paragraph._element is p
+        assert paragraph._parent is parent
+        assert parent._get_proxy(p, Paragraph) is not paragraph
+
+    def it_reuses_proxies_when_its_part_caches_them(self, cache_parent_):
+        parent = Parented(cache_parent_)
+        ps = element('w:body/(w:p,w:p)').getchildren()
+        paragraphs = parent._proxies_for(ps, Paragraph)
+        assert [p._element for p in paragraphs] == ps
+        assert parent._proxies_for(ps, Paragraph) == paragraphs
+        assert parent._get_proxy(ps[1], Paragraph) is paragraphs[1]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def cache_parent_(self, request):
+        parent_ = instance_mock(request, Parented)
+        parent_._proxy_cache = ProxyCache()
+        return parent_
+
+
+class DescribeProxyList(object):
+
+    def it_knows_how_many_items_it_contains(self, len_fixture):
+        proxy_list, expected_len = len_fixture
+        assert len(proxy_list) == expected_len
+
+    def it_provides_indexed_access_to_its_items(self, getitem_fixture):
+        proxy_list, idx, expected_elm = getitem_fixture
+        paragraph = proxy_list[idx]
+        assert isinstance(paragraph, Paragraph)
+        assert paragraph._element is expected_elm
+        assert paragraph._parent is proxy_list._parent
+
+    def it_raises_on_indexed_access_out_of_range(self, body, parent):
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        with pytest.raises(IndexError):
+            proxy_list[3]
+        with pytest.raises(IndexError):
+            proxy_list[-4]
+
+    def it_supports_slicing(self, body, parent):
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        paragraphs = proxy_list[::-2]
+        assert [p._element for p in paragraphs] == body.p_lst[::-2]
+
+    def it_can_iterate_over_its_items(self, body, parent):
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        paragraphs = list(proxy_list)
+        assert [p._element for p in paragraphs] == body.p_lst
+        assert all(p._parent is parent for p in paragraphs)
+
+    def it_iterates_the_items_present_when_iteration_starts(
+        self, body, parent
+    ):
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        paragraphs = []
+        for paragraph in proxy_list:
+            body.add_p()
+            paragraphs.append(paragraph)
+        assert [p._element for p in paragraphs] == body.p_lst[:3]
+        assert len(proxy_list) == 6
+
+    def it_reflects_changes_to_its_element(self, body, parent):
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        new_p = body.add_p()
+        assert len(proxy_list) == 4
+        assert proxy_list[-1]._element is new_p
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:body',                 0),
+        ('w:body/w:tbl',           0),
+        ('w:body/(w:p,w:tbl,w:p)', 2),
+    ])
+    def len_fixture(self, request, parent):
+        body_cxml, expected_len = request.param
+        proxy_list = ProxyList(element(body_cxml), 'w:p', Paragraph, parent)
+        return proxy_list, expected_len
+
+    @pytest.fixture(params=[(0, 0), (1, 1), (2, 2), (-1, 2), (-3, 0)])
+    def getitem_fixture(self, request, body, parent):
+        idx, elm_idx = request.param
+        proxy_list = ProxyList(body, 'w:p', Paragraph, parent)
+        expected_elm = body.p_lst[elm_idx]
+        return proxy_list, idx, expected_elm
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def body(self):
+        return element('w:body/(w:p,w:tbl,w:p,w:p,w:sectPr)')
+
+    @pytest.fixture
+    def parent(self):
+        return Parented(None)
+
+
+class DescribeProxyCache(object):
+
+    def it_creates_a_proxy_only_on_first_request(self):
+        cache, p, parent = ProxyCache(), element('w:p'), Parented(None)
+        paragraph = cache.get(p, Paragraph, parent)
+        assert isinstance(paragraph, Paragraph)
+        assert paragraph._parent is parent
+        assert cache.get(p, Paragraph, None) is paragraph
+        assert len(cache) == 1
+
+    def it_can_be_cleared(self):
+        cache, p = ProxyCache(), element('w:p')
+        paragraph = cache.get(p, Paragraph, None)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get(p, Paragraph, None) is not paragraph
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -10,10 +10,12 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import (
     WD_ALIGN_VERTICAL, WD_ROW_HEIGHT, WD_TABLE_ALIGNMENT, WD_TABLE_DIRECTION
 )
+from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tc
 from docx.parts.document import DocumentPart
-from docx.shared import Inches
+from docx.shared import Inches, Twips
 from docx.table import _Cell, _Column, _Columns, _Row, _Rows, Table
 from docx.text.paragraph import Paragraph
 
@@ -21,7 +23,7 @@ from .oxml.unitdata.table import a_gridCol, a_tbl, a_tblGrid, a_tc, a_tr
 from .oxml.unitdata.text import a_p
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import instance_mock, property_mock
+from .unitutil.mock import instance_mock, method_mock, property_mock
 
 
 class DescribeTable(object):
@@ -34,6 +36,61 @@ class DescribeTable(object):
         assert row._tr is table._tbl.tr_lst[-1]
         assert row._parent is table
 
+    def it_can_add_rows_in_bulk(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=720}),w:tr/'
+            '(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        rows = table.add_rows(3)
+        tr_lst = table._tbl.tr_lst
+        assert len(tr_lst) == 4
+        assert [row._tr for row in rows] == tr_lst[1:]
+        assert all(row._parent is table for row in rows)
+        assert tr_lst[3].xml == xml(
+            'w:tr/(w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p),w:tc/(w:tcPr/'
+            'w:tcW{w:type=dxa,w:w=720},w:p))'
+        )
+        assert len(table._cells) == 8
+
+    def it_can_append_a_row_of_values(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440},'
+            'w:gridCol{w:w=1440}),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p))'
+        ), None)
+        row = table.append_row(['a', 42])
+        assert isinstance(row, _Row)
+        assert row._tr is table._tbl.tr_lst[-1]
+        assert [cell.text for cell in row.cells] == ['a', '42', '']
+        with pytest.raises(ValueError):
+            table.append_row(['a', 'b', 'c', 'd'])
+
+    def it_reuses_its_prototype_row_until_the_columns_change(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/w:gridCol{w:w=1440},w:tr/w:tc/w:p)'
+        ), None)
+        table.add_rows(2)
+        prototype = table._tr_prototype[1]
+        table.append_row(['a'])
+        assert table._tr_prototype[1] is prototype
+
+        table.add_column(Inches(1))
+        row = table.add_row()
+        assert table._tr_prototype[1] is not prototype
+        assert len(row._tr.tc_lst) == 2
+
+    def it_rebuilds_its_prototype_row_when_a_column_width_changes(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=4320},w:gridCol{w:w=4320}),w:tr/'
+            '(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        table.add_row()
+        table.columns[0].width = Inches(1)
+        row = table.add_row()
+        assert [cell.width for cell in row.cells] == [Inches(1), Twips(4320)]
+        table.columns.set_widths([Inches(2), Inches(3)])
+        row = table.add_row()
+        assert [cell.width for cell in row.cells] == [Inches(2), Inches(3)]
+
     def it_can_add_a_column(self, add_column_fixture):
         table, width, expected_xml = add_column_fixture
         column = table.add_column(width)
@@ -67,8 +124,182 @@ class DescribeTable(object):
     def it_provides_access_to_the_cells_in_a_row(self, row_cells_fixture):
         table, row_idx, expected_cells = row_cells_fixture
         row_cells = table.row_cells(row_idx)
+        table._grid_cells.assert_called_once_with(table, row_idx)
         assert row_cells == expected_cells
 
+    def it_can_fill_its_cells_from_rows_of_values(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),w:tr/'
+            '(w:tc/w:p/w:r/w:t"x",w:tc/w:p))'
+        ), None)
+        table.fill(row for row in [['a', 1], [None, 2.5], ['b']])
+        assert len(table.rows) == 3
+        assert [cell.text for cell in table._cells] == [
+            'a', '1', '', '2.5', 'b', ''
+        ]
+
+    def it_can_fill_its_cells_from_an_array_like(self):
+        class ArrayLike(object):
+            def tolist(self):
+                return [[1, 2]]
+
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        table.fill(ArrayLike())
+        assert [cell.text for cell in table._cells] == ['1', '2']
+
+    def it_raises_on_fill_with_a_row_wider_than_the_table(self):
+        table = Table(element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)'), None)
+        with pytest.raises(ValueError):
+            table.fill([['a', 'b']])
+
+    def it_raises_on_fill_with_a_row_wider_than_its_table_row(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),'
+            'w:tr/w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p))'
+        ), None)
+        with pytest.raises(ValueError):
+            table.fill([['a', 'b'], ['c', 'd']])
+        assert [cell.text for cell in table._cells] == ['', '', '', '']
+
+    def it_leaves_vertically_merged_cells_unchanged_on_fill(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/w:vMe'
+            'rge{w:val=restart},w:p),w:tc/w:p),w:tr/(w:tc/(w:tcPr/w:vMerge,w:'
+            'p),w:tc/w:p))'
+        ), None)
+        table.fill([['a', 'b'], [None, 'c']])
+        assert table._tbl.xml == xml(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/w:vMe'
+            'rge{w:val=restart},w:p/w:r/w:t"a"),w:tc/w:p/w:r/w:t"b"),w:tr/(w:'
+            'tc/(w:tcPr/w:vMerge,w:p),w:tc/w:p/w:r/w:t"c"))'
+        )
+        assert table.to_rows() == [['a', 'b'], ['a', 'c']]
+
+    def it_raises_on_fill_with_a_value_for_a_vertically_merged_cell(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=res'
+            'tart},w:p),w:tr/w:tc/(w:tcPr/w:vMerge{w:val=continue},w:p))'
+        ), None)
+        with pytest.raises(ValueError):
+            table.fill([['a'], ['b']])
+        assert table.to_rows() == [[''], ['']]
+
+    def it_can_generate_the_cell_values_of_each_row(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p/w:r/w:t"a",'
+            'w:tc/w:p/w:r/w:t"b"),w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2},'
+            'w:p/w:r/w:t"c")))'
+        ), None)
+        rows = list(table.iter_values())
+        assert rows == [['a', 'b'], ['c', 'c']]
+        assert rows == [
+            [cell.text for cell in row.cells] for row in table.rows
+        ]
+
+    def it_can_return_its_values_as_rows_or_columns(self):
+        table = Table(element(
+            'w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p/w:r/w:t"b"),w:tr/w:tc/'
+            'w:p/w:r/w:t"c")'
+        ), None)
+        assert table.to_rows() == [['a', 'b'], ['c']]
+        assert table.to_rows(by_column=True) == [['a', 'c'], ['b', '']]
+        assert Table(element('w:tbl'), None).to_rows(by_column=True) == []
+
+    def it_can_merge_regions_in_bulk(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p,'
+            'w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),w:tr/(w:tc/'
+            'w:p,w:tc/w:p,w:tc/w:p))'
+        ), None)
+        merged_cells = table.merge_regions(
+            [((0, 0), (1, 0)), ((0, 1), (0, 2)), ((1, 1), (2, 2))]
+        )
+        cells = table._cells
+        assert [cell._tc for cell in merged_cells] == [
+            cells[0]._tc, cells[1]._tc, cells[4]._tc
+        ]
+        assert cells[0] is cells[3]
+        assert cells[1] is cells[2]
+        assert cells[4] is cells[5] is cells[7] is cells[8]
+        assert cells[6] is not cells[3]
+
+    def it_raises_on_a_non_rectangular_region(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/'
+            'w:gridSpan{w:val=2},w:p)),w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        with pytest.raises(InvalidSpanError):
+            table.merge_regions([((0, 0), (1, 0))])
+
+    def it_can_clone_itself(self):
+        body = element(
+            'w:body/(w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a"),'
+            'w:p,w:sectPr)'
+        )
+        parent, paragraph = object(), Paragraph(body[1], None)
+        table = Table(body[0], parent)
+
+        clone = table.clone()
+        clone_2 = table.clone(after=paragraph, rows=2)
+
+        assert isinstance(clone, Table)
+        assert clone._parent is parent
+        assert clone_2._parent is None
+        assert body.xml == xml(
+            'w:body/(w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a"),'
+            'w:p,w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a",w:tr/'
+            'w:tc/w:p),w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p/w:r/w:t"a"),'
+            'w:sectPr)'
+        )
+        assert body[2] is clone_2._tbl
+        assert body[3] is clone._tbl
+
+    @pytest.mark.parametrize(('after_idx', 'expected_cxml'), [
+        (None,
+         'w:tc/(w:tcPr,w:p,w:tbl/w:tblGrid,w:p,w:tbl/w:tblGrid,w:p)'),
+        (1, 'w:tc/(w:tcPr,w:p,w:tbl/w:tblGrid,w:tbl/w:tblGrid,w:p)'),
+        (3, 'w:tc/(w:tcPr,w:p,w:tbl/w:tblGrid,w:p,w:tbl/w:tblGrid,w:p)'),
+    ])
+    def it_ends_a_cell_with_a_paragraph_when_cloned_into_it(
+        self, after_idx, expected_cxml
+    ):
+        tc = element('w:tc/(w:tcPr,w:p,w:tbl/w:tblGrid,w:p)')
+        table = Table(tc[2], None)
+        after = None if after_idx is None else Paragraph(tc[after_idx], None)
+
+        clone = table.clone(after)
+
+        assert tc.xml == xml(expected_cxml)
+        assert clone._tbl is tc[4 if after_idx != 1 else 2]
+
+    def it_can_set_cell_properties_in_bulk(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p,'
+            'w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p)),w:tr/(w:tc/w:p,w:tc/('
+            'w:tcPr/(w:tcW{w:w=1,w:type=dxa},w:vAlign{w:val=top}),w:p),'
+            'w:tc/w:p))'
+        ), None)
+        table.set_cell_props(
+            rows=slice(0, 2), cols=slice(1, None), width=Inches(1),
+            vertical_alignment=WD_ALIGN_VERTICAL.CENTER
+        )
+        table.set_cell_props(cols=slice(2, 3), vertical_alignment=None)
+        assert table._tbl.xml == xml(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p,'
+            'w:tc/(w:tcPr/(w:tcW{w:w=1440,w:type=dxa},w:gridSpan{w:val=2},'
+            'w:vAlign{w:val=center}),w:p)),w:tr/(w:tc/w:p,w:tc/(w:tcPr/(w:tcW'
+            '{w:w=1440,w:type=dxa},w:vAlign{w:val=center}),w:p),w:tc/(w:tcPr/'
+            'w:tcW{w:w=1440,w:type=dxa},w:p)))'
+        )
+
+    def it_raises_on_an_unknown_cell_property(self):
+        tbl = element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)')
+        table = Table(tbl, None)
+        with pytest.raises(TypeError):
+            table.set_cell_props(bold=True)
+
     def it_knows_its_alignment_setting(self, alignment_get_fixture):
         table, expected_value = alignment_get_fixture
         assert table.alignment == expected_value
@@ -126,6 +357,71 @@ class DescribeTable(object):
             for idx in matching_idxs[1:]:
                 assert cells[idx] is cells[comparator_idx]
 
+    def it_reuses_its_cell_grid_until_the_layout_changes(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),w:tr/'
+            '(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        cells = table._cells
+        assert table._cells is cells
+        assert table.cell(0, 1) is cells[1]
+
+        table.add_row()
+        assert len(table._cells) == 4
+
+        table.add_column(Inches(1))
+        assert len(table._cells) == 6
+
+        table.cell(0, 0).merge(table.cell(1, 1))
+        cells = table._cells
+        assert cells[0] is cells[1] is cells[3] is cells[4]
+
+        table._tbl.remove(table._tbl.tr_lst[-1])
+        assert len(table._cells) == 3
+
+    def it_rebuilds_its_cell_grid_when_cells_are_removed_with_lxml(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p/w:r/w:t"00",w:tc/w:p/w:r/w:t"01",'
+            'w:tc/w:p/w:r/w:t"02"),'
+            'w:tr/(w:tc/w:p/w:r/w:t"10",w:tc/w:p/w:r/w:t"11",'
+            'w:tc/w:p/w:r/w:t"12"))'
+        ), None)
+        assert table.cell(0, 1).text == '01'
+
+        tbl = table._tbl
+        for tr in tbl.tr_lst:
+            tr.remove(tr.tc_lst[1])
+        tbl.tblGrid.remove(tbl.tblGrid.gridCol_lst[1])
+
+        assert table.cell(0, 1).text == '02'
+        assert [cell.text for cell in table.row_cells(1)] == ['10', '12']
+
+    def it_computes_the_cells_of_a_row_without_the_grid(
+            self, tr_cells_fixture):
+        table, expected_tcs = tr_cells_fixture
+        for tr, tcs in zip(table._tbl.tr_lst, expected_tcs):
+            cells = table._tr_cells(tr)
+            assert table._cell_grid is None
+            assert [cell._tc for cell in cells] == tcs
+            assert [cell._tc for cell in cells] == [
+                cell._tc for cell in table.row_cells(table._tr_idx(tr))
+            ]
+            table._cell_grid = None
+
+    def it_knows_the_index_of_each_of_its_rows(self):
+        tbl = element('w:tbl/(w:tblGrid,w:tr,w:tr,w:tr)')
+        table = Table(tbl, None)
+        assert [table._tr_idx(tr) for tr in tbl.tr_lst] == [0, 1, 2]
+        tr_idxs = table._tr_idxs
+        assert table._tr_idx(tbl.tr_lst[1]) == 1
+        assert table._tr_idxs is tr_idxs
+
+        tbl.remove(tbl.tr_lst[0])
+        assert table._tr_idx(tbl.tr_lst[0]) == 0
+        with pytest.raises(ValueError):
+            table._tr_idx(element('w:tr'))
+
     def it_knows_its_column_count_to_help(self, column_count_fixture):
         table, expected_value = column_count_fixture
         column_count = table._column_count
@@ -261,9 +557,9 @@ class DescribeTable(object):
         return table, new_value, expected_xml
 
     @pytest.fixture
-    def row_cells_fixture(self, _cells_, _column_count_):
+    def row_cells_fixture(self, _grid_cells_, _column_count_):
         table = Table(None, None)
-        _cells_.return_value = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+        _grid_cells_.return_value = [0, 1, 2, 3, 4, 5, 6, 7, 8]
         _column_count_.return_value = 3
         row_idx = 1
         expected_cells = [3, 4, 5]
@@ -303,6 +599,10 @@ class DescribeTable(object):
     def _cells_(self, request):
         return property_mock(request, Table, '_cells')
 
+    @pytest.fixture
+    def _grid_cells_(self, request):
+        return method_mock(request, Table, '_grid_cells')
+
     @pytest.fixture
     def _column_count_(self, request):
         return property_mock(request, Table, '_column_count')
@@ -317,6 +617,28 @@ class DescribeTable(object):
             request, Table, 'part', return_value=document_part_
         )
 
+    @pytest.fixture(params=[
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p))',
+         [[0, 1]]),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/'
+         'w:gridSpan{w:val=2},w:p)))',
+         [[0, 0]]),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/'
+         'w:vMerge{w:val=restart},w:p),w:tc/w:p),w:tr/(w:tc/(w:tcPr/w:vMerge,'
+         'w:p),w:tc/w:p),w:tr/(w:tc/(w:tcPr/w:vMerge,w:p),w:tc/w:p))',
+         [[0, 1], [0, 3], [0, 5]]),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcPr/'
+         '(w:gridSpan{w:val=2},w:vMerge{w:val=restart}),w:p),w:tc/w:p),w:tr/'
+         '(w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),w:tc/w:p))',
+         [[0, 0, 1], [0, 0, 3]]),
+    ])
+    def tr_cells_fixture(self, request):
+        tbl_cxml, tc_idxs = request.param
+        tbl = element(tbl_cxml)
+        tcs = list(tbl.iter_tcs())
+        expected_tcs = [[tcs[idx] for idx in row] for row in tc_idxs]
+        return Table(tbl, None), expected_tcs
+
     @pytest.fixture
     def table(self):
         tbl = _tbl_bldr(rows=2, cols=2).element
@@ -331,12 +653,32 @@ class Describe_Cell(object):
         text = cell.text
         assert text == expected_text
 
+    def it_includes_content_controls_but_not_nested_tables_in_its_text(self):
+        tbl = element(
+            'w:tbl/w:tr/w:tc/(w:p/w:r/w:t"foo",w:sdt/w:sdtContent/w:p/w:r/w:t'
+            '"bar",w:tbl/w:tr/w:tc/w:p/w:r/w:t"baz",w:p)'
+        )
+        cell = _Cell(tbl.tr_lst[0].tc_lst[0], None)
+        assert cell.text == 'foo\nbar\n'
+
     def it_can_replace_its_content_with_a_string_of_text(
             self, text_set_fixture):
         cell, text, expected_xml = text_set_fixture
         cell.text = text
         assert cell._tc.xml == expected_xml
 
+    @pytest.mark.parametrize(('keep_formatting', 'expected_cxml'), [
+        (True, 'w:tc/(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/(w:rPr/w:b,w:t"b")))'),
+        (False, 'w:tc/(w:tcPr/w:shd,w:p/w:r/w:t"b")'),
+    ])
+    def it_can_set_its_text_keeping_its_formatting(
+            self, keep_formatting, expected_cxml):
+        cell = _Cell(element(
+            'w:tc/(w:tcPr/w:shd,w:p/(w:pPr/w:jc,w:r/(w:rPr/w:b,w:t"a")),w:p)'
+        ), None)
+        cell.set_text('b', keep_formatting)
+        assert cell._tc.xml == xml(expected_cxml)
+
     def it_knows_its_vertical_alignment(self, alignment_get_fixture):
         cell, expected_value = alignment_get_fixture
         vertical_alignment = cell.vertical_alignment
@@ -365,7 +707,7 @@ class Describe_Cell(object):
         count = 0
         for idx, paragraph in enumerate(paragraphs):
             assert isinstance(paragraph, Paragraph)
-            assert paragraph is paragraphs[idx]
+            assert paragraph._element is paragraphs[idx]._element
             count += 1
         assert count == 2
 
@@ -377,7 +719,7 @@ class Describe_Cell(object):
         count = 0
         for idx, table in enumerate(tables):
             assert isinstance(table, Table)
-            assert tables[idx] is table
+            assert tables[idx]._element is table._element
             count += 1
         assert count == expected_count
 
@@ -393,6 +735,27 @@ class Describe_Cell(object):
         assert cell._element.xml == expected_xml
         assert isinstance(table, Table)
 
+    def it_can_add_a_table_from_rows(self):
+        cell = _Cell(
+            element('w:tc/(w:tcPr/w:tcW{w:w=2880,w:type=dxa},w:p)'), None
+        )
+        table = cell.add_table_from_rows([['a', 'b']], header=False)
+        assert [child.tag for child in cell._tc] == [
+            qn('w:tcPr'), qn('w:p'), qn('w:tbl'), qn('w:p')
+        ]
+        assert table._tbl is cell._tc[2]
+        assert [cell.text for cell in table._cells] == ['a', 'b']
+        assert [col.width for col in table.columns] == [Twips(1440)] * 2
+
+    def it_can_insert_a_copy_of_a_table(self):
+        cell = _Cell(element('w:tc/w:p'), None)
+        template = Table(element('w:tbl/w:tblGrid/w:gridCol'), None)
+
+        table = cell.insert_table_copy(template)
+
+        assert cell._tc.xml == xml('w:tc/(w:p,w:tbl/w:tblGrid/w:gridCol,w:p)')
+        assert table._tbl is cell._tc[1]
+
     def it_can_merge_itself_with_other_cells(self, merge_fixture):
         cell, other_cell, merged_tc_ = merge_fixture
         merged_cell = cell.merge(other_cell)
@@ -668,6 +1031,22 @@ class Describe_Columns(object):
         columns, table_ = table_fixture
         assert columns.table is table_
 
+    def it_knows_the_width_of_each_column(self):
+        tbl = element('w:tbl/w:tblGrid/(w:gridCol{w:w=1440},w:gridCol)')
+        assert _Columns(tbl, None).widths == [Inches(1), None]
+
+    def it_can_set_the_width_of_its_columns_in_bulk(self):
+        tbl = element(
+            'w:tbl/w:tblGrid/(w:gridCol,w:gridCol{w:w=42},w:gridCol)'
+        )
+        columns = _Columns(tbl, None)
+        columns.set_widths([Inches(1), None])
+        assert tbl.xml == xml(
+            'w:tbl/w:tblGrid/(w:gridCol{w:w=1440},w:gridCol,w:gridCol)'
+        )
+        with pytest.raises(ValueError):
+            columns.set_widths([1, 2, 3, 4])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -711,9 +1090,9 @@ class Describe_Row(object):
         assert row._tr.xml == expected_xml
 
     def it_provides_access_to_its_cells(self, cells_fixture):
-        row, row_idx, expected_cells = cells_fixture
+        row, expected_cells = cells_fixture
         cells = row.cells
-        row.table.row_cells.assert_called_once_with(row_idx)
+        row.table._tr_cells.assert_called_once_with(row._tr)
         assert cells == expected_cells
 
     def it_provides_access_to_the_table_it_belongs_to(self, table_fixture):
@@ -727,12 +1106,11 @@ class Describe_Row(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def cells_fixture(self, _index_, table_prop_, table_):
-        row = _Row(None, None)
-        _index_.return_value = row_idx = 6
+    def cells_fixture(self, table_prop_, table_):
+        row = _Row(element('w:tr'), None)
         expected_cells = (1, 2, 3)
-        table_.row_cells.return_value = list(expected_cells)
-        return row, row_idx, expected_cells
+        table_._tr_cells.return_value = list(expected_cells)
+        return row, expected_cells
 
     @pytest.fixture(params=[
         ('w:tr',                               None),
@@ -812,7 +1190,7 @@ class Describe_Row(object):
     def idx_fixture(self):
         tbl = element('w:tbl/(w:tr,w:tr,w:tr)')
         tr, expected_idx = tbl[1], 1
-        row = _Row(tr, None)
+        row = _Row(tr, Table(tbl, None))
         return row, expected_idx
 
     @pytest.fixture
@@ -823,10 +1201,6 @@ class Describe_Row(object):
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _index_(self, request):
-        return property_mock(request, _Row, '_index')
-
     @pytest.fixture
     def parent_(self, request):
         return instance_mock(request, Table)
@@ -882,6 +1256,22 @@ class Describe_Rows(object):
         rows, table_ = table_fixture
         assert rows.table is table_
 
+    def it_can_set_the_height_of_its_rows_in_bulk(self):
+        tbl = element(
+            'w:tbl/(w:tr/w:tc/w:p,w:tr/(w:trPr/w:trHeight{w:val=42},w:tc/w:p),'
+            'w:tr/w:tc/w:p)'
+        )
+        rows = _Rows(tbl, None)
+        rows.set_heights([Inches(1), Inches(2)], WD_ROW_HEIGHT.EXACTLY)
+        rows.set_heights([None])
+        assert tbl.xml == xml(
+            'w:tbl/(w:tr/(w:trPr/w:trHeight{w:hRule=exact},w:tc/w:p),'
+            'w:tr/(w:trPr/w:trHeight{w:val=2880,w:hRule=exact},w:tc/w:p),'
+            'w:tr/w:tc/w:p)'
+        )
+        with pytest.raises(ValueError):
+            rows.set_heights([1, 2, 3, 4])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -4,10 +4,10 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import OrderedDict
+
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.text.run import CT_R
 from docx.parts.document import DocumentPart
 from docx.text.paragraph import Paragraph
 from docx.text.parfmt import ParagraphFormat
@@ -17,7 +17,7 @@ import pytest
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    call, class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, function_mock, instance_mock, method_mock, property_mock
 )
 
 
@@ -45,6 +45,95 @@ class DescribeParagraph(object):
         paragraph, expected_text = text_get_fixture
         assert paragraph.text == expected_text
 
+    def it_can_iterate_the_fragments_of_its_text(self):
+        paragraph = Paragraph(element(
+            'w:p/(w:pPr/w:tabs/w:tab,w:r/(w:t"foo",w:tab,w:t),w:hyperlink/w:r/'
+            'w:t"bar",w:r/(w:br,w:t"baz",w:cr))'
+        ), None)
+        fragments = list(paragraph.iter_text_fragments())
+        assert fragments == ['foo', '\t', '\n', 'baz', '\n']
+        assert ''.join(fragments) == paragraph.text
+
+    @pytest.mark.parametrize(('p_cxml', 'expected_cxml', 'removed'), [
+        ('w:p', 'w:p', 0),
+        ('w:p/(w:pPr,w:r/w:t"foo",w:proofErr,w:r/(w:rPr,w:t"bar",w:t,w:tab))',
+         'w:p/(w:pPr,w:r/(w:t"foobar",w:tab))', 4),
+        ('w:p/(w:r/(w:rPr/w:b,w:t"a "),w:r/(w:rPr/w:b,w:t" b"),w:r/w:t"c")',
+         'w:p/(w:r/(w:rPr/w:b,w:t"a  b"),w:r/w:t"c")', 2),
+        ('w:p/(w:r/w:t"a",w:r/(w:t"b",w:drawing),w:r/w:t"c",w:r/w:t"d")',
+         'w:p/(w:r/w:t"a",w:r/(w:t"b",w:drawing),w:r/w:t"cd")', 2),
+        ('w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:t"c"),w:r/w:t"d")',
+         'w:p/(w:r/w:t"a",w:hyperlink/w:r/w:t"bc",w:r/w:t"d")', 2),
+    ])
+    def it_can_normalize_its_runs(self, p_cxml, expected_cxml, removed):
+        paragraph = Paragraph(element(p_cxml), None)
+        text = paragraph.text
+
+        assert paragraph.normalize_runs() == removed
+
+        assert paragraph._p.xml == xml(expected_cxml)
+        assert paragraph.text == text
+
+    @pytest.mark.parametrize(
+        ('p_cxml', 'pattern', 'repl', 'regex', 'expected_cxml', 'count'), [
+            ('w:p/(w:r/w:t"foo",w:r/w:t"bar")', 'o', '0', False,
+             'w:p/(w:r/w:t"f00",w:r/w:t"bar")', 2),
+            ('w:p/(w:r/(w:rPr/w:b,w:t"{{na"),w:r/w:t"me}}",w:r/w:t"!")',
+             {'{{name}}': 'Ann'}, None, False,
+             'w:p/(w:r/(w:rPr/w:b,w:t"Ann"),w:r/w:t"!")', 1),
+            ('w:p/(w:r/w:t"a-b",w:r/(w:rPr/w:i,w:t"-c"))',
+             {'a': 'x', '-': '', 'c': 'yz'}, None, False,
+             'w:p/(w:r/w:t"xb",w:r/(w:rPr/w:i,w:t"yz"))', 4),
+            ('w:p/(w:r/w:t"ab12",w:r/w:t"3c")', r'(\d+)', r'[\1]', True,
+             'w:p/(w:r/w:t"ab[123]",w:r/w:t"c")', 1),
+            ('w:p/w:r/(w:t"a",w:tab,w:t"b")', 'a\tb', 'c\nd', False,
+             'w:p/w:r/(w:t"c",w:br,w:t"d")', 1),
+            ('w:p/(w:r/w:t"a",w:r/w:t"",w:r/(w:rPr/w:i,w:t"b"),w:r/w:t"c")',
+             'ab', 'x', False, 'w:p/(w:r/w:t"x",w:r/w:t"c")', 1),
+            ('w:p/w:hyperlink/w:r/w:t"foo"', 'o', 'x', False,
+             'w:p/w:hyperlink/w:r/w:t"foo"', 0),
+        ]
+    )
+    def it_can_replace_text_across_its_runs(
+        self, p_cxml, pattern, repl, regex, expected_cxml, count
+    ):
+        paragraph = Paragraph(element(p_cxml), None)
+        assert paragraph.replace(pattern, repl, regex) == count
+        assert paragraph._p.xml == xml(expected_cxml)
+
+    @pytest.mark.parametrize(('text', 'subs', 'expected_text'), [
+        ('xaab', [(r'(a)\1', 'D'), ('b', 'E')], 'xDE'),
+        ('foobar', [(r'(f)oo(?=bar)', r'[\1]'), ('z', 'y')], '[f]bar'),
+        ('a-b', [(r'(?<=-)b', 'c'), ('a', 'x')], 'x-c'),
+        ('FOO foo', [(r'(?i)foo', 'x'), ('q', 'y')], 'x x'),
+        ('abc', [('ab', '1'), ('a', '2'), ('bc', '3'), ('c', '4')], '14'),
+        ('abc', [('a', '2'), ('ab', '1'), ('x*', 'E')], '2bc'),
+    ])
+    def it_can_replace_many_regular_expressions_in_one_pass(
+        self, text, subs, expected_text
+    ):
+        paragraph = Paragraph(element('w:p/w:r/w:t"%s"' % text), None)
+        paragraph.replace(OrderedDict(subs), regex=True)
+        assert paragraph.text == expected_text
+
+    def it_can_replace_text_using_a_function(self):
+        paragraph = Paragraph(element('w:p/(w:r/w:t"a1b",w:r/w:t"22")'), None)
+        count = paragraph.replace(
+            r'\d+', lambda m: str(int(m.group()) * 2), regex=True
+        )
+        assert count == 2
+        assert paragraph.text == 'a2b44'
+
+    @pytest.mark.parametrize(('pattern', 'repl', 'exception'), [
+        ('', 'x', ValueError),
+        ({'a': 'x'}, 'y', TypeError),
+        ('a', None, TypeError),
+    ])
+    def it_raises_on_an_invalid_replacement(self, pattern, repl, exception):
+        paragraph = Paragraph(element('w:p/w:r/w:t"a"'), None)
+        with pytest.raises(exception):
+            paragraph.replace(pattern, repl)
+
     def it_can_replace_the_text_it_contains(self, text_set_fixture):
         paragraph, text, expected_text = text_set_fixture
         paragraph.text = text
@@ -59,19 +148,48 @@ class DescribeParagraph(object):
         paragraph.alignment = value
         assert paragraph._p.xml == expected_xml
 
+    def it_provides_access_to_its_effective_format(
+        self, part_prop_, document_part_, ParagraphFormat_, paragraph_format_
+    ):
+        p, new_p = element('w:p'), element('w:p/w:pPr/w:keepNext')
+        document_part_.new_effective_p.return_value = new_p
+        paragraph = Paragraph(p, None)
+
+        effective_format = paragraph.effective_format
+
+        document_part_.new_effective_p.assert_called_once_with(p)
+        ParagraphFormat_.assert_called_once_with(new_p)
+        assert effective_format is paragraph_format_
+
     def it_provides_access_to_its_paragraph_format(self, parfmt_fixture):
         paragraph, ParagraphFormat_, paragraph_format_ = parfmt_fixture
         paragraph_format = paragraph.paragraph_format
         ParagraphFormat_.assert_called_once_with(paragraph._element)
         assert paragraph_format is paragraph_format_
 
+    def it_can_format_the_runs_it_contains(self, request):
+        format_runs_ = function_mock(
+            request, 'docx.text.paragraph.format_runs'
+        )
+        paragraph = Paragraph(element('w:p/(w:r,w:r)'), None)
+
+        paragraph.set_run_formatting(bold=True, size=42)
+
+        runs, = format_runs_.call_args[0]
+        assert [run._r for run in runs] == paragraph._p.r_lst
+        assert format_runs_.call_args[1] == {'bold': True, 'size': 42}
+
     def it_provides_access_to_the_runs_it_contains(self, runs_fixture):
-        paragraph, Run_, r_, r_2_, run_, run_2_ = runs_fixture
+        paragraph, r_elms = runs_fixture
         runs = paragraph.runs
-        assert Run_.mock_calls == [
-            call(r_, paragraph), call(r_2_, paragraph)
-        ]
-        assert runs == [run_, run_2_]
+        assert len(runs) == len(r_elms)
+        assert [run._r for run in runs] == r_elms
+        for idx, run in enumerate(runs):
+            assert isinstance(run, Run)
+            assert run._parent is paragraph
+            assert runs[idx]._r is r_elms[idx]
+            assert runs[idx - len(r_elms)]._r is r_elms[idx]
+        assert [run._r for run in runs[1:]] == r_elms[1:]
 
     def it_can_add_a_run_to_itself(self, add_run_fixture):
         paragraph, text, style, style_prop_, expected_xml = add_run_fixture
@@ -184,11 +302,15 @@ class DescribeParagraph(object):
         paragraph = Paragraph(element('w:p'), None)
         return paragraph, ParagraphFormat_, paragraph_format_
 
-    @pytest.fixture
-    def runs_fixture(self, p_, Run_, r_, r_2_, runs_):
-        paragraph = Paragraph(p_, None)
-        run_, run_2_ = runs_
-        return paragraph, Run_, r_, r_2_, run_, run_2_
+    @pytest.fixture(params=[
+        'w:p',
+        'w:p/w:r',
+        'w:p/(w:pPr,w:r,w:hyperlink/w:r,w:r)',
+    ])
+    def runs_fixture(self, request):
+        p = element(request.param)
+        paragraph = Paragraph(p, None)
+        return paragraph, p.r_lst
 
     @pytest.fixture
     def style_get_fixture(self, part_prop_):
@@ -227,6 +349,9 @@ class DescribeParagraph(object):
         ('w:p/w:r/(w:t"foo", w:tab, w:t"bar")', 'foo\tbar'),
         ('w:p/w:r/(w:t"foo", w:br,  w:t"bar")', 'foo\nbar'),
         ('w:p/w:r/(w:t"foo", w:cr,  w:t"bar")', 'foo\nbar'),
+        ('w:p/(w:r/w:t"foo",w:r/(w:tab,w:t"bar"),w:r/w:br)', 'foo\tbar\n'),
+        ('w:p/(w:pPr/w:tabs/w:tab,w:hyperlink/w:r/w:t"foo",w:r/w:t"bar")',
+         'bar'),
     ])
     def text_get_fixture(self, request):
         p_cxml, expected_text_value = request.param
@@ -255,10 +380,6 @@ class DescribeParagraph(object):
     def _insert_paragraph_before_(self, request):
         return method_mock(request, Paragraph, '_insert_paragraph_before')
 
-    @pytest.fixture
-    def p_(self, request, r_, r_2_):
-        return instance_mock(request, CT_P, r_lst=(r_, r_2_))
-
     @pytest.fixture
     def ParagraphFormat_(self, request, paragraph_format_):
         return class_mock(
@@ -276,27 +397,6 @@ class DescribeParagraph(object):
             request, Paragraph, 'part', return_value=document_part_
         )
 
-    @pytest.fixture
-    def Run_(self, request, runs_):
-        run_, run_2_ = runs_
-        return class_mock(
-            request, 'docx.text.paragraph.Run', side_effect=[run_, run_2_]
-        )
-
-    @pytest.fixture
-    def r_(self, request):
-        return instance_mock(request, CT_R)
-
-    @pytest.fixture
-    def r_2_(self, request):
-        return instance_mock(request, CT_R)
-
     @pytest.fixture
     def run_style_prop_(self, request):
         return property_mock(request, Run, 'style')
-
-    @pytest.fixture
-    def runs_(self, request):
-        run_ = instance_mock(request, Run, name='run_')
-        run_2_ = instance_mock(request, Run, name='run_2_')
-        return run_, run_2_
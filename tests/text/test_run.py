@@ -4,12 +4,14 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.enum.dml import MSO_THEME_COLOR
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK, WD_UNDERLINE
 from docx.parts.document import DocumentPart
 from docx.shape import InlineShape
+from docx.shared import Pt, RGBColor
 from docx.text.font import Font
-from docx.text.run import Run
+from docx.text.run import Run, format_runs
 
 import pytest
 
@@ -59,6 +61,19 @@ class DescribeRun(object):
         with pytest.raises(ValueError):
             run.underline = underline
 
+    def it_provides_access_to_its_effective_font(
+        self, part_prop_, document_part_, Font_, font_
+    ):
+        r, new_r = element('w:r'), element('w:r/w:rPr/w:b')
+        document_part_.new_effective_r.return_value = new_r
+        run = Run(r, None)
+
+        font = run.effective_font
+
+        document_part_.new_effective_r.assert_called_once_with(r)
+        Font_.assert_called_once_with(new_r)
+        assert font is font_
+
     def it_provides_access_to_its_font(self, font_fixture):
         run, Font_, font_ = font_fixture
         font = run.font
@@ -254,6 +269,7 @@ class DescribeRun(object):
         ('w:r/w:t"foobar"', 'foobar'),
         ('w:r/(w:t"abc", w:tab, w:t"def", w:cr)', 'abc\tdef\n'),
         ('w:r/(w:br{w:type=page}, w:t"abc", w:t"def", w:tab)', '\nabcdef\t'),
+        ('w:r/(w:rPr/w:b, w:t, w:drawing, w:t"xyz")', 'xyz'),
     ])
     def text_get_fixture(self, request):
         r_cxml, expected_text = request.param
@@ -346,3 +362,42 @@ class DescribeRun(object):
     @pytest.fixture
     def Text_(self, request):
         return class_mock(request, 'docx.text.run._Text')
+
+
+class DescribeFormatRuns(object):
+
+    @pytest.mark.parametrize('props', [
+        {'bold': True, 'size': Pt(9), 'name': 'Foo', 'underline': False},
+        {'color': RGBColor(0x12, 0x34, 0x56), 'italic': False},
+        {'color': MSO_THEME_COLOR.ACCENT_1, 'highlight_color': None},
+        {'subscript': False, 'superscript': True, 'strike': None},
+        {'subscript': True, 'superscript': None},
+        {'superscript': True, 'subscript': None, 'size': Pt(9)},
+        {'superscript': True, 'bold': None, 'subscript': False},
+    ])
+    def it_formats_each_run_as_assigning_to_its_font_does(self, props):
+        p_cxml = (
+            'w:p/(w:r/w:t"a",w:r/(w:rPr/(w:rStyle{w:val=Foo},w:rFonts{w:cs=Ba'
+            'r},w:b{w:val=0},w:strike,w:color{w:val=FF0000},w:highlight{w:val'
+            '=yellow},w:vertAlign{w:val=subscript}),w:t"b"))'
+        )
+        p, expected_p = element(p_cxml), element(p_cxml)
+        for r in expected_p.r_lst:
+            font = Font(r)
+            for name, value in props.items():
+                if name != 'color':
+                    setattr(font, name, value)
+                elif isinstance(value, RGBColor):
+                    font.color.rgb = value
+                else:
+                    font.color.theme_color = value
+
+        format_runs([Run(r, None) for r in p.r_lst], **props)
+
+        assert p.xml == expected_p.xml
+
+    def it_raises_on_an_unknown_property(self):
+        r = element('w:r')
+        with pytest.raises(TypeError):
+            format_runs([Run(r, None)], bold=True, foo=42)
+        assert r.xml == xml('w:r')
@@ -175,6 +175,29 @@ class DescribeTabStops(object):
             del tab_stops[idx]
         assert exc.value.args[0] == 'tab index out of range'
 
+    @pytest.mark.parametrize('change', [
+        lambda tab_stops: tab_stops.add_tab_stop(Twips(42)),
+        lambda tab_stops: tab_stops.__delitem__(0),
+        lambda tab_stops: tab_stops.clear_all(),
+        lambda tab_stops: setattr(
+            tab_stops[0], 'alignment', WD_TAB_ALIGNMENT.RIGHT
+        ),
+        lambda tab_stops: setattr(tab_stops[0], 'leader', WD_TAB_LEADER.DOTS),
+        lambda tab_stops: setattr(tab_stops[0], 'position', Twips(24)),
+    ])
+    def it_bumps_the_styles_version_when_a_style_tab_stop_changes(
+        self, change
+    ):
+        styles = element(
+            'w:styles/w:style/w:pPr/w:tabs/w:tab{w:val=left,w:pos=12}'
+        )
+        tab_stops = TabStops(styles[0].pPr)
+        version = styles.styles_version
+
+        change(tab_stops)
+
+        assert styles.styles_version == version + 1
+
     def it_can_clear_all_its_tab_stops(self, clear_all_fixture):
         tab_stops, expected_xml = clear_all_fixture
         tab_stops.clear_all()